@@ -1,3 +1,4 @@
+import math
 from typing import TYPE_CHECKING, Any
 
 from arcade_core.schema import ToolDefinition
@@ -7,6 +8,7 @@ from rich.table import Table
 from rich.text import Text
 
 if TYPE_CHECKING:
+    from arcade_evals.cache import ResponseCache
     from arcade_evals.eval import EvaluationResult
 console = Console()
 
@@ -179,6 +181,8 @@ def display_eval_results(results: list[list[dict[str, Any]]], show_details: bool
                     console.print(_format_evaluation(evaluation))
                     console.print("-" * 80)
 
+    _display_eval_metrics(results)
+
     # Summary
     summary = (
         f"[bold]Summary -- [/bold]Total: {total_cases} -- [green]Passed: {total_passed}[/green]"
@@ -190,6 +194,48 @@ def display_eval_results(results: list[list[dict[str, Any]]], show_details: bool
     console.print(summary + "\n")
 
 
+def _display_eval_metrics(results: list[list[dict[str, Any]]]) -> None:
+    """
+    Display the p50 and p95 model request wall time and token usage of each suite and model.
+
+    Args:
+        results: List of dictionaries containing evaluation results for each model.
+    """
+    table = Table(title="Model requests (p50 / p95)", show_header=True, header_style="bold magenta")
+    table.add_column("Suite")
+    table.add_column("Model")
+    table.add_column("Cases", justify="right")
+    table.add_column("Wall time (ms)", justify="right")
+    table.add_column("Prompt tokens", justify="right")
+    table.add_column("Completion tokens", justify="right")
+
+    for eval_suite in results:
+        for model_results in eval_suite:
+            cases = model_results.get("cases", [])
+            metrics = [case.get("metrics") or {} for case in cases]
+            table.add_row(
+                model_results.get("suite", "Unknown Suite"),
+                model_results.get("model", "Unknown Model"),
+                str(len(cases)),
+                *(
+                    _format_percentiles([m.get(key) for m in metrics])
+                    for key in ("wall_time_ms", "prompt_tokens", "completion_tokens")
+                ),
+            )
+
+    if table.row_count:
+        console.print(table)
+
+
+def _format_percentiles(values: list[float | None]) -> str:
+    """Format the p50 and p95 of the values that are known, or '-' if there are none."""
+    known = sorted(value for value in values if value is not None)
+    if not known:
+        return "-"
+    p50, p95 = (known[max(math.ceil(q * len(known)), 1) - 1] for q in (0.5, 0.95))
+    return f"{p50:.0f} / {p95:.0f}"
+
+
 def _format_evaluation(evaluation: "EvaluationResult") -> str:
     """
     Format evaluation results with color-coded matches and scores.
@@ -251,3 +297,16 @@ def display_arcade_chat_header(base_url: str, stream: bool) -> None:
     if stream:
         chat_header.append(" (streaming)")
     console.print(chat_header)
+
+
+def display_response_cache_stats(response_cache: "ResponseCache | None") -> None:
+    """
+    Display how many model responses were replayed from the eval response cache.
+    """
+    if response_cache is None:
+        return
+    console.print(
+        f"Response cache ({response_cache.mode.value}): {response_cache.hits} hits, "
+        f"{response_cache.misses} misses in {response_cache.directory}",
+        style="dim",
+    )
@@ -0,0 +1,287 @@
+import asyncio
+import multiprocessing
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+from arcade_core.config_model import Config
+from rich.text import Text
+
+from arcade_cli.display import console, display_eval_results, display_response_cache_stats
+
+if TYPE_CHECKING:
+    from arcade_evals import RequestScheduler, ResponseCache, ResultsLog
+
+
+@dataclass
+class EvalShard:
+    """The evaluations one worker process runs, and its share of the run's limits."""
+
+    units: list[tuple[Path, str]]
+    """The (evaluation file, model) pairs to run."""
+    config: Config
+    base_url: str
+    max_concurrency: int
+    requests_per_minute: dict[str, int | None] = field(default_factory=dict)
+    tokens_per_minute: dict[str, int | None] = field(default_factory=dict)
+    max_retries: int = 5
+    cache_dir: str | None = None
+    cache_mode: str | None = None
+    results_file: str | None = None
+    """The run's results file, read for the cases recorded by the run being resumed."""
+    shard_results_file: str | None = None
+    """Where this shard records its cases, merged into `results_file` by the parent."""
+
+
+@dataclass
+class EvalShardResult:
+    results: list[list[dict[str, Any]]]
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+def shard_evaluations(
+    eval_files: list[Path],
+    models: list[str],
+    processes: int,
+    max_concurrency: int,
+    requests_per_minute: int | None,
+    tokens_per_minute: int | None,
+    response_cache: "ResponseCache | None" = None,
+    results_log: "ResultsLog | None" = None,
+    **options: Any,
+) -> list[EvalShard]:
+    """
+    Split the (evaluation file, model) pairs of a run across worker processes.
+
+    Pairs are dealt out round-robin. There are at most `max_concurrency` shards, and
+    they split `max_concurrency` between them, so that together they never exceed it.
+    Each model's per-minute limits are split evenly between the shards that run it.
+    Each shard records its cases in its own file next to the run's results file, as
+    processes appending to one file could interleave their lines.
+
+    Args:
+        eval_files: The evaluation files.
+        models: The models to evaluate.
+        processes: The number of worker processes.
+        max_concurrency: Maximum number of concurrent model requests for the whole run.
+        requests_per_minute: Requests per minute for each model, or None for unlimited.
+        tokens_per_minute: Tokens per minute for each model, or None for unlimited.
+        response_cache: The run's response cache, if any, which every shard reads and writes.
+        results_log: The run's results log, if any.
+        **options: Further EvalShard fields, the same for every shard.
+
+    Returns:
+        One shard per process, or fewer if there are fewer pairs than processes.
+    """
+    units = [(eval_file, model) for eval_file in eval_files for model in models]
+    processes = max(1, min(processes, len(units), max_concurrency))
+    unit_shards = [units[i::processes] for i in range(processes)]
+    concurrency, extra = divmod(max_concurrency, processes)
+
+    shards_per_model = Counter(model for shard in unit_shards for model in {m for _, m in shard})
+
+    def share(limit: int | None, model: str) -> int | None:
+        return None if limit is None else max(1, limit // shards_per_model[model])
+
+    def shard_results_file(index: int) -> str | None:
+        if results_log is None:
+            return None
+        path = results_log.path
+        return str(path.with_name(f"{path.stem}.shard{index}{path.suffix}"))
+
+    return [
+        EvalShard(
+            units=shard,
+            max_concurrency=max(1, concurrency + int(index < extra)),
+            requests_per_minute={m: share(requests_per_minute, m) for _, m in shard},
+            tokens_per_minute={m: share(tokens_per_minute, m) for _, m in shard},
+            cache_dir=str(response_cache.directory) if response_cache else None,
+            cache_mode=response_cache.mode.value if response_cache else None,
+            results_file=str(results_log.path) if results_log else None,
+            shard_results_file=shard_results_file(index),
+            **options,
+        )
+        for index, shard in enumerate(unit_shards)
+    ]
+
+
+def merge_shard_results(shards: list[EvalShard]) -> None:
+    """Append the cases recorded by each shard to the run's results file and remove its file."""
+    for shard in shards:
+        if shard.results_file is None or shard.shard_results_file is None:
+            continue
+        shard_path = Path(shard.shard_results_file)
+        if not shard_path.exists():
+            continue
+        with Path(shard.results_file).open("a", encoding="utf-8") as results:
+            results.write(shard_path.read_text(encoding="utf-8"))
+        shard_path.unlink()
+
+
+async def run_evaluations(
+    eval_suites: list[Callable],
+    models: list[str],
+    config: Config,
+    base_url: str,
+    max_concurrency: int,
+    response_cache: "ResponseCache | None" = None,
+    scheduler: "RequestScheduler | None" = None,
+    results_log: "ResultsLog | None" = None,
+    show_details: bool = False,
+) -> None:
+    """
+    Run every suite against every model on the current event loop, then display the results.
+
+    Args:
+        eval_suites: The `@tool_eval` functions to run.
+        models: The models to evaluate.
+        config: The Arcade configuration.
+        base_url: The Arcade Engine URL.
+        max_concurrency: Maximum number of concurrent evaluations in each suite.
+        response_cache: The run's response cache, if any.
+        scheduler: The scheduler shared by every suite and model.
+        results_log: The run's results log, if any.
+        show_details: Whether to show detailed results for each case.
+    """
+    from tqdm import tqdm
+
+    tasks = []
+    for suite_func in eval_suites:
+        console.print(
+            Text.assemble(
+                ("Running evaluations in ", "bold"),
+                (suite_func.__name__, "bold blue"),
+            )
+        )
+        for model in models:
+            task = asyncio.create_task(
+                suite_func(
+                    config=config,
+                    base_url=base_url,
+                    model=model,
+                    max_concurrency=max_concurrency,
+                    response_cache=response_cache,
+                    scheduler=scheduler,
+                    results_log=results_log,
+                )
+            )
+            tasks.append(task)
+
+    # Track progress and results as suite functions complete
+    with tqdm(total=len(tasks), desc="Evaluations Progress") as pbar:
+        results = []
+        for f in asyncio.as_completed(tasks):
+            results.append(await f)
+            pbar.update(1)
+
+    # TODO error handling on each eval
+    display_eval_results(results, show_details=show_details)
+    display_response_cache_stats(response_cache)
+
+
+def run_eval_shard(shard: EvalShard) -> EvalShardResult:
+    """Run a shard's evaluations on a new event loop. This is the worker process entry point."""
+    return asyncio.run(_run_eval_shard(shard))
+
+
+async def _run_eval_shard(shard: EvalShard) -> EvalShardResult:
+    from arcade_evals import ModelLimits, RequestScheduler, ResponseCache, ResultsLog
+
+    from arcade_cli.utils import load_eval_suites
+
+    response_cache = None
+    if shard.cache_mode is not None and shard.cache_dir is not None:
+        response_cache = ResponseCache(shard.cache_dir, mode=shard.cache_mode)
+    results_log = None
+    if shard.results_file and shard.shard_results_file:
+        results_log = ResultsLog(shard.shard_results_file, resume_from=shard.results_file)
+    scheduler = RequestScheduler(
+        max_concurrency=shard.max_concurrency,
+        limits={
+            model: ModelLimits(
+                requests_per_minute=shard.requests_per_minute.get(model),
+                tokens_per_minute=shard.tokens_per_minute.get(model),
+            )
+            for _, model in shard.units
+        },
+        max_retries=shard.max_retries,
+    )
+
+    suites_by_file: dict[Path, list] = {}
+    tasks = []
+    for eval_file, model in shard.units:
+        if eval_file not in suites_by_file:
+            suites_by_file[eval_file] = load_eval_suites([eval_file])
+        for suite_func in suites_by_file[eval_file]:
+            tasks.append(
+                suite_func(
+                    config=shard.config,
+                    base_url=shard.base_url,
+                    model=model,
+                    max_concurrency=shard.max_concurrency,
+                    response_cache=response_cache,
+                    scheduler=scheduler,
+                    results_log=results_log,
+                )
+            )
+    results = await asyncio.gather(*tasks)
+
+    return EvalShardResult(
+        results=list(results),
+        cache_hits=response_cache.hits if response_cache else 0,
+        cache_misses=response_cache.misses if response_cache else 0,
+    )
+
+
+def run_eval_shards(shards: list[EvalShard]) -> Iterator[tuple[EvalShard, EvalShardResult]]:
+    """
+    Run each shard in its own worker process, yielding shards and their results as they finish.
+
+    Workers are spawned rather than forked, so that they don't inherit the parent's
+    threads or event loop.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as executor:
+        futures = {executor.submit(run_eval_shard, shard): shard for shard in shards}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def run_evaluations_in_processes(
+    shards: list[EvalShard],
+    response_cache: "ResponseCache | None" = None,
+    show_details: bool = False,
+) -> None:
+    """
+    Run the shards in worker processes, then display their merged results.
+
+    The cases the shards recorded are merged into the run's results file, even if the
+    run is interrupted.
+
+    Args:
+        shards: The shards from `shard_evaluations`.
+        response_cache: The run's response cache, if any. Its hit and miss counts
+            are updated with those of the workers.
+        show_details: Whether to show detailed results for each case.
+    """
+    from tqdm import tqdm
+
+    all_evaluations: list[list[dict[str, Any]]] = []
+    total = sum(len(shard.units) for shard in shards)
+    try:
+        with tqdm(total=total, desc="Evaluations Progress") as pbar:
+            for shard, result in run_eval_shards(shards):
+                all_evaluations.extend(result.results)
+                if response_cache is not None:
+                    response_cache.hits += result.cache_hits
+                    response_cache.misses += result.cache_misses
+                pbar.update(len(shard.units))
+    finally:
+        merge_shard_results(shards)
+
+    display_eval_results(all_evaluations, show_details=show_details)
+    display_response_cache_stats(response_cache)
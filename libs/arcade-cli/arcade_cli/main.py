@@ -7,18 +7,12 @@ import webbrowser
 from pathlib import Path
 from typing import Any, Optional
 
-import httpx
 import typer
-from arcadepy import Arcade
-from arcadepy.types import AuthorizationResponse
-from openai import OpenAI, OpenAIError
 from rich.console import Console
 from rich.markup import escape
 from rich.text import Text
-from tqdm import tqdm
 
 import arcade_cli.worker as worker
-from arcade_cli import toolkit_docs
 from arcade_cli.authn import LocalAuthCallbackServer, check_existing_login
 from arcade_cli.constants import (
     CREDENTIALS_FILE_PATH,
@@ -26,18 +20,19 @@ from arcade_cli.constants import (
     PROD_CLOUD_HOST,
     PROD_ENGINE_HOST,
 )
-from arcade_cli.deployment import Deployment
 from arcade_cli.display import (
     display_arcade_chat_header,
-    display_eval_results,
     display_tool_messages,
 )
 from arcade_cli.show import show_logic
 from arcade_cli.utils import (
+    EvalCacheMode,
+    MCPTransport,
     OrderCommands,
     compute_base_url,
     compute_login_url,
     get_eval_files,
+    get_eval_results_path,
     get_today_context,
     get_user_input,
     handle_chat_interaction,
@@ -278,6 +273,10 @@ def chat(
             style="dim",
         )
 
+    from arcadepy import Arcade
+    from arcadepy.types import AuthorizationResponse
+    from openai import OpenAI, OpenAIError
+
     config = validate_and_get_config()
     base_url = compute_base_url(force_tls, force_no_tls, host, port)
 
@@ -365,11 +364,34 @@ def chat(
 def evals(
     directory: str = typer.Argument(".", help="Directory containing evaluation files"),
     show_details: bool = typer.Option(False, "--details", "-d", help="Show detailed results"),
-    max_concurrent: int = typer.Option(
-        1,
+    max_concurrent: Optional[int] = typer.Option(
+        None,
         "--max-concurrent",
         "-c",
-        help="Maximum number of concurrent evaluations (default: 1)",
+        min=1,
+        help="Maximum number of concurrent model requests, across all suites and models (default: 1, or the number of --processes).",
+    ),
+    requests_per_minute: Optional[int] = typer.Option(
+        None,
+        "--rpm",
+        help="Maximum requests per minute sent to each model (default: unlimited).",
+    ),
+    tokens_per_minute: Optional[int] = typer.Option(
+        None,
+        "--tpm",
+        help="Maximum tokens per minute used by each model (default: unlimited).",
+    ),
+    max_retries: int = typer.Option(
+        5,
+        "--max-retries",
+        min=0,
+        help="How many times a rate-limited or failed model request is retried, with backoff.",
+    ),
+    processes: int = typer.Option(
+        1,
+        "--processes",
+        min=1,
+        help="Number of worker processes to split the evaluation files and models across (at most --max-concurrent). The concurrency and rate limits are shared between them.",
     ),
     models: str = typer.Option(
         "gpt-4o",
@@ -404,6 +426,26 @@ def evals(
         "--no-tls",
         help="Whether to disable TLS for the connection to the Arcade Engine.",
     ),
+    cache: Optional[EvalCacheMode] = typer.Option(
+        None,
+        "--cache",
+        help="Cache model responses on disk: 'record' replays cached responses and records the rest, 'replay' only uses cached responses (no model calls), 'refresh' calls the model and replaces cached responses.",
+    ),
+    cache_dir: Optional[str] = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for cached model responses (default: .eval_cache in the evaluation directory).",
+    ),
+    results_file: Optional[str] = typer.Option(
+        None,
+        "--results-file",
+        help="JSONL file each case's result is written to as soon as it completes (default with --resume: .eval_results.jsonl in the evaluation directory). Without this option or --resume, no results file is written.",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Skip the model calls of cases already in the results file, e.g. after an interrupted run.",
+    ),
     debug: bool = typer.Option(False, "--debug", help="Show debug information"),
 ) -> None:
     """
@@ -424,6 +466,15 @@ def evals(
         install_command=r"pip install arcade-tdk",
     )
 
+    from arcade_evals import ModelLimits, RequestScheduler, ResponseCache, ResultsLog
+    from arcadepy import Arcade
+
+    from arcade_cli.eval_runner import (
+        run_evaluations,
+        run_evaluations_in_processes,
+        shard_evaluations,
+    )
+
     config = validate_and_get_config()
 
     host = PROD_ENGINE_HOST if cloud else host
@@ -446,6 +497,45 @@ def evals(
     with Arcade(api_key=config.api.key, base_url=base_url) as client:
         log_engine_health(client)
 
+    response_cache = None
+    if cache is not None:
+        response_cache = ResponseCache(
+            cache_dir or os.path.join(directory, ".eval_cache"), mode=cache.value
+        )
+
+    results_log = None
+    if results_file is not None or resume:
+        results_log = ResultsLog(results_file or get_eval_results_path(directory), resume=resume)
+
+    max_concurrent = max_concurrent or processes
+
+    if processes > 1:
+        shards = shard_evaluations(
+            eval_files,
+            models_list,
+            processes,
+            max_concurrent,
+            requests_per_minute,
+            tokens_per_minute,
+            response_cache=response_cache,
+            results_log=results_log,
+            config=config,
+            base_url=base_url,
+            max_retries=max_retries,
+        )
+        if len(shards) < processes:
+            console.print(
+                f"Running {len(shards)} worker processes instead of {processes}: there is at "
+                "most one per concurrent request (--max-concurrent) and one per evaluation "
+                "file and model.",
+                style="bold yellow",
+            )
+        try:
+            run_evaluations_in_processes(shards, response_cache, show_details=show_details)
+        except Exception as e:
+            handle_cli_error("Failed to run evaluations", e, debug)
+        return
+
     # Use the new function to load eval suites
     eval_suites = load_eval_suites(eval_files)
 
@@ -460,40 +550,29 @@ def evals(
             style="bold",
         )
 
-    async def run_evaluations() -> None:
-        all_evaluations = []
-        tasks = []
-        for suite_func in eval_suites:
-            console.print(
-                Text.assemble(
-                    ("Running evaluations in ", "bold"),
-                    (suite_func.__name__, "bold blue"),
-                )
-            )
-            for model in models_list:
-                task = asyncio.create_task(
-                    suite_func(
-                        config=config,
-                        base_url=base_url,
-                        model=model,
-                        max_concurrency=max_concurrent,
-                    )
-                )
-                tasks.append(task)
-
-        # Track progress and results as suite functions complete
-        with tqdm(total=len(tasks), desc="Evaluations Progress") as pbar:
-            results = []
-            for f in asyncio.as_completed(tasks):
-                results.append(await f)
-                pbar.update(1)
-
-        # TODO error handling on each eval
-        all_evaluations.extend(results)
-        display_eval_results(all_evaluations, show_details=show_details)
+    # Shared by every suite and model, so that limits apply to the whole run
+    scheduler = RequestScheduler(
+        max_concurrency=max_concurrent,
+        limits=ModelLimits(
+            requests_per_minute=requests_per_minute, tokens_per_minute=tokens_per_minute
+        ),
+        max_retries=max_retries,
+    )
 
     try:
-        asyncio.run(run_evaluations())
+        asyncio.run(
+            run_evaluations(
+                eval_suites,
+                models_list,
+                config=config,
+                base_url=base_url,
+                max_concurrency=max_concurrent,
+                response_cache=response_cache,
+                scheduler=scheduler,
+                results_log=results_log,
+                show_details=show_details,
+            )
+        )
     except Exception as e:
         handle_cli_error("Failed to run evaluations", e, debug)
 
@@ -523,6 +602,12 @@ def serve(
     mcp: bool = typer.Option(
         False, "--mcp", help="Run as a local MCP server over stdio", show_default=True
     ),
+    transport: MCPTransport = typer.Option(
+        MCPTransport.STDIO,
+        "--transport",
+        help="With --mcp, serve over stdio (one client) or HTTP (many clients sharing one process, on --host and --port).",
+        show_default=True,
+    ),
     debug: bool = typer.Option(False, "--debug", "-d", help="Show debug information"),
     reload: bool = typer.Option(
         False,
@@ -530,6 +615,17 @@ def serve(
         help="Enable auto-reloading when toolkit or server files change.",
         show_default=True,
     ),
+    profile_startup: bool = typer.Option(
+        False,
+        "--profile-startup",
+        help="Profile import, toolkit discovery and catalog build times, print a breakdown and exit without serving.",
+        show_default=True,
+    ),
+    profile_output: Optional[str] = typer.Option(
+        None,
+        "--profile-output",
+        help="With --profile-startup, write a Chrome trace file (also readable by speedscope) to this path.",
+    ),
 ) -> None:
     """
     Start a local Arcade Worker server.
@@ -540,6 +636,15 @@ def serve(
         install_command=r"pip install 'arcade-serve'",
     )
 
+    if profile_startup:
+        from arcade_cli.startup_profile import profile_startup as run_startup_profile
+
+        try:
+            run_startup_profile(mcp=mcp, transport=transport.value, output=profile_output)
+        except Exception as e:
+            handle_cli_error("Failed to profile startup", e, debug)
+        return
+
     from arcade_cli.serve import serve_default_worker
 
     try:
@@ -550,6 +655,7 @@ def serve(
             enable_otel=otel_enable,
             debug=debug,
             mcp=mcp,
+            mcp_transport=transport.value,
             reload=reload,
         )
     except KeyboardInterrupt:
@@ -653,6 +759,10 @@ def deploy(
     """
     Deploy a worker to Arcade Cloud.
     """
+    import httpx
+    from arcadepy import Arcade
+
+    from arcade_cli.deployment import Deployment
 
     config = validate_and_get_config()
     engine_url = compute_base_url(force_tls, force_no_tls, host, port)
@@ -715,6 +825,8 @@ def dashboard(
 
     The Dashboard is a web-based Arcade user interface that is served by the Arcade Engine.
     """
+    from arcadepy import Arcade
+
     try:
         if local:
             host = "localhost"
@@ -791,6 +903,8 @@ def generate_toolkit_docs(
     ),
     debug: bool = typer.Option(False, "--debug", "-d", help="Show debug information"),
 ) -> None:
+    from arcade_cli import toolkit_docs
+
     toolkit_docs.generate_toolkit_docs(
         console=console,
         toolkit_name=toolkit_name,
@@ -7,17 +7,9 @@ from contextlib import asynccontextmanager
 from functools import partial
 from importlib.metadata import version as get_pkg_version
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import fastapi
-import uvicorn
-
-# Watchfiles is used under the hood by Uvicorn's reload feature.
-# Importing watchfiles here is an explicit acknowledgement that it needs to be installed
-import watchfiles  # noqa: F401
-from arcade_core.telemetry import OTELHandler
 from arcade_core.toolkit import Toolkit, get_package_directory
-from arcade_serve.fastapi.worker import FastAPIWorker
 from loguru import logger
 from rich.console import Console
 
@@ -26,13 +18,24 @@ from arcade_cli.utils import (
     build_tool_catalog,
     discover_toolkits,
     load_dotenv,
+    require_dependency,
 )
 
+if TYPE_CHECKING:
+    # FastAPI, Uvicorn and OpenTelemetry are only needed by the HTTP worker, so they
+    # are imported where the worker is built rather than when this module is loaded.
+    import fastapi
+    from arcade_core.telemetry import OTELHandler
+
 console = Console(width=70, color_system="auto")
 
 
 # App factory for Uvicorn reload
-def create_arcade_app() -> fastapi.FastAPI:
+def create_arcade_app() -> "fastapi.FastAPI":
+    import fastapi
+    from arcade_core.telemetry import OTELHandler
+    from arcade_serve.fastapi.worker import FastAPIWorker
+
     # TODO: Find a better way to pass these configs to factory used for reload
     debug_mode = os.environ.get("ARCADE_WORKER_SECRET", "dev") == "dev"
     otel_enabled = os.environ.get("ARCADE_OTEL_ENABLE", "False").lower() == "true"
@@ -88,14 +91,8 @@ def create_arcade_app() -> fastapi.FastAPI:
     return app
 
 
-def _run_mcp_stdio(
-    toolkits: list[Toolkit], *, logging_enabled: bool, env_file: str | None = None
-) -> None:
-    """Launch an MCP stdio server; blocks until it exits."""
-
-    from arcade_serve.mcp.stdio import StdioServer
-
-    # Load env vars before launching server (explicit path, config path, cwd)
+def _load_mcp_env(env_file: str | None) -> None:
+    """Load env vars for an MCP server (explicit path, config path, cwd)."""
     if env_file:
         load_dotenv(env_file, override=False)
     else:
@@ -104,6 +101,17 @@ def _run_mcp_stdio(
                 load_dotenv(candidate, override=False)
                 break
 
+
+def _run_mcp_stdio(
+    toolkits: list[Toolkit], *, logging_enabled: bool, env_file: str | None = None
+) -> None:
+    """Launch an MCP stdio server; blocks until it exits."""
+
+    from arcade_serve.mcp.stdio import StdioServer
+
+    # Load env vars before launching server
+    _load_mcp_env(env_file)
+
     # Set up middleware configuration for stdio mode
     middleware_config = {
         "stdio_mode": True,  # Ensure logs go to stderr
@@ -129,6 +137,64 @@ def _run_mcp_stdio(
         logger.remove()
 
 
+def _run_mcp_http(
+    toolkits: list[Toolkit],
+    *,
+    host: str,
+    port: int,
+    logging_enabled: bool,
+    disable_auth: bool = False,
+    timeout_keep_alive: int = 5,
+    env_file: str | None = None,
+) -> None:
+    """
+    Launch an MCP server over HTTP that serves many clients; blocks until it exits.
+
+    Unless `disable_auth` is set, ARCADE_WORKER_SECRET must be set in the environment,
+    and requests must carry it as a bearer token.
+    """
+    import fastapi
+    import uvicorn
+    from arcade_serve.mcp.http import HTTPServer
+
+    _load_mcp_env(env_file)
+
+    # One catalog for every client session
+    catalog = build_tool_catalog(toolkits)
+    server = HTTPServer(
+        catalog,
+        enable_logging=logging_enabled,
+        secret=os.environ.get("ARCADE_WORKER_SECRET"),
+        disable_auth=disable_auth,
+    )
+
+    @asynccontextmanager
+    async def mcp_lifespan(app: fastapi.FastAPI) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            await server.shutdown()
+
+    app = fastapi.FastAPI(
+        title="Arcade MCP Server",
+        docs_url=None,
+        redoc_url=None,
+        openapi_url=None,
+        lifespan=mcp_lifespan,
+    )
+    server.mount(app)
+
+    logger.info(f"Serving MCP over HTTP at http://{host}:{port}/mcp (SSE: /sse)")
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        log_config=None,
+        lifespan="on",
+        timeout_keep_alive=timeout_keep_alive,
+    )
+
+
 def _run_fastapi_server(
     host: str,
     port: int,
@@ -138,10 +204,18 @@ def _run_fastapi_server(
     toolkits_for_reload_dirs: list[Toolkit] | None,
     debug_flag: bool,
 ) -> None:
+    import uvicorn
+
     app_import_string = "arcade_cli.serve:create_arcade_app"
     reload_dirs_str_list: list[str] | None = None
 
     if reload:
+        # Watchfiles is used under the hood by Uvicorn's reload feature.
+        require_dependency(
+            package_name="watchfiles",
+            command_name="serve --reload",
+            install_command="pip install watchfiles",
+        )
         current_reload_dirs_paths = []
         if toolkits_for_reload_dirs:
             for tk in toolkits_for_reload_dirs:
@@ -233,7 +307,7 @@ def setup_logging(log_level: int = logging.INFO, mcp_mode: bool = False) -> None
 
 @asynccontextmanager
 async def lifespan(
-    app: fastapi.FastAPI, otel_handler: OTELHandler | None = None, enable_otel: bool = False
+    app: "fastapi.FastAPI", otel_handler: "OTELHandler | None" = None, enable_otel: bool = False
 ) -> AsyncGenerator[None, None]:
     try:
         logger.debug(f"Server lifespan startup. OTEL enabled: {enable_otel}")
@@ -259,12 +333,30 @@ def serve_default_worker(
     enable_otel: bool = False,
     debug: bool = False,
     mcp: bool = False,
+    mcp_transport: str = "stdio",
     reload: bool = False,
     **kwargs: Any,
 ) -> None:
     # Initial logging setup for the main `arcade serve` process itself.
     # The Uvicorn worker processes will call setup_logging() again via create_arcade_app().
-    setup_logging(log_level=logging.DEBUG if debug else logging.INFO, mcp_mode=mcp)
+    # Only the stdio transport needs stdout kept free of logs
+    setup_logging(
+        log_level=logging.DEBUG if debug else logging.INFO,
+        mcp_mode=mcp and mcp_transport == "stdio",
+    )
+
+    if mcp and mcp_transport == "http":
+        logger.info("MCP mode selected, over HTTP.")
+        _run_mcp_http(
+            discover_toolkits(),
+            host=host,
+            port=port,
+            logging_enabled=not debug,
+            disable_auth=disable_auth,
+            timeout_keep_alive=timeout_keep_alive,
+            env_file=kwargs.pop("env_file", None),
+        )
+        return
 
     if mcp:
         logger.info("MCP mode selected.")
@@ -0,0 +1,336 @@
+import importlib
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from arcade_core.catalog import ToolCatalog
+from arcade_core.toolkit import Toolkit
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+
+@dataclass
+class Span:
+    """
+    A timed region of startup: a phase (e.g. toolkit discovery) or a single module import.
+
+    Attributes:
+        name: The phase name or the imported module name.
+        category: "phase", "toolkit" or "import".
+        start: Start time in seconds, relative to when profiling started.
+        duration: Inclusive duration in seconds.
+        self_time: Duration minus the duration of nested imports (imports only).
+        thread_id: The thread the span was recorded on.
+        args: Extra details exported with the trace event.
+    """
+
+    name: str
+    category: str
+    start: float
+    duration: float = 0.0
+    self_time: float = 0.0
+    thread_id: int = 0
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class _ImportTimingFinder(MetaPathFinder):
+    """
+    A meta path finder that finds nothing itself, but times the module
+    execution of every spec found by the finders that follow it.
+    """
+
+    def __init__(self, profiler: "StartupProfiler") -> None:
+        self.profiler = profiler
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                self._wrap_loader(spec)
+                return spec
+        return None
+
+    def _wrap_loader(self, spec: ModuleSpec) -> None:
+        loader = spec.loader
+        # Built-in and frozen modules use their loader class directly; patching it would
+        # affect every module it loads, and they are cheap to import anyway.
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return
+
+        exec_module = loader.exec_module
+        profiler = self.profiler
+
+        def timed_exec_module(module: ModuleType) -> None:
+            # One-shot: restore the loader's own method before running it
+            with suppress(AttributeError):
+                del loader.exec_module
+            with profiler.span(spec.name, "import"):
+                exec_module(module)
+
+        try:
+            loader.exec_module = timed_exec_module  # type: ignore[method-assign]
+        except (AttributeError, TypeError):
+            # Loaders with __slots__ or read-only attributes can't be timed
+            return
+
+
+class StartupProfiler:
+    """
+    Records how long startup takes, per phase, per toolkit and per imported module.
+
+    Module imports are timed with a meta path hook while the profiler is running,
+    so only modules imported for the first time are recorded.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter()
+        self._finder = _ImportTimingFinder(self)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start timing module imports."""
+        self._origin = time.perf_counter()
+        if self._finder not in sys.meta_path:
+            sys.meta_path.insert(0, self._finder)
+        importlib.invalidate_caches()
+
+    def stop(self) -> None:
+        """Stop timing module imports."""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    def _stack(self) -> list[Span]:
+        stack: list[Span] | None = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase", **args: Any) -> Iterator[Span]:
+        """Time the enclosed block as a span."""
+        stack = self._stack()
+        span = Span(
+            name=name,
+            category=category,
+            start=time.perf_counter() - self._origin,
+            thread_id=threading.get_ident(),
+            args=args,
+        )
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            stack.pop()
+            span.duration = time.perf_counter() - self._origin - span.start
+            if category == "import":
+                span.self_time += span.duration
+                # Nested imports are excluded from the parent import's self time
+                parent = next((s for s in reversed(stack) if s.category == "import"), None)
+                if parent is not None:
+                    parent.self_time -= span.duration
+            with self._lock:
+                self.spans.append(span)
+
+    def phase(self, name: str, **args: Any) -> Any:
+        """Time a startup phase, such as toolkit discovery."""
+        return self.span(name, "phase", **args)
+
+    def build_catalog(self, toolkits: list[Toolkit]) -> ToolCatalog:
+        """Build a ToolCatalog, timing each toolkit separately."""
+        catalog = ToolCatalog()
+        with self.phase("Build catalog"):
+            for toolkit in toolkits:
+                with self.span(toolkit.name, "toolkit", package=toolkit.package_name) as span:
+                    tool_count = len(catalog)
+                    catalog.add_toolkit(toolkit)
+                    span.args["tools"] = len(catalog) - tool_count
+        return catalog
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def spans_by_category(self, category: str) -> list[Span]:
+        return [span for span in self.spans if span.category == category]
+
+    def import_time_by_package(self) -> dict[str, float]:
+        """Total import self time per top-level package (e.g. 'googleapiclient')."""
+        totals: dict[str, float] = defaultdict(float)
+        for span in self.spans_by_category("import"):
+            totals[span.name.split(".", 1)[0]] += span.self_time
+        return dict(totals)
+
+    def import_time_by_toolkit(self) -> dict[str, float]:
+        """Time spent importing modules while each toolkit was being added to the catalog."""
+        totals: dict[str, float] = {}
+        imports = self.spans_by_category("import")
+        for toolkit in self.spans_by_category("toolkit"):
+            end = toolkit.start + toolkit.duration
+            totals[toolkit.name] = sum(
+                span.self_time
+                for span in imports
+                if span.thread_id == toolkit.thread_id and toolkit.start <= span.start < end
+            )
+        return totals
+
+    def print_report(self, top: int = 20) -> None:
+        """Print a sorted breakdown of the recorded startup time."""
+        phases = Table(title="Startup phases", show_header=True, header_style="bold magenta")
+        phases.add_column("Phase")
+        phases.add_column("Time (ms)", justify="right")
+        for span in self.spans_by_category("phase"):
+            phases.add_row(span.name, f"{span.duration * 1000:.1f}")
+        console.print(phases)
+
+        toolkit_imports = self.import_time_by_toolkit()
+        toolkits = Table(
+            title="Toolkits (slowest first)", show_header=True, header_style="bold magenta"
+        )
+        toolkits.add_column("Toolkit")
+        toolkits.add_column("Package")
+        toolkits.add_column("Tools", justify="right")
+        toolkits.add_column("Total (ms)", justify="right")
+        toolkits.add_column("Imports (ms)", justify="right")
+        for span in sorted(self.spans_by_category("toolkit"), key=lambda s: -s.duration):
+            toolkits.add_row(
+                span.name,
+                str(span.args.get("package", "")),
+                str(span.args.get("tools", "")),
+                f"{span.duration * 1000:.1f}",
+                f"{toolkit_imports.get(span.name, 0.0) * 1000:.1f}",
+            )
+        console.print(toolkits)
+
+        packages = Table(
+            title=f"Top {top} packages by import time",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        packages.add_column("Package")
+        packages.add_column("Self time (ms)", justify="right")
+        by_package = sorted(self.import_time_by_package().items(), key=lambda item: -item[1])
+        for package, seconds in by_package[:top]:
+            packages.add_row(package, f"{seconds * 1000:.1f}")
+        console.print(packages)
+
+        modules = Table(
+            title=f"Top {top} modules by import time",
+            show_header=True,
+            header_style="bold magenta",
+        )
+        modules.add_column("Module")
+        modules.add_column("Self (ms)", justify="right")
+        modules.add_column("Cumulative (ms)", justify="right")
+        imports = sorted(self.spans_by_category("import"), key=lambda s: -s.self_time)
+        for span in imports[:top]:
+            modules.add_row(
+                span.name, f"{span.self_time * 1000:.1f}", f"{span.duration * 1000:.1f}"
+            )
+        console.print(modules)
+
+        console.print(
+            "To skip slow toolkits, list their names in the ARCADE_DISABLED_TOOLKITS "
+            "environment variable (comma-separated).",
+            style="dim",
+        )
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Export the spans in the Chrome trace event format.
+
+        The file can be opened in chrome://tracing, Perfetto or speedscope.
+        """
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": round(span.start * 1_000_000, 3),
+                "dur": round(span.duration * 1_000_000, 3),
+                "pid": 1,
+                "tid": span.thread_id,
+                "args": span.args,
+            }
+            for span in sorted(self.spans, key=lambda s: (s.start, -s.duration))
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | Path) -> None:
+        """Write the recorded spans to *path* as a Chrome trace JSON file."""
+        Path(path).write_text(json.dumps(self.to_chrome_trace()))
+
+
+def server_modules(mcp: bool = False, transport: str = "stdio") -> list[str]:
+    """
+    The modules `arcade serve` imports to start a server, before discovering toolkits.
+
+    `arcade_cli.serve` imports its server dependencies lazily, so they are listed
+    explicitly.
+    """
+    if not mcp:
+        return [
+            "arcade_cli.serve",
+            "fastapi",
+            "uvicorn",
+            "arcade_serve.fastapi.worker",
+            "arcade_core.telemetry",
+        ]
+    if transport == "http":
+        return ["arcade_cli.serve", "fastapi", "uvicorn", "arcade_serve.mcp.http"]
+    return ["arcade_cli.serve", "arcade_serve.mcp.stdio"]
+
+
+def profile_startup(
+    mcp: bool = False, transport: str = "stdio", output: str | None = None, top: int = 20
+) -> None:
+    """
+    Run the startup steps of `arcade serve` under the profiler, print the
+    breakdown and optionally export a trace file. The server is not started.
+
+    Args:
+        mcp: Profile the MCP server's startup instead of the HTTP worker's.
+        transport: With `mcp`, the MCP transport ("stdio" or "http").
+        output: Path of a Chrome trace file to write, if any.
+        top: Number of packages and modules to list.
+    """
+    profiler = StartupProfiler()
+    profiler.start()
+    try:
+        with profiler.phase("Import server modules"):
+            for module in server_modules(mcp, transport):
+                importlib.import_module(module)
+
+        from arcade_cli.utils import discover_toolkits
+
+        with profiler.phase("Discover toolkits"):
+            toolkits = discover_toolkits()
+
+        profiler.build_catalog(toolkits)
+    finally:
+        profiler.stop()
+
+    profiler.print_report(top=top)
+    if output:
+        profiler.export_chrome_trace(output)
+        console.print(f"Startup trace written to {output}", style="bold green")
@@ -9,7 +9,7 @@ from enum import Enum
 from importlib import metadata
 from pathlib import Path
 from textwrap import dedent
-from typing import Any, Callable, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Union, cast
 from urllib.parse import urlencode, urlparse
 
 import idna
@@ -18,12 +18,6 @@ from arcade_core import ToolCatalog, Toolkit
 from arcade_core.config_model import Config
 from arcade_core.errors import ToolkitLoadError
 from arcade_core.schema import ToolDefinition
-from arcadepy import NOT_GIVEN, APIConnectionError, APIStatusError, APITimeoutError, Arcade
-from arcadepy.types import AuthorizationResponse
-from openai import OpenAI, Stream
-from openai.types.chat.chat_completion import Choice as ChatCompletionChoice
-from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
-from openai.types.chat.chat_completion_chunk import Choice as ChatCompletionChunkChoice
 from pydantic import ValidationError
 from rich.console import Console
 from rich.live import Live
@@ -34,6 +28,16 @@ from typer.models import Context
 
 from arcade_cli.constants import LOCAL_AUTH_CALLBACK_PORT, LOCALHOST
 
+if TYPE_CHECKING:
+    # The Arcade and OpenAI clients are slow to import, so they are only imported
+    # inside the commands that use them.
+    from arcadepy import Arcade
+    from arcadepy.types import AuthorizationResponse
+    from openai import OpenAI, Stream
+    from openai.types.chat.chat_completion import Choice as ChatCompletionChoice
+    from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
+    from openai.types.chat.chat_completion_chunk import Choice as ChatCompletionChunkChoice
+
 console = Console()
 
 
@@ -48,6 +52,17 @@ class OrderCommands(TyperGroup):
         return list(self.commands)  # get commands using self.commands
 
 
+class MCPTransport(str, Enum):
+    STDIO = "stdio"
+    HTTP = "http"
+
+
+class EvalCacheMode(str, Enum):
+    RECORD = "record"
+    REPLAY = "replay"
+    REFRESH = "refresh"
+
+
 class ChatCommand(str, Enum):
     HELP = "/help"
     HELP_ALT = "/?"
@@ -216,6 +231,8 @@ def get_tools_from_engine(
     force_no_tls: bool = False,
     toolkit: str | None = None,
 ) -> list[ToolDefinition]:
+    from arcadepy import NOT_GIVEN, APIConnectionError, Arcade
+
     config = validate_and_get_config()
     base_url = compute_base_url(force_tls, force_no_tls, host, port)
     client = Arcade(api_key=config.api.key, base_url=base_url)
@@ -251,7 +268,7 @@ class StreamingResult:
     tool_authorization: dict | None
 
 
-def handle_streaming_content(stream: Stream[ChatCompletionChunk], model: str) -> StreamingResult:
+def handle_streaming_content(stream: "Stream[ChatCompletionChunk]", model: str) -> StreamingResult:
     """
     Display the streamed markdown chunks as a single line.
     """
@@ -333,7 +350,9 @@ def validate_and_get_config(
     return config
 
 
-def log_engine_health(client: Arcade) -> None:
+def log_engine_health(client: "Arcade") -> None:
+    from arcadepy import APIConnectionError, APIStatusError
+
     try:
         result = client.health.check(timeout=2)
         if result.healthy:
@@ -371,7 +390,7 @@ class ChatInteractionResult:
 
 
 def handle_chat_interaction(
-    client: OpenAI, model: str, history: list[dict], user_email: str | None, stream: bool = False
+    client: "OpenAI", model: str, history: list[dict], user_email: str | None, stream: bool = False
 ) -> ChatInteractionResult:
     """
     Handle a single chat-request/chat-response interaction for both streamed and non-streamed responses.
@@ -430,10 +449,10 @@ def handle_chat_interaction(
 
 
 def handle_tool_authorization(
-    arcade_client: Arcade,
-    tool_authorization: AuthorizationResponse,
+    arcade_client: "Arcade",
+    tool_authorization: "AuthorizationResponse",
     history: list[dict[str, Any]],
-    openai_client: OpenAI,
+    openai_client: "OpenAI",
     model: str,
     user_email: str | None,
     stream: bool,
@@ -459,7 +478,7 @@ def handle_tool_authorization(
 
 
 def wait_for_authorization_completion(
-    client: Arcade, tool_authorization: AuthorizationResponse | None
+    client: "Arcade", tool_authorization: "AuthorizationResponse | None"
 ) -> None:
     """
     Wait for the authorization for a tool call to complete i.e., wait for the user to click on
@@ -468,6 +487,9 @@ def wait_for_authorization_completion(
     if tool_authorization is None:
         return
 
+    from arcadepy import APITimeoutError
+    from arcadepy.types import AuthorizationResponse
+
     auth_response = AuthorizationResponse.model_validate(tool_authorization)
 
     while auth_response.status != "completed":
@@ -481,7 +503,7 @@ def wait_for_authorization_completion(
 
 
 def get_tool_authorization(
-    choice: Union[ChatCompletionChoice, ChatCompletionChunkChoice],
+    choice: Union["ChatCompletionChoice", "ChatCompletionChunkChoice"],
 ) -> dict | None:
     """
     Get the tool authorization from a chat response's choice.
@@ -536,6 +558,22 @@ def get_eval_files(directory: str) -> list[Path]:
     return eval_files
 
 
+def get_eval_results_path(directory: str) -> Path:
+    """
+    Get the default results file for the evaluations in the given directory (or file).
+
+    Args:
+        directory: The directory, or evaluation file, the evaluations are run from.
+
+    Returns:
+        The Path of '.eval_results.jsonl' in the directory.
+    """
+    directory_path = Path(directory).resolve()
+    if directory_path.is_file():
+        directory_path = directory_path.parent
+    return directory_path / ".eval_results.jsonl"
+
+
 def load_eval_suites(eval_files: list[Path]) -> list[Callable]:
     """
     Load evaluation suites from the given eval_files by importing the modules
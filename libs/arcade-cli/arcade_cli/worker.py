@@ -1,6 +1,6 @@
-import httpx
+from typing import TYPE_CHECKING
+
 import typer
-from arcadepy import Arcade, NotFoundError
 from rich.console import Console
 from rich.table import Table
 
@@ -14,6 +14,9 @@ from arcade_cli.utils import (
     validate_and_get_config,
 )
 
+if TYPE_CHECKING:
+    from arcadepy import Arcade
+
 console = Console()
 
 
@@ -94,6 +97,9 @@ def list_workers(
         hidden=True,
     ),
 ) -> None:
+    import httpx
+    from arcadepy import Arcade
+
     config = validate_and_get_config()
     engine_url = state["engine_url"]
     client = Arcade(api_key=config.api.key, base_url=engine_url)
@@ -112,7 +118,7 @@ def list_workers(
     print_worker_table(client, deployments)
 
 
-def print_worker_table(client: Arcade, deployments: list[dict]) -> None:
+def print_worker_table(client: "Arcade", deployments: list[dict]) -> None:
     workers = client.workers.list()
     if not workers.items:
         console.print("No workers found", style="bold red")
@@ -174,6 +180,8 @@ def compare_endpoints(worker_id: str, engine_endpoint: str, deployments: list[di
 def enable_worker(
     worker_id: str,
 ) -> None:
+    from arcadepy import Arcade
+
     config = validate_and_get_config()
     engine_url = state["engine_url"]
     arcade = Arcade(api_key=config.api.key, base_url=engine_url)
@@ -188,6 +196,8 @@ def enable_worker(
 def disable_worker(
     worker_id: str,
 ) -> None:
+    from arcadepy import Arcade
+
     config = validate_and_get_config()
     engine_url = state["engine_url"]
     arcade = Arcade(api_key=config.api.key, base_url=engine_url)
@@ -234,6 +244,9 @@ def rm_worker(
         hidden=True,
     ),
 ) -> None:
+    import httpx
+    from arcadepy import Arcade, NotFoundError
+
     config = validate_and_get_config()
     engine_url = state["engine_url"]
     cloud_url = compute_base_url(force_tls, force_no_tls, cloud_host, cloud_port)
@@ -302,6 +315,8 @@ def worker_logs(
         hidden=True,
     ),
 ) -> None:
+    import httpx
+
     config = validate_and_get_config()
     cloud_url = compute_base_url(force_tls, force_no_tls, cloud_host, cloud_port)
     try:
@@ -326,7 +341,9 @@ def worker_logs(
         raise typer.Exit(code=1)
 
 
-def get_toolkits(client: Arcade, worker_id: str | None) -> str:
+def get_toolkits(client: "Arcade", worker_id: str | None) -> str:
+    from arcadepy import NotFoundError
+
     if worker_id is None:
         return ""
     try:
@@ -120,6 +120,7 @@ class ToolCatalog(BaseModel):
     """Singleton class that holds all tools for a given worker"""
 
     _tools: dict[FullyQualifiedName, MaterializedTool] = {}
+    _revision: int = 0
 
     _disabled_tools: set[str] = set()
     _disabled_toolkits: set[str] = set()
@@ -222,6 +223,17 @@ class ToolCatalog(BaseModel):
             input_model=input_model,
             output_model=output_model,
         )
+        self._revision += 1
+
+    @property
+    def revision(self) -> int:
+        """
+        A counter that increases every time a tool is added to the catalog.
+
+        Consumers that derive data from the catalog (e.g. a server's tool list)
+        can compare revisions to know when to recompute it.
+        """
+        return self._revision
 
     def add_module(self, module: ModuleType) -> None:
         """
@@ -28,6 +28,13 @@ class ToolExecutor:
     ) -> ToolCallOutput:
         """
         Execute a callable function with validated inputs and outputs via Pydantic models.
+
+        Cancelling the task that awaits this is not treated as a tool error: the
+        CancelledError propagates into an async tool and back out to the caller.
+        A sync tool can't be interrupted. Called inline, it runs to completion before
+        the cancellation takes effect; if the caller passes it wrapped to run in a
+        thread (e.g. with `asyncio.to_thread`), the caller is released right away and
+        the thread finishes in the background, its result discarded.
         """
         # only gathering deprecation log for now
         tool_call_logs = []
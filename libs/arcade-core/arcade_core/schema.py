@@ -1,13 +1,17 @@
 import os
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Literal, Optional, Union
+from typing import Any, Callable, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 # allow for custom tool name separator
 TOOL_NAME_SEPARATOR = os.getenv("ARCADE_TOOL_NAME_SEPARATOR", ".")
 
+# Receives a tool's progress updates: (progress, total, message)
+ProgressReporter = Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+
 
 class ValueSchema(BaseModel):
     """Value schema for input parameters and outputs."""
@@ -300,6 +304,29 @@ class ToolContext(BaseModel):
     user_id: str | None = None
     """The user ID for the tool invocation (if any)."""
 
+    _progress_reporter: ProgressReporter | None = PrivateAttr(default=None)
+
+    def set_progress_reporter(self, reporter: ProgressReporter | None) -> None:
+        """Set the callback that receives progress updates from the tool."""
+        self._progress_reporter = reporter
+
+    async def report_progress(
+        self, progress: float, total: float | None = None, message: str | None = None
+    ) -> None:
+        """
+        Report the progress of a long-running tool, e.g. pages fetched so far.
+
+        Does nothing if the caller isn't listening for progress. Updates may be
+        throttled, so it is fine to call this often.
+
+        Args:
+            progress: The progress so far. Must increase with each update.
+            total: The total amount of work, if known.
+            message: An optional human-readable status message.
+        """
+        if self._progress_reporter is not None:
+            await self._progress_reporter(progress, total, message)
+
     def get_auth_token_or_empty(self) -> str:
         """Retrieve the authorization token, or return an empty string if not available."""
         return self.authorization.token if self.authorization and self.authorization.token else ""
@@ -1,22 +1,22 @@
 import logging
 import os
 import urllib.parse
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from fastapi import FastAPI
 from opentelemetry import _logs, trace
-from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
-from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.metrics import Meter, get_meter_provider, set_meter_provider
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+if TYPE_CHECKING:
+    # The OpenTelemetry SDK, the OTLP exporters and FastAPI are slow to import and are
+    # only needed once telemetry is enabled, so they are imported where they are used.
+    from fastapi import FastAPI
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk._logs import LoggerProvider
+    from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.trace import TracerProvider
 
 
 class ShutdownError(Exception):
@@ -36,8 +36,11 @@ class OTELHandler:
         self._log_processor: Optional[BatchLogRecordProcessor] = None
         self.environment = os.environ.get("ARCADE_ENVIRONMENT", "local")
 
-    def instrument_app(self, app: FastAPI) -> None:
+    def instrument_app(self, app: "FastAPI") -> None:
         if self.enable:
+            from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+            from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+
             logging.info(
                 "🔎 Initializing OpenTelemetry. Use environment variables to configure the connection"
             )
@@ -51,6 +54,10 @@ class OTELHandler:
             FastAPIInstrumentor().instrument_app(app)
 
     def _init_tracer(self) -> None:
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
         self._tracer_provider = TracerProvider(resource=self.resource)
         trace.set_tracer_provider(self._tracer_provider)
 
@@ -69,6 +76,10 @@ class OTELHandler:
         self._tracer_provider.add_span_processor(span_processor)
 
     def _init_metrics(self) -> None:
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
         self._otlp_metric_exporter = OTLPMetricExporter()
 
         self._meter_reader = PeriodicExportingMetricReader(self._otlp_metric_exporter)
@@ -83,6 +94,10 @@ class OTELHandler:
         return get_meter_provider().get_meter(__name__)
 
     def _init_logging(self, log_level: int) -> None:
+        from opentelemetry.exporter.otlp.proto.http._log_exporter import OTLPLogExporter
+        from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+        from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+
         otlp_log_exporter = OTLPLogExporter()
 
         self._logger_provider = LoggerProvider(resource=self.resource)
@@ -1,15 +1,23 @@
+from .cache import CacheMode, ResponseCache
 from .critic import BinaryCritic, DatetimeCritic, NoneCritic, NumericCritic, SimilarityCritic
 from .eval import EvalRubric, EvalSuite, ExpectedToolCall, NamedExpectedToolCall, tool_eval
+from .results import ResultsLog
+from .scheduler import ModelLimits, RequestScheduler
 
 __all__ = [
     "BinaryCritic",
+    "CacheMode",
     "DatetimeCritic",
     "EvalRubric",
     "EvalSuite",
     "ExpectedToolCall",
+    "ModelLimits",
     "NamedExpectedToolCall",
     "NoneCritic",
     "NumericCritic",
+    "RequestScheduler",
+    "ResponseCache",
+    "ResultsLog",
     "SimilarityCritic",
     "tool_eval",
 ]
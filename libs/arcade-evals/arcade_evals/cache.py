@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Awaitable
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable
+
+from openai.types.chat import ChatCompletion
+
+from arcade_evals.errors import EvalError
+
+
+class CacheMode(str, Enum):
+    """How a ResponseCache treats model requests."""
+
+    RECORD = "record"
+    """Replay cached responses, and call the model (and cache its response) for the rest."""
+    REPLAY = "replay"
+    """Only replay cached responses; a request that isn't cached fails."""
+    REFRESH = "refresh"
+    """Always call the model, replacing any cached response."""
+
+
+class ResponseCacheMissError(EvalError):
+    """Raised in replay mode when a request has no cached response."""
+
+
+class ResponseCache:
+    """
+    An on-disk cache of chat completion responses, so that critic and rubric changes
+    can be re-scored without calling the model again.
+
+    Responses are keyed by a hash of the request's model, messages, tools and seed,
+    plus the definitions of the tools when given, and stored as one JSON file each
+    under `directory`.
+
+    Args:
+        directory: The directory to keep responses in. Created if it doesn't exist.
+        mode: Whether to record, replay or refresh responses.
+    """
+
+    def __init__(self, directory: str | Path, mode: CacheMode | str = CacheMode.RECORD):
+        self.directory = Path(directory)
+        self.mode = CacheMode(mode)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: Any,
+        seed: int | None,
+        tool_definitions: list[str] | None = None,
+    ) -> str:
+        """
+        The cache key for a request.
+
+        Args:
+            model: The model the request is sent to.
+            messages: The request's messages.
+            tools: The tools offered to the model.
+            seed: The request's sampling seed.
+            tool_definitions: The definitions of the tools, e.g. as JSON. The request
+                only names the tools, so a changed description or parameter would
+                otherwise replay a stale response.
+
+        Returns:
+            A hex SHA-256 digest of the request.
+        """
+        request = {
+            "model": model,
+            "messages": messages,
+            "tools": tools,
+            "seed": seed,
+            "tool_definitions": tool_definitions,
+        }
+        encoded = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> ChatCompletion | None:
+        """Return the cached response for `key`, or None if there is none."""
+        try:
+            data = self.path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        return ChatCompletion.model_validate_json(data)
+
+    def put(self, key: str, response: Any) -> None:
+        """Cache a response. The file is replaced atomically, so readers never see a partial one."""
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = response.model_dump_json() if hasattr(response, "model_dump_json") else response
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    async def create(
+        self,
+        fetch: Callable[..., Awaitable[Any]],
+        tool_definitions: list[str] | None = None,
+        **params: Any,
+    ) -> Any:
+        """
+        Return the response to a chat completion request, from the cache or the model.
+
+        Args:
+            fetch: Sends the request to the model, e.g. `client.chat.completions.create`.
+            tool_definitions: The definitions of the request's tools, for the cache key.
+            **params: The request's arguments, passed to `fetch`.
+
+        Raises:
+            ResponseCacheMissError: In replay mode, if the request isn't cached.
+        """
+        key = self.key(
+            params["model"],
+            params["messages"],
+            params.get("tools"),
+            params.get("seed"),
+            tool_definitions,
+        )
+        if self.mode is not CacheMode.REFRESH:
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+        self.misses += 1
+        if self.mode is CacheMode.REPLAY:
+            raise ResponseCacheMissError(
+                f"No cached response for a request to '{params['model']}' (key {key[:12]}). "
+                "Run with the cache in record mode first."
+            )
+        response = await fetch(**params)
+        self.put(key, response)
+        return response
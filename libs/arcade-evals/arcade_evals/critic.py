@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, ClassVar
@@ -208,7 +211,11 @@ class SimilarityCritic(Critic):
         self.metric = metric
 
     def evaluate(self, expected: str, actual: str) -> dict[str, float | bool]:
-        if self.metric == "cosine":
+        if self.metric != "cosine":
+            raise ValueError(f"Unsupported similarity metric: {self.metric}")
+        index = _active_similarity_index.get()
+        similarity = index.similarity(expected, actual) if index is not None else None
+        if similarity is None:
             try:
                 from sklearn.feature_extraction.text import TfidfVectorizer
                 from sklearn.metrics.pairwise import cosine_similarity
@@ -219,14 +226,93 @@ class SimilarityCritic(Critic):
             vectorizer = TfidfVectorizer()
             tfidf_matrix = vectorizer.fit_transform([expected, actual])
             similarity = cosine_similarity(tfidf_matrix[0], tfidf_matrix[1])[0][0]
-        else:
-            raise ValueError(f"Unsupported similarity metric: {self.metric}")
         return {
             "match": similarity >= self.similarity_threshold,
             "score": min(similarity * self.weight, self.weight),
         }
 
 
+class SimilarityIndex:
+    """
+    TF-IDF vectors for a fixed set of strings, so that the SimilarityCritics of a whole
+    suite run share one fitted vectorizer instead of fitting one per comparison.
+
+    The vectorizer is fitted on every string at once, which also gives the IDF weights
+    a real corpus to work from. While an index is active (see `active`), SimilarityCritic
+    uses it for any pair of strings it holds and falls back to fitting a vectorizer on
+    the pair otherwise.
+
+    Args:
+        documents: The strings to vectorize
+
+    Raises:
+        ImportError: If scikit-learn is not installed.
+        ValueError: If the strings contain no words.
+    """
+
+    def __init__(self, documents: Iterable[str]):
+        try:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+        except ImportError:
+            raise ImportError(
+                "Use `pip install 'arcade-evals` to install the required dependencies for similarity metrics."
+            )
+        self._rows = {document: row for row, document in enumerate(dict.fromkeys(documents))}
+        # Rows are L2-normalized, so the dot product of two rows is their cosine similarity
+        self._matrix = TfidfVectorizer().fit_transform(list(self._rows))
+        self._scores: dict[tuple[str, str], float] = {}
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[tuple[str, str]]) -> "SimilarityIndex":
+        """Build an index over the strings of the (expected, actual) pairs and score them all."""
+        pairs = list(pairs)
+        index = cls(document for pair in pairs for document in pair)
+        index.score_pairs(pairs)
+        return index
+
+    def score_pairs(self, pairs: Iterable[tuple[str, str]]) -> None:
+        """Compute the cosine similarity of every (expected, actual) pair in one operation."""
+        pending = [
+            pair
+            for pair in dict.fromkeys(pairs)
+            if pair not in self._scores and pair[0] in self._rows and pair[1] in self._rows
+        ]
+        if not pending:
+            return
+        left = self._matrix[[self._rows[expected] for expected, _ in pending]]
+        right = self._matrix[[self._rows[actual] for _, actual in pending]]
+        similarities = left.multiply(right).sum(axis=1).A1
+        self._scores.update(zip(pending, similarities.tolist()))
+
+    def similarity(self, expected: Any, actual: Any) -> float | None:
+        """
+        The cosine similarity of two strings.
+
+        Returns:
+            None if either value isn't a string in the index
+        """
+        key = (expected, actual)
+        if key not in self._scores:
+            if not isinstance(expected, str) or not isinstance(actual, str):
+                return None
+            self.score_pairs([key])
+        return self._scores.get(key)
+
+    @contextmanager
+    def active(self) -> Iterator["SimilarityIndex"]:
+        """Make SimilarityCritic use this index within the block."""
+        token = _active_similarity_index.set(self)
+        try:
+            yield self
+        finally:
+            _active_similarity_index.reset(token)
+
+
+_active_similarity_index: ContextVar[SimilarityIndex | None] = ContextVar(
+    "_active_similarity_index", default=None
+)
+
+
 @dataclass
 class DatetimeCritic(Critic):
     """
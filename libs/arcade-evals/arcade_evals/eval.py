@@ -2,23 +2,27 @@ import asyncio
 import functools
 import inspect
 import json
+import time
+from collections.abc import Awaitable
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable
 
 import numpy as np
 from arcade_core.config_model import Config
 from arcade_core.schema import TOOL_NAME_SEPARATOR
-from openai import AsyncOpenAI
+from openai import DEFAULT_MAX_RETRIES, AsyncOpenAI
 from scipy.optimize import linear_sum_assignment
 
-from arcade_evals.critic import NoneCritic
+from arcade_evals.cache import ResponseCache
+from arcade_evals.critic import Critic, NoneCritic, SimilarityCritic, SimilarityIndex
 from arcade_evals.errors import WeightError
+from arcade_evals.results import ResultsLog, ToolCalls
+from arcade_evals.scheduler import RequestScheduler
 
 if TYPE_CHECKING:
     from arcade_core import ToolCatalog
 
-    from arcade_evals.critic import Critic
-
 
 @dataclass
 class ExpectedToolCall:
@@ -277,8 +281,12 @@ class EvalCase:
             evaluation_result.passed = True
             return evaluation_result
 
-        # Create a cost matrix for the assignment problem
-        cost_matrix = self._create_cost_matrix(actual_tool_calls, self.expected_tool_calls)
+        # Create a cost matrix for the assignment problem, keeping the critic results
+        # so the assigned pairs aren't evaluated a second time below
+        critic_results: dict[tuple[int, int, int], dict[str, Any] | Exception] = {}
+        cost_matrix = self._create_cost_matrix(
+            actual_tool_calls, self.expected_tool_calls, critic_results
+        )
 
         # Use the Linear Sum Assignment algorithm to find the optimal assignment
         row_ind, col_ind = linear_sum_assignment(cost_matrix, maximize=True)
@@ -299,32 +307,29 @@ class EvalCase:
                 total_weight += self.rubric.tool_selection_weight
 
                 # Evaluate arguments using critics
-                for critic in self.critics:
+                for k, critic in enumerate(self.critics):
                     expected_value = expected.args.get(critic.critic_field)
                     actual_value = actual_args.get(critic.critic_field)
 
-                    try:
-                        result = critic.evaluate(expected_value, actual_value)
-                        total_score += result["score"]
-                        total_weight += critic.weight
-                        evaluation_result.add(
-                            critic.critic_field,
-                            result,
-                            critic.weight,
-                            expected_value,
-                            actual_value,
-                        )
-                    except Exception as e:
+                    result = critic_results.get((k, i, j))
+                    if result is None:
+                        result = _evaluate_critic(critic, expected_value, actual_value)
+                    if isinstance(result, Exception):
                         # TODO: log or console
-                        print(f"Critic evaluation failed for field '{critic.critic_field}': {e}")
-                        evaluation_result.add(
-                            critic.critic_field,
-                            {"match": False, "score": 0.0},
-                            critic.weight,
-                            expected_value,
-                            actual_value,
+                        print(
+                            f"Critic evaluation failed for field '{critic.critic_field}': {result}"
                         )
-                        continue
+                        result = {"match": False, "score": 0.0}
+                    else:
+                        total_score += result["score"]
+                        total_weight += critic.weight
+                    evaluation_result.add(
+                        critic.critic_field,
+                        result,
+                        critic.weight,
+                        expected_value,
+                        actual_value,
+                    )
 
         # Compute the final score
         evaluation_result.compute_final_score(total_weight)
@@ -341,6 +346,7 @@ class EvalCase:
         self,
         actual_tool_calls: list[tuple[str, dict[str, Any]]],
         expected_tool_calls: list[NamedExpectedToolCall],
+        critic_results: dict[tuple[int, int, int], dict[str, Any] | Exception] | None = None,
     ) -> np.ndarray:
         """
         Create a cost matrix for the assignment problem.
@@ -348,6 +354,8 @@ class EvalCase:
         Args:
             actual_tool_calls: A list of tuples of actual tool calls.
             expected_tool_calls: A list of NamedExpectedToolCall instances.
+            critic_results: If given, filled with each critic's result (or the exception
+                it raised), keyed by (critic index, expected index, actual index).
 
         Returns:
             A numpy array representing the cost matrix.
@@ -355,37 +363,49 @@ class EvalCase:
         num_expected = len(expected_tool_calls)
         num_actual = len(actual_tool_calls)
         n = max(num_expected, num_actual)
+        if critic_results is None:
+            critic_results = {}
 
         cost_matrix = np.zeros((n, n))
 
-        for i in range(n):
-            for j in range(n):
-                if i < num_expected and j < num_actual:
-                    expected = expected_tool_calls[i]
-                    actual_name, actual_args = actual_tool_calls[j]
-                    score = 0.0
-
-                    # Tool selection
-                    if compare_tool_name(expected.name, actual_name):
-                        score += self.rubric.tool_selection_weight
-
-                    # Critics evaluation
-                    for critic in self.critics:  # type: ignore[union-attr]
-                        expected_value = expected.args.get(critic.critic_field)
-                        actual_value = actual_args.get(critic.critic_field)
-                        if expected_value is not None and actual_value is not None:
-                            try:
-                                result = critic.evaluate(expected_value, actual_value)
-                                score += result.get("score", 0.0)
-                            except Exception as e:
-                                print(
-                                    f"Critic evaluation failed for field '{critic.critic_field}': {e}"
-                                )
-                    cost_matrix[i, j] = score
+        # Tool selection, for every (expected, actual) pair at once
+        expected_names = [normalize_name(tc.name).lower() for tc in expected_tool_calls]
+        actual_names = [normalize_name(name).lower() for name, _ in actual_tool_calls]
+        cost_matrix[:num_expected, :num_actual] = self.rubric.tool_selection_weight * (
+            np.array(expected_names, dtype=object)[:, None]
+            == np.array(actual_names, dtype=object)[None, :]
+        )
+
+        # Critics evaluation
+        for k, critic in enumerate(self.critics):  # type: ignore[arg-type]
+            for i, expected in enumerate(expected_tool_calls):
+                expected_value = expected.args.get(critic.critic_field)
+                if expected_value is None:
+                    continue
+                for j, (_, actual_args) in enumerate(actual_tool_calls):
+                    actual_value = actual_args.get(critic.critic_field)
+                    if actual_value is None:
+                        continue
+                    result = _evaluate_critic(critic, expected_value, actual_value)
+                    critic_results[k, i, j] = result
+                    if isinstance(result, Exception):
+                        print(
+                            f"Critic evaluation failed for field '{critic.critic_field}': {result}"
+                        )
+                    else:
+                        cost_matrix[i, j] += result.get("score", 0.0)
 
         return cost_matrix
 
 
+def _evaluate_critic(critic: "Critic", expected: Any, actual: Any) -> dict[str, Any] | Exception:
+    """Run a critic, returning the exception it raised rather than raising it."""
+    try:
+        return critic.evaluate(expected, actual)
+    except Exception as e:
+        return e
+
+
 @dataclass
 class EvalSuite:
     """
@@ -409,6 +429,13 @@ class EvalSuite:
     cases: list[EvalCase] = field(default_factory=list)
     rubric: EvalRubric = field(default_factory=EvalRubric)
     max_concurrent: int = 1
+    # Per-tool lookups, filled as tools are first used: name -> function,
+    # function -> fully qualified name, and function -> {parameter: default}
+    _tool_funcs: dict[str, Callable] = field(default_factory=dict, init=False, repr=False)
+    _tool_names: dict[Callable, str] = field(default_factory=dict, init=False, repr=False)
+    _tool_defaults: dict[Callable, dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def _convert_to_named_expected_tool_call(
         self, tc: ExpectedToolCall | tuple[Callable, dict[str, Any]]
@@ -429,7 +456,10 @@ class EvalSuite:
             func = tc.func
             args = tc.args
         args_with_defaults = self._fill_args_with_defaults(func, args)
-        tool_name = str(self.catalog.find_tool_by_func(func).get_fully_qualified_name())
+        tool_name = self._tool_names.get(func)
+        if tool_name is None:
+            tool_name = str(self.catalog.find_tool_by_func(func).get_fully_qualified_name())
+            self._tool_names[func] = tool_name
         return NamedExpectedToolCall(name=tool_name, args=args_with_defaults)
 
     def add_case(
@@ -528,6 +558,9 @@ class EvalSuite:
         """
         Fill in default arguments for a tool function.
 
+        The function's signature is read once and its defaults cached; parameters
+        without a default are filled with None.
+
         Args:
             func: The tool function.
             provided_args: The provided arguments.
@@ -535,16 +568,14 @@ class EvalSuite:
         Returns:
             A dictionary with default arguments filled in.
         """
-        sig = inspect.signature(func)
-        args_with_defaults = {}
-        for param in sig.parameters.values():
-            if param.name in provided_args:
-                args_with_defaults[param.name] = provided_args[param.name]
-            elif param.default is not inspect.Parameter.empty:
-                args_with_defaults[param.name] = param.default
-            else:
-                args_with_defaults[param.name] = None  # or raise an error
-        return args_with_defaults
+        defaults = self._tool_defaults.get(func)
+        if defaults is None:
+            defaults = {
+                param.name: None if param.default is inspect.Parameter.empty else param.default
+                for param in inspect.signature(func).parameters.values()
+            }
+            self._tool_defaults[func] = defaults
+        return {name: provided_args.get(name, default) for name, default in defaults.items()}
 
     def extend_case(
         self,
@@ -606,74 +637,244 @@ class EvalSuite:
         )
         self.cases.append(new_case)
 
-    async def run(self, client: AsyncOpenAI, model: str) -> dict[str, Any]:
+    async def run(
+        self,
+        client: AsyncOpenAI,
+        model: str,
+        response_cache: ResponseCache | None = None,
+        scheduler: RequestScheduler | None = None,
+        results_log: ResultsLog | None = None,
+    ) -> dict[str, Any]:
         """
         Run the evaluation suite.
 
+        The tool calls of every case are kept until the whole suite has been
+        predicted, since string similarity is scored over all of them at once, so
+        memory grows with the number of cases in the suite. A results log bounds how
+        much of that work is lost to an interrupted run, not the memory in use.
+
         Args:
             client: The AsyncOpenAI client instance.
             model: The model to evaluate.
+            response_cache: If given, model responses are replayed from and recorded to it.
+            scheduler: If given, model requests are rate limited and retried by it. Share one
+                scheduler between suites to limit the requests of a whole evaluation run.
+            results_log: If given, each case's tool calls are written to it as soon as the
+                model answers, and cases it already holds are scored without asking the model.
 
         Returns:
             A dictionary containing the evaluation results.
         """
-        results: dict[str, Any] = {"model": model, "rubric": self.rubric, "cases": []}
+        results: dict[str, Any] = {
+            "suite": self.name,
+            "model": model,
+            "rubric": self.rubric,
+            "cases": [],
+        }
 
         semaphore = asyncio.Semaphore(self.max_concurrent)
-        tool_names = list(self.catalog.get_tool_names())
+        tools = [str(name) for name in self.catalog.get_tool_names()]
+        # The requests only name the tools, so the cache and the results log are keyed
+        # by their definitions too
+        tool_definitions = [tool.definition.model_dump_json() for tool in self.catalog]
 
-        async def sem_task(case: EvalCase) -> dict[str, Any]:
+        async def sem_task(case: EvalCase) -> tuple[EvalCase, ToolCalls, dict[str, Any]]:
             async with semaphore:
-                # Prepare messages
-                messages = [{"role": "system", "content": case.system_message}]
-                messages.extend(case.additional_messages)
-                messages.append({"role": "user", "content": case.user_message})
-
-                # Get the model response
-                response = await client.chat.completions.create(  # type: ignore[call-overload]
-                    model=model,
-                    messages=messages,
-                    tool_choice="auto",
-                    tools=(str(name) for name in tool_names),
-                    user="eval_user",
-                    seed=42,
-                    stream=False,
+                tool_calls, metrics = await self._predict(
+                    case,
+                    client,
+                    model,
+                    tools,
+                    tool_definitions,
+                    response_cache,
+                    scheduler,
+                    results_log,
                 )
-
-                # Extract and fill default arguments for actual tool calls
-                predicted_args = get_tool_args(response)
-                filled_actual_tool_calls = []
-                for tool_name, args in predicted_args:
-                    tool = self.catalog.get_tool_by_name(tool_name)
-                    if tool is None:
-                        raise ValueError(f"Tool '{tool_name}' not found in catalog.")
-                    func = tool.tool
-                    args_with_defaults = self._fill_args_with_defaults(func, args)
-                    filled_actual_tool_calls.append((tool_name, args_with_defaults))
-
-                # Evaluate the case
-                evaluation = case.evaluate(filled_actual_tool_calls)
-
-                # Prepare the result
-                result = {
-                    "name": case.name,
-                    "input": case.user_message,
-                    "expected_tool_calls": [
-                        {"name": tc.name, "args": tc.args} for tc in case.expected_tool_calls
-                    ],
-                    "predicted_tool_calls": [
-                        {"name": name, "args": args} for name, args in filled_actual_tool_calls
-                    ],
-                    "evaluation": evaluation,
-                }
-                return result
+                return case, tool_calls, metrics
 
         tasks = [sem_task(case) for case in self.cases]
-        case_results = await asyncio.gather(*tasks)
+        predictions = await asyncio.gather(*tasks)
+
+        # Score every case's string comparisons with one vectorizer, fitted on the whole run
+        similarity_index = _similarity_index([
+            (case, tool_calls) for case, tool_calls, _ in predictions
+        ])
+        with similarity_index.active() if similarity_index else nullcontext():
+            case_results = [
+                self._case_result(case, filled_actual_tool_calls, metrics)
+                for case, filled_actual_tool_calls, metrics in predictions
+            ]
 
         results["cases"] = case_results
         return results
 
+    async def _predict(
+        self,
+        case: EvalCase,
+        client: AsyncOpenAI,
+        model: str,
+        tools: list[str],
+        tool_definitions: list[str],
+        response_cache: ResponseCache | None,
+        scheduler: RequestScheduler | None,
+        results_log: ResultsLog | None,
+    ) -> tuple[ToolCalls, dict[str, Any]]:
+        """
+        Ask the model for a case's tool calls, or take them from the results log.
+
+        Returns:
+            The tool calls, with default arguments filled in, and the request's metrics:
+            its wall time in ms (None if the response was replayed from the cache),
+            and its prompt and completion tokens.
+        """
+        # Prepare messages
+        messages = [{"role": "system", "content": case.system_message}]
+        messages.extend(case.additional_messages)
+        messages.append({"role": "user", "content": case.user_message})
+
+        if results_log is not None:
+            case_hash = results_log.case_hash(case.name, messages, tool_definitions)
+            recorded = results_log.recorded(self.name, model, case_hash)
+            if recorded is not None:
+                return recorded
+
+        metrics: dict[str, Any] = {
+            "wall_time_ms": None,
+            "prompt_tokens": None,
+            "completion_tokens": None,
+        }
+
+        # Timed around the request itself, so that scheduler waits aren't counted
+        async def timed_create(**params: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await client.chat.completions.create(**params)
+            finally:
+                metrics["wall_time_ms"] = (time.perf_counter() - start) * 1000
+
+        create: Callable[..., Awaitable[Any]] = timed_create
+        if scheduler is not None:
+            create = functools.partial(scheduler.create, create)
+        if response_cache is not None:
+            create = functools.partial(
+                response_cache.create, create, tool_definitions=tool_definitions
+            )
+
+        # Get the model response
+        response = await create(
+            model=model,
+            messages=messages,
+            tool_choice="auto",
+            tools=tools,
+            user="eval_user",
+            seed=42,
+            stream=False,
+        )
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            metrics["prompt_tokens"] = usage.prompt_tokens
+            metrics["completion_tokens"] = usage.completion_tokens
+
+        # Extract and fill default arguments for actual tool calls
+        filled_actual_tool_calls = self._fill_tool_calls(get_tool_args(response))
+
+        if results_log is not None:
+            results_log.record(
+                self.name, model, case.name, case_hash, filled_actual_tool_calls, metrics
+            )
+        return filled_actual_tool_calls, metrics
+
+    def _fill_tool_calls(self, predicted_args: ToolCalls) -> ToolCalls:
+        """
+        Fill in default arguments for the tool calls the model made.
+
+        Args:
+            predicted_args: The tool names and arguments from the model response.
+
+        Returns:
+            The tool calls, with default arguments filled in.
+
+        Raises:
+            ValueError: If the model called a tool that isn't in the catalog.
+        """
+        filled_actual_tool_calls = []
+        for tool_name, args in predicted_args:
+            func = self._tool_funcs.get(tool_name)
+            if func is None:
+                tool = self.catalog.get_tool_by_name(tool_name)
+                if tool is None:
+                    raise ValueError(f"Tool '{tool_name}' not found in catalog.")
+                func = self._tool_funcs[tool_name] = tool.tool
+            args_with_defaults = self._fill_args_with_defaults(func, args)
+            filled_actual_tool_calls.append((tool_name, args_with_defaults))
+        return filled_actual_tool_calls
+
+    def _case_result(
+        self,
+        case: EvalCase,
+        filled_actual_tool_calls: ToolCalls,
+        metrics: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Evaluate a case's predicted tool calls and prepare its result.
+
+        Args:
+            case: The evaluation case.
+            filled_actual_tool_calls: The model's tool calls, with default arguments filled in.
+            metrics: The model request's wall time (ms) and prompt and completion tokens.
+
+        Returns:
+            The case's result.
+        """
+        evaluation = case.evaluate(filled_actual_tool_calls)
+        return {
+            "name": case.name,
+            "input": case.user_message,
+            "expected_tool_calls": [
+                {"name": tc.name, "args": tc.args} for tc in case.expected_tool_calls
+            ],
+            "predicted_tool_calls": [
+                {"name": name, "args": args} for name, args in filled_actual_tool_calls
+            ],
+            "evaluation": evaluation,
+            "metrics": metrics,
+        }
+
+
+def _similarity_index(
+    predictions: list[tuple[EvalCase, list[tuple[str, dict[str, Any]]]]],
+) -> SimilarityIndex | None:
+    """
+    Build a SimilarityIndex over every pair of strings the cases' SimilarityCritics will compare.
+
+    Args:
+        predictions: Each case with its model's tool calls.
+
+    Returns:
+        None if no SimilarityCritic has strings to compare, or the strings have no words
+    """
+    pairs: list[tuple[str, str]] = []
+    for case, actual_tool_calls in predictions:
+        for critic in case.critics or []:
+            if not isinstance(critic, SimilarityCritic):
+                continue
+            expected_values = [tc.args.get(critic.critic_field) for tc in case.expected_tool_calls]
+            actual_values = [args.get(critic.critic_field) for _, args in actual_tool_calls]
+            pairs.extend(
+                (expected, actual)
+                for expected in expected_values
+                if isinstance(expected, str)
+                for actual in actual_values
+                if isinstance(actual, str)
+            )
+    if not pairs:
+        return None
+    try:
+        return SimilarityIndex.from_pairs(pairs)
+    except (ImportError, ValueError):
+        # Left to the critics, which report the error for each comparison
+        return None
+
 
 def get_tool_args(chat_completion: Any) -> list[tuple[str, dict[str, Any]]]:
     """
@@ -733,6 +934,9 @@ def tool_eval() -> Callable[[Callable], Callable]:
             base_url: str,
             model: str,
             max_concurrency: int = 1,
+            response_cache: ResponseCache | None = None,
+            scheduler: RequestScheduler | None = None,
+            results_log: ResultsLog | None = None,
         ) -> list[dict[str, Any]]:
             suite = func()
             if not isinstance(suite, EvalSuite):
@@ -742,8 +946,16 @@ def tool_eval() -> Callable[[Callable], Callable]:
             async with AsyncOpenAI(
                 api_key=config.api.key,
                 base_url=base_url + "/v1",
+                # The scheduler retries failed requests itself
+                max_retries=0 if scheduler is not None else DEFAULT_MAX_RETRIES,
             ) as client:
-                result = await suite.run(client, model)
+                result = await suite.run(
+                    client,
+                    model,
+                    response_cache=response_cache,
+                    scheduler=scheduler,
+                    results_log=results_log,
+                )
                 results.append(result)
             return results
 
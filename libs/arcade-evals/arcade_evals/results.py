@@ -0,0 +1,106 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+ToolCalls = list[tuple[str, dict[str, Any]]]
+
+
+class ResultsLog:
+    """
+    A JSONL file with one line per evaluated case, written as soon as the model has
+    answered the case, so that an interrupted run can be resumed.
+
+    Each line holds the suite, model, case name and case hash, the tool calls the
+    model made, and the request's metrics (wall time and token usage). Cases are
+    scored from these tool calls, so a resumed run re-scores recorded cases with the
+    current critics and rubric without asking the model again.
+
+    Only the cases read from the file on resume are kept in memory; cases recorded
+    by this run are written out and not kept.
+
+    Args:
+        path: The results file.
+        resume: Keep the cases already in the file (see `recorded`) and append to it.
+            Otherwise the file is started afresh.
+        resume_from: Read the recorded cases from this file instead of `path`, e.g.
+            when `path` holds one worker process's share of a run.
+    """
+
+    def __init__(
+        self, path: str | Path, resume: bool = False, resume_from: str | Path | None = None
+    ):
+        self.path = Path(path)
+        self._recorded: dict[tuple[str, str, str], tuple[ToolCalls, dict[str, Any]]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if resume_from is not None:
+            self._load(Path(resume_from))
+        elif resume:
+            self._load(self.path)
+        if not resume:
+            self.path.write_text("", encoding="utf-8")
+
+    def _load(self, path: Path) -> None:
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                record = json.loads(line)
+                key = (record["suite"], record["model"], record["case_hash"])
+                tool_calls = [
+                    (call["name"], call["args"]) for call in record["predicted_tool_calls"]
+                ]
+            except (ValueError, KeyError, TypeError):
+                # e.g. a line cut short when the previous run was interrupted
+                continue
+            self._recorded[key] = (tool_calls, record.get("metrics") or {})
+
+    @staticmethod
+    def case_hash(case_name: str, messages: list[dict[str, Any]], tools: list[str]) -> str:
+        """
+        Hash what the model is asked for a case, so that a resumed run only reuses a
+        recorded answer if the case's messages and the suite's tools are unchanged.
+
+        Args:
+            case_name: The case's name.
+            messages: The messages sent to the model.
+            tools: The definitions of the suite's tools, e.g. as JSON, so that a
+                changed description or parameter counts as a change.
+        """
+        encoded = json.dumps([case_name, messages, tools], sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def recorded(
+        self, suite: str, model: str, case_hash: str
+    ) -> tuple[ToolCalls, dict[str, Any]] | None:
+        """
+        The tool calls and metrics recorded for a case by the run being resumed, or
+        None if there are none.
+        """
+        return self._recorded.get((suite, model, case_hash))
+
+    def record(
+        self,
+        suite: str,
+        model: str,
+        case_name: str,
+        case_hash: str,
+        tool_calls: ToolCalls,
+        metrics: dict[str, Any] | None = None,
+    ) -> None:
+        """Append a case's tool calls and metrics to the file."""
+        line = json.dumps(
+            {
+                "suite": suite,
+                "model": model,
+                "case": case_name,
+                "case_hash": case_hash,
+                "predicted_tool_calls": [{"name": name, "args": args} for name, args in tool_calls],
+                "metrics": metrics or {},
+            },
+            default=str,
+        )
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
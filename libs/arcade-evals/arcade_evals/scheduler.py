@@ -0,0 +1,244 @@
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from openai import APIConnectionError, APIStatusError, InternalServerError, RateLimitError
+
+logger = logging.getLogger(__name__)
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+# Rough characters per token, to budget a request's prompt before its usage is known
+_CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class ModelLimits:
+    """
+    Per-model rate limits. None means unlimited.
+
+    Attributes:
+        requests_per_minute: Requests sent to the model per minute.
+        tokens_per_minute: Prompt and completion tokens used per minute.
+    """
+
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+
+
+class _Budget:
+    """A per-minute budget, refilled continuously (a token bucket)."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.available = self.capacity
+        self.rate = self.capacity / 60
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float) -> None:
+        # Requests larger than the whole budget go through once the budget is full
+        amount = min(amount, self.capacity)
+        # Waiters are served in order, so large requests aren't starved by small ones
+        async with self._lock:
+            self._refill()
+            while self.available < amount:
+                await asyncio.sleep((amount - self.available) / self.rate)
+                self._refill()
+            self.available -= amount
+
+    def adjust(self, amount: float) -> None:
+        """Return unused budget (positive), or charge more (negative)."""
+        self._refill()
+        self.available = min(self.capacity, self.available + amount)
+
+
+class _ModelState:
+    def __init__(self, limits: ModelLimits):
+        self.requests = _Budget(limits.requests_per_minute) if limits.requests_per_minute else None
+        self.tokens = _Budget(limits.tokens_per_minute) if limits.tokens_per_minute else None
+        self.paused_until = 0.0
+
+    async def wait(self, estimated_tokens: int) -> None:
+        while (delay := self.paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        if self.requests is not None:
+            await self.requests.acquire(1)
+        if self.tokens is not None:
+            await self.tokens.acquire(estimated_tokens)
+
+    def pause(self, delay: float) -> None:
+        self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+    def refund(self, estimated_tokens: int) -> None:
+        """Give back the tokens taken by `wait` for a request that failed."""
+        if self.tokens is not None:
+            self.tokens.adjust(min(estimated_tokens, self.tokens.capacity))
+
+
+class RequestScheduler:
+    """
+    Schedules model requests for every suite and model of an evaluation run.
+
+    Requests share one concurrency limit, are held back to stay within each model's
+    requests- and tokens-per-minute budgets, and are retried with exponential backoff
+    when the provider rate-limits them (429), fails (5xx) or can't be reached. A 429
+    pauses all requests to that model for as long as the response's rate-limit headers
+    ask, or for the backoff delay if it has none.
+
+    Args:
+        max_concurrency: Maximum number of requests in flight across all suites and models.
+        limits: The rate limits of every model, or a dict of limits by model name.
+            Models missing from the dict are unlimited.
+        max_retries: How many times a failed request is retried.
+        initial_backoff: Seconds before the first retry; doubled for each further retry.
+        max_backoff: Longest delay between retries, in seconds.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        limits: ModelLimits | dict[str, ModelLimits] | None = None,
+        max_retries: int = 5,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self.max_concurrency = max_concurrency
+        self.limits = limits or ModelLimits()
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._models: dict[str, _ModelState] = {}
+
+    def _model(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            if isinstance(self.limits, dict):
+                limits = self.limits.get(model, ModelLimits())
+            else:
+                limits = self.limits
+            state = self._models[model] = _ModelState(limits)
+        return state
+
+    async def create(self, fetch: Callable[..., Awaitable[Any]], **params: Any) -> Any:
+        """
+        Send a chat completion request once the model's budgets allow it, retrying failures.
+
+        Args:
+            fetch: Sends the request, e.g. `client.chat.completions.create`.
+            **params: The request's arguments, passed to `fetch`.
+
+        Returns:
+            The response.
+
+        Raises:
+            openai.APIError: The last error, if the request still fails after `max_retries` retries.
+        """
+        state = self._model(params["model"])
+        estimated_tokens = estimate_tokens(params)
+        for attempt in range(self.max_retries + 1):
+            await state.wait(estimated_tokens)
+            try:
+                async with self._semaphore:
+                    response = await fetch(**params)
+            except (RateLimitError, InternalServerError, APIConnectionError) as e:
+                # The request is charged against the token budget once: its retry takes
+                # the estimate again
+                state.refund(estimated_tokens)
+                if attempt == self.max_retries:
+                    raise
+                delay = retry_delay(e) or self._backoff(attempt)
+                logger.warning(
+                    "Request to '%s' failed (%s), retrying in %.1fs", params["model"], e, delay
+                )
+                if isinstance(e, RateLimitError):
+                    state.pause(delay)
+                else:
+                    await asyncio.sleep(delay)
+                continue
+
+            if state.tokens is not None:
+                usage = getattr(response, "usage", None)
+                if usage is not None and usage.total_tokens is not None:
+                    state.tokens.adjust(estimated_tokens - usage.total_tokens)
+            return response
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.initial_backoff * 2**attempt)
+        # Jittered, so that requests that failed together don't all retry together
+        return float(delay * random.uniform(0.5, 1.0))  # noqa: S311
+
+
+def estimate_tokens(params: dict[str, Any]) -> int:
+    """
+    Estimate the tokens a request will use, before its usage is known.
+
+    Counts the prompt (messages and tools) at roughly four characters per token,
+    plus `max_tokens` for the completion if the request sets it.
+    """
+    prompt = json.dumps([params.get("messages"), params.get("tools")], default=str)
+    return len(prompt) // _CHARS_PER_TOKEN + (params.get("max_tokens") or 0)
+
+
+def parse_duration(value: str) -> float | None:
+    """
+    Parse a duration in seconds ("2.5") or in the "1m30s" / "250ms" form of the
+    x-ratelimit-reset-* headers, in seconds.
+    """
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(number + unit for number, unit in parts) != value:
+        return None
+    return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+
+def retry_delay(error: Exception) -> float | None:
+    """
+    The delay a failed request's response asks for before retrying, in seconds.
+
+    Reads retry-after-ms and retry-after, then the x-ratelimit-reset-requests and
+    x-ratelimit-reset-tokens headers (taking the longer of the two).
+
+    Returns:
+        None if the response has no such headers
+    """
+    if not isinstance(error, APIStatusError):
+        return None
+    headers = error.response.headers
+    if retry_after_ms := headers.get("retry-after-ms"):
+        delay = parse_duration(retry_after_ms)
+        if delay is not None:
+            return delay / 1000
+    if retry_after := headers.get("retry-after"):
+        delay = parse_duration(retry_after)
+        if delay is not None:
+            return delay
+    resets = [
+        parse_duration(reset)
+        for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+        if (reset := headers.get(name))
+    ]
+    delays = [delay for delay in resets if delay is not None]
+    return max(delays) if delays else None
@@ -21,6 +21,7 @@ from arcade_serve.core.components import (
     HealthCheckComponent,
     WorkerComponent,
 )
+from arcade_serve.utils import LogPreview, LogSampler
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +57,9 @@ class BaseWorker(Worker):
         self.secret = self._set_secret(secret, disable_auth)
         self.environment = os.environ.get("ARCADE_ENVIRONMENT", "local")
 
+        # Per-call INFO logs are sampled (see ARCADE_LOG_SAMPLE_RATE); failures are always logged
+        self.call_log_sampler = LogSampler()
+
         self.tool_counter = None
         if otel_meter:
             self.tool_counter = otel_meter.create_counter(
@@ -123,10 +127,25 @@ class BaseWorker(Worker):
                 },
             )
         execution_id = tool_request.execution_id or ""
-        logger.info(
-            f"{execution_id} | Calling tool: {tool_fqname} version: {tool_request.tool.version}"
-        )
-        logger.debug(f"{execution_id} | Tool inputs: {tool_request.inputs}")
+        version = tool_request.tool.version
+        log_extra = {"execution_id": execution_id, "tool_name": tool_fqname.name}
+        log_call = logger.isEnabledFor(logging.INFO) and self.call_log_sampler.sample()
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        if log_call:
+            logger.info(
+                "%s | Calling tool: %s version: %s",
+                execution_id,
+                tool_fqname,
+                version,
+                extra=log_extra,
+            )
+        if log_debug:
+            logger.debug(
+                "%s | Tool inputs: %s",
+                execution_id,
+                LogPreview(tool_request.inputs),
+                extra=log_extra,
+            )
 
         tracer = trace.get_tracer(__name__)
         with tracer.start_as_current_span("RunTool"):
@@ -144,23 +163,43 @@ class BaseWorker(Worker):
 
         if output.error:
             logger.warning(
-                f"{execution_id} | Tool {tool_fqname} version {tool_request.tool.version} failed"
+                "%s | Tool %s version %s failed",
+                execution_id,
+                tool_fqname,
+                version,
+                extra=log_extra,
             )
-            logger.warning(f"{execution_id} | Tool error: {output.error.message}")
             logger.warning(
-                f"{execution_id} | Tool developer message: {output.error.developer_message}"
+                "%s | Tool error: %s", execution_id, output.error.message, extra=log_extra
             )
-            logger.debug(
-                f"{execution_id} | duration: {duration_ms}ms | Tool output: {output.value}"
+            logger.warning(
+                "%s | Tool developer message: %s",
+                execution_id,
+                output.error.developer_message,
+                extra=log_extra,
             )
-            if output.error.traceback_info:
-                logger.debug(f"{execution_id} | Tool traceback: {output.error.traceback_info}")
-        else:
+            if log_debug and output.error.traceback_info:
+                logger.debug(
+                    "%s | Tool traceback: %s",
+                    execution_id,
+                    output.error.traceback_info,
+                    extra=log_extra,
+                )
+        elif log_call:
             logger.info(
-                f"{execution_id} | Tool {tool_fqname} version {tool_request.tool.version} success"
+                "%s | Tool %s version %s success",
+                execution_id,
+                tool_fqname,
+                version,
+                extra=log_extra,
             )
+        if log_debug:
             logger.debug(
-                f"{execution_id} | duration: {duration_ms}ms | Tool output: {output.value}"
+                "%s | duration: %sms | Tool output: %s",
+                execution_id,
+                duration_ms,
+                LogPreview(output.value),
+                extra=log_extra,
             )
 
         return ToolCallResponse(
@@ -2,6 +2,24 @@
 MCP (Model Context Protocol) support for Arcade workers.
 """
 
-from arcade_serve.mcp.stdio import StdioServer
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["StdioServer"]
+if TYPE_CHECKING:
+    from arcade_serve.mcp.http import HTTPServer
+    from arcade_serve.mcp.stdio import StdioServer
+
+__all__ = ["HTTPServer", "StdioServer"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the servers lazily so that importing a submodule (e.g. the MCP types)
+    # doesn't load the whole MCP stack.
+    if name == "StdioServer":
+        from arcade_serve.mcp.stdio import StdioServer
+
+        return StdioServer
+    if name == "HTTPServer":
+        from arcade_serve.mcp.http import HTTPServer
+
+        return HTTPServer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import os
+import re
+import time
+from collections.abc import Awaitable
+from typing import Any, Callable
+
+logger = logging.getLogger("arcade.mcp")
+
+# Seconds a completed authorization is reused before the Engine is asked again
+AUTH_CACHE_TTL_SECONDS = float(os.getenv("ARCADE_MCP_AUTH_CACHE_TTL", "300"))
+
+AuthCacheKey = tuple[str, str, tuple[str, ...]]
+
+_UNAUTHORIZED_PATTERN = re.compile(r"\b401\b|unauthori[sz]ed", re.IGNORECASE)
+
+
+def auth_cache_key(auth_requirement: Any, user_id: str | None) -> AuthCacheKey:
+    """
+    The cache key for an authorization: the user, the provider and the scopes.
+
+    Args:
+        auth_requirement: The tool's AuthRequirement
+        user_id: The user the tool is called for
+    """
+    oauth2 = auth_requirement.get("oauth2") or {}
+    scopes = tuple(sorted(oauth2.get("scopes") or []))
+    return (user_id or "anonymous", str(auth_requirement.get("provider_id")), scopes)
+
+
+def is_unauthorized_error(error: Any) -> bool:
+    """
+    Whether a tool error looks like the provider rejected the token (HTTP 401).
+
+    Tool errors don't carry a status code, so this looks for "401" or "Unauthorized"
+    in the error's messages.
+    """
+    if error is None:
+        return False
+    text = f"{getattr(error, 'message', '')} {getattr(error, 'developer_message', '') or ''}"
+    return bool(_UNAUTHORIZED_PATTERN.search(text))
+
+
+class AuthorizationCache:
+    """
+    Caches completed authorizations so that repeat tool calls skip the round trip
+    to the Arcade Engine.
+
+    Only completed authorizations are cached; pending ones (the user still has to
+    authorize) are fetched again on the next call. Concurrent lookups of the same
+    key share a single request to the Engine.
+
+    Args:
+        ttl: Seconds an authorization is reused. The Engine's response doesn't say
+            when the token expires, so entries are also invalidated when a tool
+            fails with a 401 (see `invalidate`).
+    """
+
+    def __init__(self, ttl: float = AUTH_CACHE_TTL_SECONDS) -> None:
+        self.ttl = ttl
+        self._entries: dict[AuthCacheKey, tuple[float, Any]] = {}
+        self._in_flight: dict[AuthCacheKey, asyncio.Task] = {}
+
+    async def get_or_fetch(self, key: AuthCacheKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached authorization for `key`, or fetch it.
+
+        Args:
+            key: The key from `auth_cache_key`
+            fetch: Requests the authorization from the Engine
+
+        Returns:
+            The AuthorizationResponse
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, response = entry
+            if time.monotonic() < expires_at:
+                return response
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, fetch))
+            self._in_flight[key] = task
+        # Shielded so that one caller being cancelled doesn't fail the others
+        return await asyncio.shield(task)
+
+    async def _fetch(self, key: AuthCacheKey, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            response = await fetch()
+            if self.ttl > 0 and getattr(response, "status", None) == "completed":
+                self._entries[key] = (time.monotonic() + self.ttl, response)
+            return response
+        finally:
+            self._in_flight.pop(key, None)
+
+    def invalidate(self, key: AuthCacheKey) -> None:
+        """Forget the authorization for `key`, e.g. because its token was rejected."""
+        if self._entries.pop(key, None) is not None:
+            logger.debug("Invalidated cached authorization for %s", key[1])
+
+    def clear(self) -> None:
+        """Forget all cached authorizations."""
+        self._entries.clear()
@@ -1,10 +1,18 @@
 import json
 import logging
+from collections.abc import Hashable
 from enum import Enum
 from typing import Any
 
 from arcade_core.catalog import MaterializedTool
 
+from arcade_serve.mcp.result_store import (
+    LARGE_RESULT_CHARS,
+    RESULT_PREVIEW_CHARS,
+    ResultStore,
+    StoredResult,
+)
+
 # Type aliases for MCP types
 MCPTool = dict[str, Any]
 MCPTextContent = dict[str, Any]
@@ -140,7 +148,7 @@ def create_mcp_tool(tool: MaterializedTool) -> dict[str, Any] | None:  # noqa: C
             "annotations": annotations,
         }
 
-        logger.debug(f"Created tool definition for {name}")
+        logger.debug("Created tool definition for %s", name)
 
     except Exception:
         logger.exception(
@@ -150,21 +158,59 @@ def create_mcp_tool(tool: MaterializedTool) -> dict[str, Any] | None:  # noqa: C
     return tool_def
 
 
-def convert_to_mcp_content(value: Any) -> list[dict[str, Any]]:
+def convert_to_mcp_content(
+    value: Any,
+    result_store: ResultStore | None = None,
+    max_inline_chars: int | None = None,
+    name: str = "Tool result",
+    owner: Hashable | None = None,
+) -> list[dict[str, Any]]:
     """
     Convert a Python value to MCP-compatible content.
+
+    With a `result_store`, text longer than `max_inline_chars` isn't returned
+    inline: it is stored, and the content is a preview plus the URIs of the
+    resources the client can read the full text from, one chunk at a time. Text
+    too long for the store is returned inline.
+
+    Args:
+        value: The tool's result
+        result_store: Where to keep large results; without one, results are inline
+        max_inline_chars: The longest text returned inline (defaults to
+            ARCADE_MCP_LARGE_RESULT_CHARS)
+        name: The name given to the stored result's resources
+        owner: Who may read the stored result back, e.g. the client's connection
     """
     if value is None:
         return []
 
+    mime_type = "text/plain"
     if isinstance(value, (str, bool, int, float)):
-        return [{"type": "text", "text": str(value)}]
-
-    if isinstance(value, (dict, list)):
-        return [{"type": "text", "text": json.dumps(value)}]
-
-    # Default fallback
-    return [{"type": "text", "text": str(value)}]
+        text = str(value)
+    elif isinstance(value, (dict, list)):
+        text = json.dumps(value)
+        mime_type = "application/json"
+    else:
+        # Default fallback
+        text = str(value)
+
+    if max_inline_chars is None:
+        max_inline_chars = LARGE_RESULT_CHARS
+    if result_store is not None and len(text) > max_inline_chars:
+        stored = result_store.put(text, name, mime_type, owner)
+        if stored is not None:
+            return _large_result_content(stored, text)
+    return [{"type": "text", "text": text}]
+
+
+def _large_result_content(result: StoredResult, text: str) -> list[dict[str, Any]]:
+    """A preview of a stored result, and the resources its full text can be read from."""
+    uris = [resource["uri"] for resource in result.resources()]
+    notice = (
+        f"\n\n[Result truncated: {len(text):,} characters. The full result is available "
+        f"with resources/read, in {len(uris)} parts: {', '.join(uris)}]"
+    )
+    return [{"type": "text", "text": text[:RESULT_PREVIEW_CHARS] + notice}]
 
 
 def _map_type_to_json_schema_type(val_type: str) -> str:
@@ -0,0 +1,519 @@
+import asyncio
+import contextlib
+import hmac
+import json
+import logging
+import os
+import time
+import uuid
+from collections.abc import AsyncGenerator
+from typing import Any
+from urllib.parse import urlsplit
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+
+from arcade_serve.mcp.server import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_TOOLS_PAGE_SIZE,
+    MCPServer,
+)
+from arcade_serve.mcp.types import JSONRPCError, JSONRPCResponse
+
+logger = logging.getLogger("arcade.mcp")
+
+# Seconds a session can go without any request before it is closed
+SESSION_IDLE_TIMEOUT_SECONDS = float(os.getenv("ARCADE_MCP_SESSION_IDLE_TIMEOUT", "3600"))
+# Maximum number of undelivered messages kept for a session's event stream
+SESSION_EVENT_BUFFER_SIZE = int(os.getenv("ARCADE_MCP_SESSION_EVENT_BUFFER_SIZE", "1000"))
+# Seconds between keep-alive comments on an idle event stream
+SSE_KEEPALIVE_SECONDS = 15.0
+
+# Comma-separated browser origins allowed besides localhost, e.g. "https://app.example.com"
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ARCADE_MCP_ALLOWED_ORIGINS", "").split(",")
+    if origin.strip()
+]
+
+SESSION_ID_HEADER = "Mcp-Session-Id"
+USER_ID_HEADER = "Arcade-User-Id"
+
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+
+class HTTPSession:
+    """
+    One MCP client session served over HTTP.
+
+    Each session runs its own `MCPServer.run_connection`, fed with the messages the
+    client POSTs. A response is handed back to the POST request waiting for it; any
+    other server message (notifications, responses nobody waits for) goes to the
+    session's event stream.
+
+    Args:
+        session_id: The session ID sent to the client in the Mcp-Session-Id header.
+        user_id: The user the session's tool calls are authorized for, if known.
+    """
+
+    def __init__(self, session_id: str, user_id: str | None = None) -> None:
+        self.id = session_id
+        self.user_id = user_id
+        self.last_active = time.monotonic()
+        self.task: asyncio.Task | None = None
+        self._incoming: asyncio.Queue[str | None] = asyncio.Queue()
+        self._events: asyncio.Queue[str | None] = asyncio.Queue(maxsize=SESSION_EVENT_BUFFER_SIZE)
+        self._waiters: dict[Any, asyncio.Future[str | None]] = {}
+        self._closed = False
+        self._dropped_events = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def busy(self) -> bool:
+        """Whether a client is waiting for a response from this session."""
+        return bool(self._waiters)
+
+    async def read_stream(self) -> AsyncGenerator[str, None]:
+        """The client's messages, as read by `run_connection`."""
+        while (message := await self._incoming.get()) is not None:
+            yield message
+
+    async def send(self, message: str, request_id: Any = None) -> None:
+        """
+        Deliver a message from the server to the client.
+
+        Args:
+            message: The serialized message.
+            request_id: The id of the request this message responds to, if any.
+        """
+        waiter = self._waiters.pop(request_id, None) if request_id is not None else None
+        if waiter is not None:
+            if not waiter.done():
+                waiter.set_result(message.rstrip("\n"))
+            return
+        try:
+            self._events.put_nowait(message.rstrip("\n"))
+        except asyncio.QueueFull:
+            # Without an open event stream every notification is dropped: warn once
+            self._dropped_events += 1
+            log = logger.warning if self._dropped_events == 1 else logger.debug
+            log(
+                "Dropping message for MCP session %s: its event stream is full (%d dropped)",
+                self.id,
+                self._dropped_events,
+            )
+
+    async def post(self, message: str, request_id: Any = None) -> str | None:
+        """
+        Hand a client message to the session.
+
+        Args:
+            message: The serialized message.
+            request_id: The message's id, if it is a request. The response is then
+                awaited and returned.
+
+        Returns:
+            The response to the request, or None if it isn't a request or the request
+            was cancelled or the session closed before it completed.
+        """
+        self.last_active = time.monotonic()
+        if request_id is None:
+            await self._incoming.put(message)
+            return None
+
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._waiters[request_id] = future
+        try:
+            await self._incoming.put(message)
+            return await future
+        finally:
+            if self._waiters.get(request_id) is future:
+                del self._waiters[request_id]
+
+    def abandon(self, request_id: Any) -> None:
+        """Stop waiting for the response to a request, e.g. because it was cancelled."""
+        waiter = self._waiters.pop(request_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def events(self) -> AsyncGenerator[str, None]:
+        """Server-sent events carrying the messages not returned in an HTTP response."""
+        while not self._closed:
+            try:
+                message = await asyncio.wait_for(self._events.get(), SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if message is None:
+                break
+            yield _sse_event("message", message)
+
+    def close_nowait(self) -> None:
+        """Close the session and cancel its running requests, without waiting for them."""
+        if self._closed:
+            return
+        self._closed = True
+        for request_id in list(self._waiters):
+            self.abandon(request_id)
+        # If the buffer is full, events() stops at its next check of `closed`
+        with contextlib.suppress(asyncio.QueueFull):
+            self._events.put_nowait(None)
+        if self.task is not None:
+            self.task.cancel()
+
+    async def close(self) -> None:
+        """Close the session and wait for its running requests to be cancelled."""
+        self.close_nowait()
+        if self.task is not None:
+            await asyncio.gather(self.task, return_exceptions=True)
+
+
+class _Reply:
+    """A write stream that delivers a response to the HTTP request waiting for it."""
+
+    __slots__ = ("request_id", "session")
+
+    def __init__(self, session: HTTPSession, request_id: Any) -> None:
+        self.session = session
+        self.request_id = request_id
+
+    async def send(self, message: str) -> None:
+        await self.session.send(message, request_id=self.request_id)
+
+
+class HTTPServer(MCPServer):
+    """
+    MCP server that serves many concurrent client sessions over HTTP from one process.
+
+    All sessions share the server's tool catalog and its cached tool list, so toolkits
+    are imported and converted once per process instead of once per client. Each
+    session has its own connection state and user ID.
+
+    Two transports are mounted on a FastAPI app by `mount`:
+
+    - Streamable HTTP at `path`: POST a message to get its response back as JSON, GET
+      to open an event stream for server notifications, DELETE to end the session.
+    - HTTP+SSE (protocol version 2024-11-05) at `sse_path` and `messages_path`.
+
+    Requests must carry `secret` as a bearer token unless `disable_auth` is set. The
+    user of a session is taken from the Arcade-User-Id header (or the `user_id` query
+    parameter) of the request that opens it; without authentication, these are
+    ignored and the server's own user is used. Requests from a browser origin other
+    than localhost or `allowed_origins` are rejected, against DNS rebinding.
+    """
+
+    def __init__(
+        self,
+        tool_catalog: Any,
+        enable_logging: bool = True,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        tools_page_size: int = DEFAULT_TOOLS_PAGE_SIZE,
+        secret: str | None = None,
+        session_idle_timeout: float = SESSION_IDLE_TIMEOUT_SECONDS,
+        disable_auth: bool = False,
+        allowed_origins: list[str] | None = None,
+        **client_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Initialize the HTTP server.
+
+        Args:
+            tool_catalog: Catalog of available tools, shared by all sessions
+            enable_logging: Whether to add the MCP logging middleware
+            max_concurrent_requests: Maximum number of requests handled concurrently
+                per session
+            tools_page_size: Maximum number of tools returned by a tools/list request
+            secret: Requests must carry an `Authorization: Bearer <secret>` header
+            session_idle_timeout: Seconds without requests after which a session is closed
+            disable_auth: Accept requests without a bearer token. Not recommended when
+                the server is reachable by others.
+            allowed_origins: Browser origins allowed besides localhost (defaults to
+                ARCADE_MCP_ALLOWED_ORIGINS)
+            **client_kwargs: Additional arguments to pass to the AsyncArcade client
+
+        Raises:
+            ValueError: If there is no `secret` and `disable_auth` isn't set
+        """
+        if not secret and not disable_auth:
+            raise ValueError(
+                "No secret provided for the MCP HTTP server. Set the ARCADE_WORKER_SECRET "
+                "environment variable, or disable authentication with --no-auth."
+            )
+        super().__init__(
+            tool_catalog,
+            enable_logging,
+            max_concurrent_requests,
+            tools_page_size,
+            **client_kwargs,
+        )
+        self.secret = None if disable_auth else secret
+        self.session_idle_timeout = session_idle_timeout
+        self.allowed_origins = set(ALLOWED_ORIGINS if allowed_origins is None else allowed_origins)
+        if disable_auth:
+            logger.warning(
+                "MCP HTTP server is running without authentication. Not recommended when "
+                "it is reachable by others."
+            )
+        self.sessions: dict[str, HTTPSession] = {}
+        self._messages_path = "/messages"
+
+    def mount(
+        self,
+        app: FastAPI,
+        path: str = "/mcp",
+        sse_path: str = "/sse",
+        messages_path: str = "/messages",
+    ) -> None:
+        """
+        Add the MCP endpoints to a FastAPI app.
+
+        Args:
+            app: The app to add the endpoints to
+            path: The Streamable HTTP endpoint
+            sse_path: The HTTP+SSE event stream endpoint
+            messages_path: The HTTP+SSE endpoint clients POST messages to
+        """
+        self._messages_path = messages_path
+        app.add_api_route(path, self._handle_post, methods=["POST"], include_in_schema=False)
+        app.add_api_route(path, self._handle_get, methods=["GET"], include_in_schema=False)
+        app.add_api_route(path, self._handle_delete, methods=["DELETE"], include_in_schema=False)
+        app.add_api_route(sse_path, self._handle_sse, methods=["GET"], include_in_schema=False)
+        app.add_api_route(
+            messages_path, self._handle_sse_message, methods=["POST"], include_in_schema=False
+        )
+
+    async def shutdown(self) -> None:
+        """Close every session, then shut down the server."""
+        await asyncio.gather(*(session.close() for session in list(self.sessions.values())))
+        await super().shutdown()
+
+    async def _send_response(self, write_stream: Any, response: Any) -> None:
+        # Route responses straight to the HTTP request waiting for them, without
+        # parsing the serialized JSON to find the request id.
+        if isinstance(write_stream, HTTPSession) and isinstance(
+            response, (JSONRPCResponse, JSONRPCError)
+        ):
+            write_stream = _Reply(write_stream, response.id)
+        await super()._send_response(write_stream, response)
+
+    async def _open_session(self, request: Request) -> HTTPSession:
+        """Start a new session for the user the request names."""
+        await self._close_idle_sessions()
+
+        user_id = None
+        # The user a client names is only trusted from an authenticated client
+        if self.secret is not None:
+            user_id = request.headers.get(USER_ID_HEADER) or request.query_params.get("user_id")
+        session = HTTPSession(uuid.uuid4().hex, user_id)
+        init_options = {"user_id": user_id} if user_id else None
+        session.task = asyncio.create_task(
+            self.run_connection(session.read_stream(), session, init_options)
+        )
+        session.task.add_done_callback(lambda _: self.sessions.pop(session.id, None))
+        self.sessions[session.id] = session
+
+        logger.info("Opened MCP session %s (%d open)", session.id, len(self.sessions))
+        return session
+
+    async def _close_idle_sessions(self) -> None:
+        cutoff = time.monotonic() - self.session_idle_timeout
+        idle = [s for s in self.sessions.values() if s.last_active < cutoff and not s.busy]
+        for session in idle:
+            logger.info("Closing idle MCP session %s", session.id)
+            self.sessions.pop(session.id, None)
+            await session.close()
+
+    def _check_auth(self, request: Request) -> Response | None:
+        """
+        Return an error response if the request comes from a browser origin that isn't
+        allowed, or lacks the server's bearer token.
+        """
+        origin = request.headers.get("Origin")
+        if origin is not None and not self._origin_allowed(origin):
+            return _error_response(None, -32001, "Origin not allowed", status_code=403)
+        if self.secret is None:
+            return None
+        authorization = request.headers.get("Authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and hmac.compare_digest(token, self.secret):
+            return None
+        return _error_response(None, -32001, "Unauthorized", status_code=401)
+
+    def _origin_allowed(self, origin: str) -> bool:
+        if origin in self.allowed_origins:
+            return True
+        try:
+            return urlsplit(origin).hostname in _LOCAL_HOSTS
+        except ValueError:
+            return False
+
+    def _get_session(self, session_id: str | None) -> HTTPSession | Response:
+        if not session_id:
+            return _error_response(None, -32600, f"Missing {SESSION_ID_HEADER} header")
+        session = self.sessions.get(session_id)
+        if session is None or session.closed:
+            return _error_response(None, -32001, "Session not found", status_code=404)
+        return session
+
+    async def _handle_post(self, request: Request) -> Response:
+        """Streamable HTTP: handle a message POSTed by the client."""
+        if (denied := self._check_auth(request)) is not None:
+            return denied
+
+        body = (await request.body()).decode()
+        try:
+            message = json.loads(body)
+        except ValueError:
+            return _error_response(None, -32700, "Parse error")
+        if isinstance(message, list):
+            return await self._handle_batch_post(request, message)
+        if not isinstance(message, dict):
+            return _error_response(None, -32600, "Invalid request")
+
+        if message.get("method") == "initialize":
+            session: HTTPSession | Response = await self._open_session(request)
+        else:
+            session = self._get_session(request.headers.get(SESSION_ID_HEADER))
+        if isinstance(session, Response):
+            return session
+        headers = {SESSION_ID_HEADER: session.id}
+
+        _abandon_cancelled_request(session, message)
+        if "method" not in message or "id" not in message:
+            # Notifications and responses are accepted without a reply
+            await session.post(body)
+            return Response(status_code=202, headers=headers)
+
+        reply = await session.post(body, request_id=message["id"])
+        if reply is None:
+            return _error_response(
+                message["id"], -32800, "Request cancelled", status_code=200, headers=headers
+            )
+        return Response(reply, media_type="application/json", headers=headers)
+
+    async def _handle_batch_post(self, request: Request, batch: list[Any]) -> Response:
+        """
+        Streamable HTTP: handle a JSON-RPC batch.
+
+        Each message is handed to the session on its own, so the batch's requests run
+        concurrently; their responses are returned together as one JSON array.
+        """
+        if not batch:
+            return _error_response(None, -32600, "Invalid request")
+        session = self._get_session(request.headers.get(SESSION_ID_HEADER))
+        if isinstance(session, Response):
+            return session
+        headers = {SESSION_ID_HEADER: session.id}
+
+        async def post(message: Any) -> str | None:
+            if not isinstance(message, dict):
+                return _error_json(None, -32600, "Invalid request")
+            _abandon_cancelled_request(session, message)
+            if "method" not in message or "id" not in message:
+                await session.post(json.dumps(message))
+                return None
+            reply = await session.post(json.dumps(message), request_id=message["id"])
+            if reply is None:
+                return _error_json(message["id"], -32800, "Request cancelled")
+            return reply
+
+        replies = [r for r in await asyncio.gather(*(post(m) for m in batch)) if r is not None]
+        if not replies:
+            return Response(status_code=202, headers=headers)
+        return Response(
+            "[" + ",".join(replies) + "]", media_type="application/json", headers=headers
+        )
+
+    async def _handle_get(self, request: Request) -> Response:
+        """Streamable HTTP: open the session's event stream for server notifications."""
+        if (denied := self._check_auth(request)) is not None:
+            return denied
+        session = self._get_session(request.headers.get(SESSION_ID_HEADER))
+        if isinstance(session, Response):
+            return session
+        return _event_stream(session.events(), headers={SESSION_ID_HEADER: session.id})
+
+    async def _handle_delete(self, request: Request) -> Response:
+        """Streamable HTTP: end a session."""
+        if (denied := self._check_auth(request)) is not None:
+            return denied
+        session = self._get_session(request.headers.get(SESSION_ID_HEADER))
+        if isinstance(session, Response):
+            return session
+        self.sessions.pop(session.id, None)
+        await session.close()
+        logger.info("Closed MCP session %s", session.id)
+        return Response(status_code=204)
+
+    async def _handle_sse(self, request: Request) -> Response:
+        """HTTP+SSE: open a session whose messages are all sent on this event stream."""
+        if (denied := self._check_auth(request)) is not None:
+            return denied
+        session = await self._open_session(request)
+
+        async def stream() -> AsyncGenerator[str, None]:
+            try:
+                yield _sse_event("endpoint", f"{self._messages_path}?session_id={session.id}")
+                async for event in session.events():
+                    yield event
+            finally:
+                # The client disconnected: the session ends with its stream
+                self.sessions.pop(session.id, None)
+                session.close_nowait()
+
+        return _event_stream(stream())
+
+    async def _handle_sse_message(self, request: Request) -> Response:
+        """HTTP+SSE: accept a client message; the response is sent on the event stream."""
+        if (denied := self._check_auth(request)) is not None:
+            return denied
+        session = self._get_session(request.query_params.get("session_id"))
+        if isinstance(session, Response):
+            return session
+        await session.post((await request.body()).decode())
+        return Response(status_code=202)
+
+
+def _abandon_cancelled_request(session: HTTPSession, message: dict[str, Any]) -> None:
+    """If the message cancels a request, stop waiting for that request's response."""
+    params = message.get("params") or {}
+    if message.get("method") == "notifications/cancelled":
+        session.abandon(params.get("requestId"))
+    elif message.get("method") == "$/cancelRequest":
+        session.abandon(params.get("id", params.get("requestId")))
+
+
+def _sse_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _event_stream(
+    events: AsyncGenerator[str, None], headers: dict[str, str] | None = None
+) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", **(headers or {})},
+    )
+
+
+def _error_json(request_id: Any, code: int, message: str) -> str:
+    return JSONRPCError(id=request_id, error={"code": code, "message": message}).model_dump_json()
+
+
+def _error_response(
+    request_id: Any,
+    code: int,
+    message: str,
+    status_code: int = 400,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    return Response(
+        _error_json(request_id, code, message),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
@@ -1,4 +1,3 @@
-import json
 import logging
 import sys
 import time
@@ -10,6 +9,7 @@ from arcade_serve.mcp.types import (
     JSONRPCResponse,
     MCPMessage,
 )
+from arcade_serve.utils import LOG_SAMPLE_RATE, LogPreview, LogSampler
 
 logger = logging.getLogger("arcade.mcp")
 
@@ -28,6 +28,7 @@ class MCPLoggingMiddleware:
         log_errors: bool = True,
         min_duration_to_log_ms: int = 0,
         stdio_mode: bool = False,
+        sample_rate: float = LOG_SAMPLE_RATE,
     ) -> None:
         """
         Initialize the MCP logging middleware.
@@ -39,12 +40,15 @@ class MCPLoggingMiddleware:
             log_errors: Whether to log errors at ERROR level (default: True).
             min_duration_to_log_ms: Minimum duration in ms to log (0 logs all).
             stdio_mode: Whether running in stdio mode (redirects logs to stderr).
+            sample_rate: Fraction of requests whose request/response are logged (errors are
+                always logged).
         """
         self.log_level = getattr(logging, log_level.upper())
         self.log_request_body = log_request_body
         self.log_response_body = log_response_body
         self.log_errors = log_errors
         self.min_duration_to_log_ms = min_duration_to_log_ms
+        self.sampler = LogSampler(sample_rate)
         self.request_log_format = "[MCP>] {method}{params_str} (id: {id})"
         self.response_log_format = "[MCP<] {method} completed in {duration:.2f}ms (id: {id})"
         self.error_log_format = "[MCP!] {method} error: {error} (id: {id})"
@@ -54,7 +58,7 @@ class MCPLoggingMiddleware:
             self._redirect_logs_to_stderr()
 
         # Log that middleware is initialized
-        logger.debug(f"MCP logging middleware initialized (level: {log_level})")
+        logger.debug("MCP logging middleware initialized (level: %s)", log_level)
 
     def _redirect_logs_to_stderr(self) -> None:
         """Redirect MCP logs to stderr to avoid interfering with stdio communication."""
@@ -95,13 +99,18 @@ class MCPLoggingMiddleware:
         Log an MCP request message.
         """
         if not isinstance(message, JSONRPCRequest):
-            logger.debug(f"Ignoring non-request message: {type(message).__name__}")
+            logger.debug("Ignoring non-request message: %s", type(message).__name__)
             return
 
         try:
             # Store request start time for duration calculation
             message._mcp_start_time = time.time()  # type: ignore[attr-defined]
 
+            # Sampled-out requests aren't logged; their responses are skipped too
+            if not logger.isEnabledFor(self.log_level) or not self.sampler.sample():
+                message._mcp_log_skipped = True  # type: ignore[attr-defined]
+                return
+
             # Format parameters for logging
             params_str = ""
             if self.log_request_body and hasattr(message, "params") and message.params is not None:
@@ -120,28 +129,30 @@ class MCPLoggingMiddleware:
         Log an MCP response message.
         """
         if not isinstance(message, (JSONRPCResponse, JSONRPCError)):
-            logger.debug(f"Ignoring non-response message: {type(message).__name__}")
+            logger.debug("Ignoring non-response message: %s", type(message).__name__)
+            return
+
+        is_error = getattr(message, "error", None) is not None
+        request = getattr(message, "_request", None)
+        if not is_error and (
+            not logger.isEnabledFor(self.log_level)
+            or getattr(request or message, "_mcp_log_skipped", False)
+        ):
             return
 
         try:
             # Calculate request duration if we have the start time
             duration_ms = 0
-            request = getattr(message, "_request", None)
-            if request:
-                start_time = getattr(request, "_mcp_start_time", None)
-                if start_time:
-                    duration_ms = (time.time() - start_time) * 1000
-            else:
-                start_time = getattr(message, "_mcp_start_time", None)
-                if start_time:
-                    duration_ms = (time.time() - start_time) * 1000
+            start_time = getattr(request or message, "_mcp_start_time", None)
+            if start_time:
+                duration_ms = (time.time() - start_time) * 1000
 
             # Skip if below minimum duration threshold
             if self.min_duration_to_log_ms > 0 and duration_ms < self.min_duration_to_log_ms:
                 return
 
             # Handle error responses
-            if hasattr(message, "error") and message.error is not None:
+            if is_error:
                 if self.log_errors:
                     error_msg = self.error_log_format.format(
                         method=getattr(message, "method", "unknown"),
@@ -172,27 +183,23 @@ class MCPLoggingMiddleware:
         Format parameters for logging.
         """
         try:
-            if isinstance(params, dict):
-                # Handle common MCP params specially
-                if "name" in params and "arguments" in params:
-                    return f"{params['name']}({json.dumps(params.get('arguments', {}))})"
-                return json.dumps(params)
-            return str(params)
+            # Handle common MCP params specially
+            if isinstance(params, dict) and "name" in params and "arguments" in params:
+                return f"{params['name']}({LogPreview(params.get('arguments', {}))})"
+            return str(LogPreview(params))
         except Exception:
-            logger.debug(f"Error formatting params {params!s}")
-            return str(params)
+            logger.debug("Error formatting params", exc_info=True)
+            return "<unformattable params>"
 
     def _format_result(self, result: Any) -> str:
         """
         Format result for logging.
         """
         try:
-            if isinstance(result, dict):
-                return json.dumps(result)
-            return str(result)
-        except Exception as e:
-            logger.debug(f"Error formatting result {e!s}")
-            return str(result)
+            return str(LogPreview(result))
+        except Exception:
+            logger.debug("Error formatting result", exc_info=True)
+            return "<unformattable result>"
 
 
 def create_mcp_logging_middleware(**config: Any) -> MCPLoggingMiddleware:
@@ -212,4 +219,5 @@ def create_mcp_logging_middleware(**config: Any) -> MCPLoggingMiddleware:
         log_errors=config.get("log_errors", True),
         min_duration_to_log_ms=config.get("min_duration_to_log_ms", 0),
         stdio_mode=config.get("stdio_mode", False),
+        sample_rate=config.get("sample_rate", LOG_SAMPLE_RATE),
     )
@@ -3,7 +3,10 @@ import json
 import logging
 from typing import Any, Callable, TypeVar
 
-from arcade_serve.mcp.types import InitializeRequest, JSONRPCRequest, MCPMessage
+from pydantic import ValidationError
+
+from arcade_serve.mcp.types import REQUEST_TYPES, JSONRPCRequest, MCPMessage
+from arcade_serve.utils import LogPreview
 
 logger = logging.getLogger("arcade.mcp")
 
@@ -13,57 +16,80 @@ T = TypeVar("T")
 MessageProcessor = Callable[[Any, str], Any]
 
 
+def to_message(parsed: dict[str, Any]) -> Any:
+    """
+    Convert a decoded JSON-RPC message to the request type for its method.
+
+    Notifications and other messages without an id are kept as dicts, to avoid
+    validation errors on notifications the server doesn't know.
+    """
+    method = parsed.get("method")
+    if not isinstance(method, str) or method.startswith("notifications/") or "id" not in parsed:
+        return parsed
+    request_type = REQUEST_TYPES.get(method, JSONRPCRequest)
+    try:
+        return request_type.model_validate(parsed)
+    except ValidationError:
+        # Let the handler report what's wrong with the request
+        logger.debug("Request does not match %s: %s", request_type.__name__, method)
+        return JSONRPCRequest.model_validate(parsed)
+
+
+def decode_message(message: str | bytes) -> Any:
+    """
+    Decode a serialized message into its typed model, in one pass.
+
+    Returns:
+        The decoded message, None for a blank line, or the message unchanged if it
+        isn't valid JSON
+    """
+    try:
+        parsed = json.loads(message)
+    except json.JSONDecodeError:
+        if not message.strip():
+            return None
+        logger.warning("Failed to parse message as JSON: %s", LogPreview(message, 100))
+        return message
+    return to_message(parsed) if isinstance(parsed, dict) else parsed
+
+
 class MCPMessageProcessor:
     """
     Processes MCP messages through a chain of middleware.
     Supports both synchronous and asynchronous middleware.
+
+    Whether each middleware is a coroutine function is checked once, when it is
+    added, rather than for every message.
     """
 
     def __init__(self) -> None:
         self.middleware: list[Callable[[MCPMessage, str], Any]] = []
+        self._chain: list[tuple[Callable[[MCPMessage, str], Any], bool]] = []
 
     def add_middleware(self, mw: Callable[[MCPMessage, str], Any]) -> None:
         self.middleware.append(mw)
+        # Middleware objects may have an async __call__
+        is_async = inspect.iscoroutinefunction(mw) or inspect.iscoroutinefunction(type(mw).__call__)
+        self._chain.append((mw, is_async))
 
-    async def process(self, message: Any, direction: str) -> Any:  # noqa: C901
-        # First, try to parse the message if it's a string
-        if isinstance(message, str):
-            # Strip any whitespace including newlines
-            message = message.strip()
-            if not message:
-                return None
-
-            try:
-                parsed = json.loads(message)
-                if isinstance(parsed, dict):
-                    method = parsed.get("method")
-                    # Convert to appropriate message type
-                    if method == "initialize" and "id" in parsed:
-                        logger.debug(f"Parsed initialize request: {parsed}")
-                        message = InitializeRequest(**parsed)
-                    elif method and method.startswith("notifications/"):
-                        # It's a notification, log it but pass through as dict
-                        logger.debug(f"Received notification: {method}")
-                        # Keep as parsed dict to avoid validation errors on unknown notifications
-                        message = parsed
-                    elif "method" in parsed and "id" in parsed:
-                        # Regular method request
-                        logger.debug(f"Parsed method request: {method}")
-                        message = JSONRPCRequest(**parsed)
-                    # Other message types can be handled similarly
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse message as JSON: {message[:100]}...")
-            except Exception:
-                logger.exception("Error processing message")
+    async def process(self, message: Any, direction: str) -> Any:
+        # Decode serialized messages; dicts are already-decoded messages, e.g. one
+        # entry of a batch
+        try:
+            if isinstance(message, (str, bytes)):
+                message = decode_message(message)
+                if message is None:
+                    return None
+            elif isinstance(message, dict):
+                message = to_message(message)
+        except Exception:
+            logger.exception("Error processing message")
 
         # Process through middleware chain
         result = message
-        for mw in self.middleware:
+        for mw, is_async in self._chain:
             try:
-                if inspect.iscoroutinefunction(mw):
-                    result = await mw(result, direction)
-                else:
-                    result = mw(result, direction)
+                result = await mw(result, direction) if is_async else mw(result, direction)
             except Exception:
                 logger.exception(f"Error in middleware {mw}")
         return result
@@ -0,0 +1,70 @@
+import logging
+import os
+import time
+from collections.abc import Awaitable
+from typing import Any, Callable
+
+from arcade_serve.mcp.types import ProgressToken, ToolProgressNotification
+
+logger = logging.getLogger("arcade.mcp")
+
+# Minimum number of seconds between two progress notifications for the same request
+PROGRESS_MIN_INTERVAL_SECONDS = float(os.getenv("ARCADE_MCP_PROGRESS_MIN_INTERVAL", "0.5"))
+
+
+class ThrottledProgressReporter:
+    """
+    Sends a tool's progress updates to the client as `notifications/progress` messages.
+
+    Updates arriving less than `min_interval` seconds after the last one sent are
+    dropped, so a tool can report progress in a tight loop without flooding the
+    stream. The update that completes the work (progress >= total) is always sent.
+
+    Args:
+        progress_token: The progressToken the client sent with its request.
+        send: Sends a message to the client.
+        min_interval: Minimum number of seconds between two notifications.
+    """
+
+    def __init__(
+        self,
+        progress_token: ProgressToken,
+        send: Callable[[Any], Awaitable[None]],
+        min_interval: float = PROGRESS_MIN_INTERVAL_SECONDS,
+    ) -> None:
+        self.progress_token = progress_token
+        self.min_interval = min_interval
+        self._send = send
+        self._last_sent_at: float | None = None
+        self._last_progress: float | None = None
+
+    async def __call__(
+        self, progress: float, total: float | None = None, message: str | None = None
+    ) -> None:
+        # MCP requires progress to increase with every notification
+        if self._last_progress is not None and progress <= self._last_progress:
+            return
+
+        now = time.monotonic()
+        finished = total is not None and progress >= total
+        if (
+            not finished
+            and self._last_sent_at is not None
+            and now - self._last_sent_at < self.min_interval
+        ):
+            return
+
+        self._last_sent_at = now
+        self._last_progress = progress
+
+        params: dict[str, Any] = {"progressToken": self.progress_token, "progress": progress}
+        if total is not None:
+            params["total"] = total
+        if message is not None:
+            params["message"] = message
+
+        try:
+            await self._send(ToolProgressNotification(params=params))
+        except Exception:
+            # A client that can't receive progress shouldn't make the tool fail
+            logger.debug("Error sending progress notification", exc_info=True)
@@ -0,0 +1,175 @@
+import logging
+import os
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+logger = logging.getLogger("arcade.mcp")
+
+# Tool results longer than this many characters are stored and returned as resources
+LARGE_RESULT_CHARS = int(os.getenv("ARCADE_MCP_LARGE_RESULT_CHARS", str(1024 * 1024)))
+# Characters in each resource a stored result is split into
+RESULT_CHUNK_CHARS = int(os.getenv("ARCADE_MCP_RESULT_CHUNK_CHARS", str(256 * 1024)))
+# Characters of a large result shown inline, ahead of the resource URIs
+RESULT_PREVIEW_CHARS = int(os.getenv("ARCADE_MCP_RESULT_PREVIEW_CHARS", "2000"))
+# Seconds a stored result can be read
+RESULT_TTL_SECONDS = float(os.getenv("ARCADE_MCP_RESULT_TTL", "600"))
+# Total characters kept across stored results; the oldest are dropped beyond it
+RESULT_STORE_MAX_CHARS = int(os.getenv("ARCADE_MCP_RESULT_STORE_MAX_CHARS", str(256 * 1024 * 1024)))
+
+RESULT_URI_PREFIX = "arcade://results/"
+
+
+class StoredResult:
+    """A large tool result, readable in chunks as the resources `<uri prefix><id>/<index>`."""
+
+    __slots__ = ("chunk_chars", "expires_at", "id", "mime_type", "name", "owner", "text")
+
+    def __init__(
+        self,
+        text: str,
+        name: str,
+        mime_type: str,
+        chunk_chars: int,
+        expires_at: float,
+        owner: Hashable | None = None,
+    ) -> None:
+        self.id = uuid.uuid4().hex
+        self.text = text
+        self.name = name
+        self.mime_type = mime_type
+        self.chunk_chars = chunk_chars
+        self.expires_at = expires_at
+        self.owner = owner
+
+    @property
+    def chunk_count(self) -> int:
+        return max(-(-len(self.text) // self.chunk_chars), 1)
+
+    def uri(self, index: int) -> str:
+        return f"{RESULT_URI_PREFIX}{self.id}/{index}"
+
+    def chunk(self, index: int) -> str:
+        start = index * self.chunk_chars
+        return self.text[start : start + self.chunk_chars]
+
+    def resources(self) -> list[dict[str, Any]]:
+        """The result's chunks, as entries of a resources/list result."""
+        count = self.chunk_count
+        return [
+            {
+                "uri": self.uri(index),
+                "name": f"{self.name} (part {index + 1} of {count})",
+                "mimeType": self.mime_type,
+            }
+            for index in range(count)
+        ]
+
+
+class ResultStore:
+    """
+    Keeps large tool results so that clients can read them in chunks with
+    resources/read, instead of receiving them inline in the tools/call response.
+
+    Results are dropped after `ttl` seconds, or oldest first once the stored
+    results exceed `max_chars` in total. Each result belongs to an owner, e.g. the
+    connection it was returned on, and can only be listed and read by that owner.
+
+    Args:
+        chunk_chars: Characters in each chunk
+        ttl: Seconds a result can be read
+        max_chars: Total characters kept across results
+    """
+
+    def __init__(
+        self,
+        chunk_chars: int = RESULT_CHUNK_CHARS,
+        ttl: float = RESULT_TTL_SECONDS,
+        max_chars: int = RESULT_STORE_MAX_CHARS,
+    ) -> None:
+        if chunk_chars < 1:
+            raise ValueError("chunk_chars must be at least 1")
+        self.chunk_chars = chunk_chars
+        self.ttl = ttl
+        self.max_chars = max_chars
+        self._results: OrderedDict[str, StoredResult] = OrderedDict()
+        self._total_chars = 0
+
+    def put(
+        self,
+        text: str,
+        name: str = "Tool result",
+        mime_type: str = "text/plain",
+        owner: Hashable | None = None,
+    ) -> StoredResult | None:
+        """
+        Store a result for an owner and return it.
+
+        Returns:
+            None if the result is longer than `max_chars` on its own, in which case
+            it isn't stored and the other results are kept
+        """
+        if len(text) > self.max_chars:
+            logger.warning(
+                "Tool result of %d characters exceeds the result store's limit of %d",
+                len(text),
+                self.max_chars,
+            )
+            return None
+        self._evict(time.monotonic(), incoming=len(text))
+        expires_at = time.monotonic() + self.ttl
+        result = StoredResult(text, name, mime_type, self.chunk_chars, expires_at, owner)
+        self._results[result.id] = result
+        self._total_chars += len(text)
+        return result
+
+    def read(self, uri: str, owner: Hashable | None = None) -> tuple[StoredResult, str] | None:
+        """
+        Return the stored result a resource URI belongs to, and the URI's chunk.
+
+        Returns:
+            None if the URI isn't a chunk of a result stored for `owner`, or the
+            result expired
+        """
+        if not uri.startswith(RESULT_URI_PREFIX):
+            return None
+        result_id, _, index = uri[len(RESULT_URI_PREFIX) :].partition("/")
+        result = self._results.get(result_id)
+        if result is None or result.owner != owner:
+            return None
+        if not index.isdigit() or int(index) >= result.chunk_count:
+            return None
+        if time.monotonic() >= result.expires_at:
+            self._remove(result_id)
+            return None
+        return result, result.chunk(int(index))
+
+    def resources(self, owner: Hashable | None = None) -> list[dict[str, Any]]:
+        """The chunks of the results stored for `owner`, as entries of a resources/list result."""
+        self._evict(time.monotonic())
+        return [
+            resource
+            for result in self._results.values()
+            if result.owner == owner
+            for resource in result.resources()
+        ]
+
+    def drop(self, owner: Hashable | None) -> None:
+        """Drop the results stored for `owner`, e.g. once its connection closes."""
+        for result_id, result in list(self._results.items()):
+            if result.owner == owner:
+                self._remove(result_id)
+
+    def _evict(self, now: float, incoming: int = 0) -> None:
+        for result_id, result in list(self._results.items()):
+            if result.expires_at > now and self._total_chars + incoming <= self.max_chars:
+                break
+            self._remove(result_id)
+
+    def _remove(self, result_id: str) -> None:
+        result = self._results.pop(result_id, None)
+        if result is not None:
+            self._total_chars -= len(result.text)
+            logger.debug("Dropped stored tool result %s", result_id)
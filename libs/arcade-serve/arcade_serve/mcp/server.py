@@ -1,7 +1,13 @@
 import asyncio
+import base64
+import binascii
+import functools
+import json
 import logging
 import os
+import re
 import uuid
+from collections.abc import Awaitable
 from enum import Enum
 from typing import Any, Callable, Union
 
@@ -12,10 +18,22 @@ from arcadepy import ArcadeError, AsyncArcade
 from arcadepy.types.auth_authorize_params import AuthRequirement, AuthRequirementOauth2
 from arcadepy.types.shared import AuthorizationResponse
 
+from arcade_serve.mcp.auth_cache import (
+    AuthorizationCache,
+    auth_cache_key,
+    is_unauthorized_error,
+)
 from arcade_serve.mcp.convert import convert_to_mcp_content, create_mcp_tool
 from arcade_serve.mcp.logging import create_mcp_logging_middleware
 from arcade_serve.mcp.message_processor import MCPMessageProcessor, create_message_processor
+from arcade_serve.mcp.progress import ThrottledProgressReporter
+from arcade_serve.mcp.result_store import ResultStore
 from arcade_serve.mcp.types import (
+    INTERNAL_ERROR,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    RESOURCE_NOT_FOUND,
     CallToolRequest,
     CallToolResponse,
     CallToolResult,
@@ -24,7 +42,9 @@ from arcade_serve.mcp.types import (
     InitializeRequest,
     InitializeResponse,
     InitializeResult,
+    JSONRPCBatchResponse,
     JSONRPCError,
+    JSONRPCRequest,
     JSONRPCResponse,
     ListPromptsRequest,
     ListPromptsResponse,
@@ -36,16 +56,100 @@ from arcade_serve.mcp.types import (
     PingRequest,
     PingResponse,
     ProgressNotification,
+    ReadResourceRequest,
+    ReadResourceResponse,
     ServerCapabilities,
     ShutdownRequest,
     ShutdownResponse,
     Tool,
+    ToolListChangedNotification,
 )
+from arcade_serve.utils import LogPreview, LogSampler
 
 logger = logging.getLogger("arcade.mcp")
 
 MCP_PROTOCOL_VERSION = "2024-11-05"
 
+# Maximum number of requests handled at the same time on a single connection
+DEFAULT_MAX_CONCURRENT_REQUESTS = int(os.getenv("ARCADE_MCP_MAX_CONCURRENT_REQUESTS", "32"))
+# Maximum number of tools in a tools/list page (0 returns every tool in one response)
+DEFAULT_TOOLS_PAGE_SIZE = int(os.getenv("ARCADE_MCP_TOOLS_PAGE_SIZE", "0"))
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a tools/list cursor is malformed or refers to an outdated tool list."""
+
+
+_BATCH_START = re.compile(r"\s*\[")
+_BATCH_START_BYTES = re.compile(rb"\s*\[")
+
+
+def _is_batch(message: Any) -> bool:
+    """Whether a raw incoming message is a JSON-RPC batch (a JSON array)."""
+    if isinstance(message, list):
+        return True
+    if isinstance(message, str):
+        return _BATCH_START.match(message) is not None
+    if isinstance(message, bytes):
+        return _BATCH_START_BYTES.match(message) is not None
+    return False
+
+
+def _encode_cursor(revision: int | None, offset: int) -> str:
+    """Encode a position in the tool list as an opaque cursor."""
+    raw = json.dumps([revision, offset], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: Any) -> tuple[int | None, int]:
+    """Decode a cursor created by `_encode_cursor` into a (revision, offset) pair."""
+    if not isinstance(cursor, str):
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    try:
+        revision, offset = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(offset, int) or offset < 0:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    if revision is not None and not isinstance(revision, int):
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return revision, offset
+
+
+def _internal_error(message: Any) -> JSONRPCError | None:
+    """
+    The error response to a request whose handler failed, or None if the raw message
+    isn't a single request (e.g. a notification, or unparseable).
+    """
+    if isinstance(message, (str, bytes)):
+        try:
+            message = json.loads(message)
+        except ValueError:
+            return None
+    if not isinstance(message, dict) or "method" not in message or message.get("id") is None:
+        return None
+    return JSONRPCError(
+        id=message["id"], error={"code": INTERNAL_ERROR, "message": "Internal error"}
+    )
+
+
+async def _cancel_tasks(tasks: set[asyncio.Task]) -> None:
+    """Cancel the given tasks and wait for them to finish."""
+    for task in list(tasks):
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _run_in_thread(func: Callable) -> Callable:
+    """
+    Make a sync tool function awaitable by running it in a worker thread, so that it
+    doesn't block the event loop. Async tool functions are returned unchanged.
+    """
+    if asyncio.iscoroutinefunction(func):
+        return func
+    return functools.partial(asyncio.to_thread, func)
+
 
 class MessageMethod(str, Enum):
     """Enumeration of supported MCP message methods"""
@@ -58,9 +162,20 @@ class MessageMethod(str, Enum):
     CANCEL = "$/cancelRequest"
     SHUTDOWN = "shutdown"
     LIST_RESOURCES = "resources/list"
+    READ_RESOURCE = "resources/read"
     LIST_PROMPTS = "prompts/list"
 
 
+# Methods whose handlers only act on the connection the request arrived on:
+# cancellations apply to its own requests, and stored results can only be listed
+# and read on the connection they were returned on
+_CONNECTION_SCOPED_METHODS = frozenset({
+    MessageMethod.CANCEL,
+    MessageMethod.LIST_RESOURCES,
+    MessageMethod.READ_RESOURCE,
+})
+
+
 class MCPServer:
     """
     Unified async MCP server that manages connections, middleware, and tool invocation.
@@ -71,6 +186,8 @@ class MCPServer:
         self,
         tool_catalog: Any,
         enable_logging: bool = True,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        tools_page_size: int = DEFAULT_TOOLS_PAGE_SIZE,
         **client_kwargs: dict[str, Any],
     ) -> None:
         """
@@ -78,9 +195,20 @@ class MCPServer:
 
         Args:
             tool_catalog: Catalog of available tools
+            enable_logging: Whether to add the MCP logging middleware
+            max_concurrent_requests: Maximum number of requests handled concurrently on
+                a connection. Further messages are not read until a request completes.
+            tools_page_size: Maximum number of tools returned by a tools/list request.
+                Larger catalogs are paginated with `nextCursor`. 0 disables pagination.
             **client_kwargs: Additional arguments to pass to the AsyncArcade client
         """
+        if max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be at least 1")
+        if tools_page_size < 0:
+            raise ValueError("tools_page_size must not be negative")
         self.tool_catalog: ToolCatalog = tool_catalog
+        self.max_concurrent_requests = max_concurrent_requests
+        self.tools_page_size = tools_page_size
         self.message_processor: MCPMessageProcessor = create_message_processor()
 
         # Pop middleware_config from client_kwargs regardless of logging state,
@@ -96,6 +224,23 @@ class MCPServer:
             )
 
         self._shutdown: bool = False
+
+        # The tools/list result is built once and reused until the catalog changes
+        self._tool_list_cache: tuple[int, ListToolsResult] | None = None
+        # Pages of the cached tool list, keyed by offset
+        self._tool_list_pages: dict[int, ListToolsResult] = {}
+        self._announced_catalog_revision = self._catalog_revision()
+        # Running tools/call requests by connection and JSON-RPC id, so they can be cancelled
+        self._tool_call_tasks: dict[tuple[Any, Any], asyncio.Task] = {}
+        # Senders of the open connections, used to push notifications to clients
+        self._connections: set[Callable[[Any], Awaitable[None]]] = set()
+        # Completed authorizations, reused across tool calls until they expire
+        self.authorization_cache = AuthorizationCache()
+        # Large tool results, which clients read in chunks as resources on the
+        # connection the results were returned on
+        self.result_store = ResultStore()
+        # Per-call INFO logs are sampled (see ARCADE_LOG_SAMPLE_RATE); errors are always logged
+        self.call_log_sampler = LogSampler()
         # Initialize AsyncArcade with the *remaining* client_kwargs
         self.arcade = AsyncArcade(**client_kwargs)  # type: ignore[arg-type]
 
@@ -109,6 +254,7 @@ class MCPServer:
             MessageMethod.CANCEL: self._handle_cancel,
             MessageMethod.SHUTDOWN: self._handle_shutdown,
             MessageMethod.LIST_RESOURCES: self._handle_list_resources,
+            MessageMethod.READ_RESOURCE: self._handle_read_resource,
             MessageMethod.LIST_PROMPTS: self._handle_list_prompts,
         }
 
@@ -121,6 +267,13 @@ class MCPServer:
         """
         Handle a single MCP connection (SSE or stdio).
 
+        Each incoming message is handled in its own task, and sync tools run in worker
+        threads, so a slow tool call doesn't hold up pings, tool listings or other tool
+        calls on the same connection. At most `max_concurrent_requests` messages are
+        handled at once; beyond that, reading pauses until a request completes.
+        Responses are written one at a time, as their requests complete, and are
+        matched to requests by their JSON-RPC id.
+
         Args:
             read_stream: Async iterable yielding incoming messages.
             write_stream: Object with an async send(message) method.
@@ -129,23 +282,83 @@ class MCPServer:
         # Generate a user ID if possible
         user_id = self._get_user_id(init_options)
 
-        try:
-            logger.info(f"Starting MCP connection for user {user_id}")
+        slots = asyncio.Semaphore(self.max_concurrent_requests)
+        write_lock = asyncio.Lock()
+        pending: set[asyncio.Task] = set()
 
-            async for message in read_stream:
-                # Process the message
-                response = await self.handle_message(message, user_id=user_id)
+        async def send(message: Any) -> None:
+            async with write_lock:
+                await self._send_response(write_stream, message)
+
+        async def process(message: Any) -> None:
+            try:
+                try:
+                    response = await self.handle_message(message, user_id=user_id, send=send)
+                except Exception:
+                    logger.exception("Error handling message")
+                    # Answer the request anyway, so the client isn't left waiting for it
+                    response = _internal_error(message)
 
                 # Skip sending responses for None (e.g., notifications)
-                if response is None:
-                    continue
+                if response is not None:
+                    await send(response)
 
-                await self._send_response(write_stream, response)
+                await self._notify_if_tool_list_changed()
+            except Exception:
+                logger.exception("Error sending response")
+            finally:
+                slots.release()
+
+        self._connections.add(send)
+        try:
+            logger.info("Starting MCP connection for user %s", user_id)
+
+            async for message in read_stream:
+                await slots.acquire()
+                task = asyncio.create_task(process(message))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            # The client closed its end: finish the requests that are still running
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
         except asyncio.CancelledError:
             logger.info("Connection cancelled")
         except Exception:
             logger.exception("Error in connection")
+        finally:
+            self._connections.discard(send)
+            await _cancel_tasks(pending)
+            # Only this connection could read its stored results
+            self.result_store.drop(send)
+
+    def _catalog_revision(self) -> int | None:
+        """The catalog's revision, or None if the catalog doesn't track changes."""
+        return getattr(self.tool_catalog, "revision", None)
+
+    async def _notify_if_tool_list_changed(self) -> None:
+        if self._catalog_revision() != self._announced_catalog_revision:
+            await self.notify_tool_list_changed()
+
+    async def notify_tool_list_changed(self) -> None:
+        """
+        Drop the cached tool list and send `notifications/tools/list_changed` to every
+        open connection, so clients fetch the new list.
+
+        This is called automatically when the catalog's revision changes while a
+        connection is open; call it directly after changing the tools in another way.
+        """
+        self._tool_list_cache = None
+        self._tool_list_pages = {}
+        self._announced_catalog_revision = self._catalog_revision()
+
+        notification = ToolListChangedNotification()
+        for send in list(self._connections):
+            try:
+                await send(notification)
+            except Exception:
+                logger.exception("Error sending tools/list_changed notification")
 
     def _get_user_id(self, init_options: Any) -> str:
         """
@@ -157,6 +370,10 @@ class MCPServer:
         Returns:
             A user ID string
         """
+        # A user ID given for this connection (e.g. by an HTTP session) comes first
+        if isinstance(init_options, dict) and init_options.get("user_id"):
+            return str(init_options["user_id"])
+
         try:
             from arcade_core.config import config
 
@@ -169,10 +386,6 @@ class MCPServer:
         fallback = str(uuid.uuid4())
         if os.environ.get("ARCADE_USER_ID", None):
             return os.environ.get("ARCADE_USER_ID", fallback)
-        elif isinstance(init_options, dict):
-            user_id = init_options.get("user_id")
-            if user_id:
-                return str(user_id)
         # Fallback to random UUID
         return str(fallback)
 
@@ -191,7 +404,8 @@ class MCPServer:
             # Ensure it ends with a newline for JSON-RPC-over-stdio
             if not json_response.endswith("\n"):
                 json_response += "\n"
-            logger.debug(f"Sending response: {json_response[:200]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending response: %s", LogPreview(json_response))
             await write_stream.send(json_response)
         elif isinstance(response, dict):
             # It's a dict, convert to JSON
@@ -201,7 +415,8 @@ class MCPServer:
             # Ensure it ends with a newline for JSON-RPC-over-stdio
             if not json_response.endswith("\n"):
                 json_response += "\n"
-            logger.debug(f"Sending response: {json_response[:200]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending response: %s", LogPreview(json_response))
             await write_stream.send(json_response)
         else:
             # It's already a string or something else
@@ -209,10 +424,15 @@ class MCPServer:
             # Ensure it ends with a newline for JSON-RPC-over-stdio
             if not response_str.endswith("\n"):
                 response_str += "\n"
-            logger.debug(f"Sending raw response type: {type(response)}")
+            logger.debug("Sending raw response type: %s", type(response))
             await write_stream.send(response_str)
 
-    async def handle_message(self, message: Any, user_id: str | None = None) -> Any:
+    async def handle_message(
+        self,
+        message: Any,
+        user_id: str | None = None,
+        send: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> Any:
         """
         Handle an incoming MCP message. Processes it through middleware and dispatches
         to the appropriate handler based on the message method.
@@ -220,73 +440,176 @@ class MCPServer:
         Args:
             message: The raw incoming message
             user_id: Optional user ID for authentication
+            send: Optional sender for notifications to the client, e.g. tool progress
 
         Returns:
             A properly formatted response message
         """
-        # Pre-process message through middleware
+        if _is_batch(message):
+            return await self._handle_batch(message, user_id=user_id, send=send)
+
+        # Decode the message into its typed request and run the middleware
         processed = await self.message_processor.process_request(message)
 
-        # Handle special case for JSON string initialize requests
-        if isinstance(processed, str):
-            try:
-                import json
-
-                parsed = json.loads(processed)
-                if (
-                    isinstance(parsed, dict)
-                    and parsed.get("method") == MessageMethod.INITIALIZE
-                    and "id" in parsed
-                ):
-                    # This is an initialize request
-                    init_response = await self._handle_initialize(InitializeRequest(**parsed))
-                    return init_response
-            except Exception:
-                logger.exception("Error processing JSON string")
-                # Not parseable JSON, continue with normal processing
-                pass
+        if isinstance(processed, JSONRPCRequest):
+            method = processed.method
+            handler = self._method_handlers.get(method)
+            if handler is None:
+                if method.startswith("notifications/"):
+                    await self._handle_notification(method, processed, send=send)
+                    return None
+                return JSONRPCError(
+                    id=processed.id,
+                    error={"code": METHOD_NOT_FOUND, "message": f"Method not found: {method}"},
+                )
+            # Tool calls are made for the connection's user
+            if method == MessageMethod.CALL_TOOL:
+                return await self._run_tool_call(processed, user_id=user_id, send=send)
+            if method in _CONNECTION_SCOPED_METHODS:
+                return await handler(processed, send=send)
+            return await handler(processed)
+
+        # Notifications are passed through as dicts; they never get a response
+        if isinstance(processed, dict):
+            notification = processed.get("method")
+            if isinstance(notification, str) and notification.startswith("notifications/"):
+                await self._handle_notification(notification, processed, send=send)
+            # Other messages without an id (e.g. responses) need no reply
+            return None
 
-        # Check if it's a notification
-        if hasattr(processed, "method"):
-            method = getattr(processed, "method", None)
+        if isinstance(processed, (str, bytes)):
+            return JSONRPCError(id=None, error={"code": PARSE_ERROR, "message": "Parse error"})
 
-            # Handle notifications (methods starting with "notifications/")
-            if method and method.startswith("notifications/"):
-                await self._handle_notification(method, processed)
-                return None
+        # If it's not a method request, just pass it through
+        return processed
 
-            # Handle regular methods using the dispatch table
-            if method in self._method_handlers:
-                # If it's a call_tool request, we need to pass the user_id
-                if method == MessageMethod.CALL_TOOL:
-                    return await self._method_handlers[method](processed, user_id=user_id)
-                # For other methods, just pass the processed message
-                return await self._method_handlers[method](processed)
+    async def _handle_batch(
+        self,
+        message: Any,
+        user_id: str | None = None,
+        send: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> JSONRPCBatchResponse | JSONRPCError | None:
+        """
+        Handle a JSON-RPC batch: an array of requests and notifications.
 
-            # Unknown method
+        The batch's messages are handled concurrently, at most
+        `max_concurrent_requests` at a time. Their responses are returned together,
+        in one array; a batch of only notifications gets no response, and
+        requests the client cancels are left out.
+        """
+        if isinstance(message, (str, bytes)):
+            try:
+                message = json.loads(message)
+            except ValueError:
+                return JSONRPCError(id=None, error={"code": PARSE_ERROR, "message": "Parse error"})
+        if not message:
             return JSONRPCError(
-                id=getattr(processed, "id", None),
-                error={
-                    "code": -32601,
-                    "message": f"Method not found: {method}",
-                },
+                id=None, error={"code": INVALID_REQUEST, "message": "Invalid Request"}
             )
 
-        # If it's not a method request, just pass it through
-        return processed
+        slots = asyncio.Semaphore(self.max_concurrent_requests)
 
-    async def _handle_notification(self, method: str, message: Any) -> None:
+        async def handle(item: Any) -> Any:
+            if not isinstance(item, dict):
+                return JSONRPCError(
+                    id=None, error={"code": INVALID_REQUEST, "message": "Invalid Request"}
+                )
+            if "method" not in item:
+                # A response from the client; the server sends no requests to answer
+                return None
+            try:
+                async with slots:
+                    return await self.handle_message(item, user_id=user_id, send=send)
+            except asyncio.CancelledError:
+                # The client cancelled this request (each item runs in its own task):
+                # it gets no response, but the rest of the batch does
+                return None
+            except Exception:
+                logger.exception("Error handling message in batch")
+                return JSONRPCError(
+                    id=item.get("id"),
+                    error={"code": INTERNAL_ERROR, "message": "Internal error"},
+                )
+
+        responses = await asyncio.gather(*(handle(item) for item in message))
+        responses = [response for response in responses if response is not None]
+        return JSONRPCBatchResponse(responses=responses) if responses else None
+
+    async def _handle_notification(
+        self,
+        method: str,
+        message: Any,
+        send: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> None:
         """
         Handle notification messages.
 
         Args:
             method: The notification method
             message: The notification message
+            send: The sender of the connection the notification arrived on
         """
         if method == "notifications/cancelled":
-            logger.info(f"Request cancelled: {getattr(message, 'params', {})}")
+            params = message.get("params") if isinstance(message, dict) else message.params
+            params = params or {}
+            logger.info("Request cancelled: %s", LogPreview(params))
+            self.cancel_request(params.get("requestId"), send=send)
         else:
-            logger.debug(f"Received notification: {method}")
+            logger.debug("Received notification: %s", method)
+
+    async def _run_tool_call(
+        self,
+        message: Any,
+        user_id: str | None = None,
+        send: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> Any:
+        """
+        Run a tools/call request, tracking its task by request id so that a
+        cancellation from the client stops the tool (see `cancel_request`).
+
+        Cancelled calls don't get a response.
+        """
+        handler = self._method_handlers[MessageMethod.CALL_TOOL]
+        request_id = getattr(message, "id", None)
+        task = asyncio.current_task()
+        if request_id is None or task is None:
+            return await handler(message, user_id=user_id, send=send)
+
+        key = (send, request_id)
+        self._tool_call_tasks[key] = task
+        try:
+            return await handler(message, user_id=user_id, send=send)
+        except asyncio.CancelledError:
+            logger.info("Tool call cancelled (id: %s)", request_id)
+            raise
+        finally:
+            if self._tool_call_tasks.get(key) is task:
+                del self._tool_call_tasks[key]
+
+    def cancel_request(
+        self, request_id: Any, send: Callable[[Any], Awaitable[None]] | None = None
+    ) -> bool:
+        """
+        Cancel a running tools/call request.
+
+        The tool's task is cancelled, so an async tool stops at its next await and
+        any HTTP request it has in flight is aborted. A sync tool can't be stopped:
+        the call returns right away, without a response, while the tool's worker
+        thread runs to completion in the background.
+
+        Args:
+            request_id: The JSON-RPC id of the request to cancel
+            send: The sender of the connection the request arrived on. Request ids
+                are only unique within a connection.
+
+        Returns:
+            True if a running request was cancelled, False if none matched
+        """
+        task = self._tool_call_tasks.get((send, request_id))
+        if task is None or task.done():
+            logger.debug("No running request to cancel (id: %s)", request_id)
+            return False
+        return task.cancel()
 
     async def _handle_ping(self, message: PingRequest) -> PingResponse:
         """
@@ -313,7 +636,7 @@ class MCPServer:
         # Create the result data
         result = InitializeResult(
             protocolVersion=MCP_PROTOCOL_VERSION,
-            capabilities=ServerCapabilities(),
+            capabilities=ServerCapabilities(tools={"listChanged": True}, resources={}),
             serverInfo=Implementation(name="Arcade MCP Worker", version="0.1.0"),
             instructions="Arcade MCP Worker initialized.",
         )
@@ -321,7 +644,8 @@ class MCPServer:
         # Construct proper response with result field
         response = InitializeResponse(id=message.id, result=result)
 
-        logger.debug(f"Initialize response: {response.model_dump_json()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Initialize response: %s", response.model_dump_json())
         return response
 
     async def _handle_list_tools(
@@ -330,50 +654,20 @@ class MCPServer:
         """
         Handle a tools/list request and return a list of available tools.
 
+        If `tools_page_size` is set, one page of tools is returned along with a
+        `nextCursor` the client passes back as `cursor` to get the next page.
+
         Args:
             message: The tools/list request
 
         Returns:
             A properly formatted tools/list response or error
         """
+        cursor = (message.params or {}).get("cursor")
         try:
-            # Get all tools from the catalog
-            tools = []
-            tool_conversion_errors = []
-
-            for tool in self.tool_catalog:
-                try:
-                    mcp_tool = create_mcp_tool(tool)
-                    if mcp_tool:
-                        tools.append(mcp_tool)
-                except Exception:
-                    tool_name = getattr(tool, "name", str(tool))
-                    logger.exception(f"Error converting tool: {tool_name}")
-                    tool_conversion_errors.append(tool_name)
-
-            # Log summary if we had errors
-            if tool_conversion_errors:
-                logger.warning(
-                    f"Failed to convert {len(tool_conversion_errors)} tools: {tool_conversion_errors}"
-                )
-
-            # Create tool objects with exception handling for each one
-            tool_objects = []
-            for t in tools:
-                try:
-                    # Make input schema optional if missing
-                    tool_dict = dict(t)
-                    if "inputSchema" not in tool_dict:
-                        tool_dict["inputSchema"] = {"type": "object", "properties": {}}
-
-                    tool_objects.append(Tool(**tool_dict))
-                except Exception:
-                    logger.exception(f"Error creating Tool object for {t.get('name', 'unknown')}")
-
-            # Return successful response with the tools we were able to convert
-            result = ListToolsResult(tools=tool_objects)
-            response = ListToolsResponse(id=message.id, result=result)
-
+            response = ListToolsResponse(id=message.id, result=self._get_tool_page(cursor))
+        except InvalidCursorError as e:
+            return JSONRPCError(id=message.id, error={"code": -32602, "message": str(e)})
         except Exception:
             logger.exception("Error listing tools")
             return JSONRPCError(
@@ -385,15 +679,112 @@ class MCPServer:
             )
         return response
 
+    def _get_tool_page(self, cursor: Any) -> ListToolsResult:
+        """
+        Get the page of the tool list starting at `cursor` (or the first page).
+
+        Cursors carry the catalog revision they were issued for, so a cursor from
+        before the catalog changed is rejected rather than silently skipping tools.
+        Pages of the cached list are cached along with their serialized JSON.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed, out of range, or outdated.
+        """
+        tool_list = self._get_tool_list()
+        revision = self._catalog_revision()
+        if cursor is None and not self.tools_page_size:
+            if revision is not None:
+                tool_list.cache_json()
+            return tool_list
+
+        offset = 0
+        if cursor is not None:
+            cursor_revision, offset = _decode_cursor(cursor)
+            if cursor_revision != revision or offset >= len(tool_list.tools):
+                raise InvalidCursorError(f"Invalid or expired cursor: {cursor!r}")
+
+        page = self._tool_list_pages.get(offset) if revision is not None else None
+        if page is None:
+            end = offset + self.tools_page_size if self.tools_page_size else len(tool_list.tools)
+            page = ListToolsResult(
+                tools=tool_list.tools[offset:end],
+                nextCursor=_encode_cursor(revision, end) if end < len(tool_list.tools) else None,
+            )
+            if revision is not None:
+                page.cache_json()
+                self._tool_list_pages[offset] = page
+        return page
+
+    def _get_tool_list(self) -> ListToolsResult:
+        """
+        Get the full tools/list result, building it only if the catalog changed
+        since it was last built.
+        """
+        revision = self._catalog_revision()
+        cached = self._tool_list_cache
+        if cached is not None and revision is not None and cached[0] == revision:
+            return cached[1]
+
+        result = ListToolsResult(tools=self._build_tools())
+        self._tool_list_pages = {}
+        if revision is not None:
+            self._tool_list_cache = (revision, result)
+        return result
+
+    def _build_tools(self) -> list[Tool]:
+        """Convert every tool in the catalog to an MCP tool definition."""
+        tools = []
+        tool_conversion_errors = []
+
+        for tool in self.tool_catalog:
+            try:
+                mcp_tool = create_mcp_tool(tool)
+                if mcp_tool:
+                    tools.append(mcp_tool)
+            except Exception:
+                tool_name = getattr(tool, "name", str(tool))
+                logger.exception("Error converting tool: %s", tool_name)
+                tool_conversion_errors.append(tool_name)
+
+        # Log summary if we had errors
+        if tool_conversion_errors:
+            logger.warning(
+                "Failed to convert %d tools: %s",
+                len(tool_conversion_errors),
+                tool_conversion_errors,
+            )
+
+        # Create tool objects with exception handling for each one
+        tool_objects = []
+        for t in tools:
+            try:
+                # Make input schema optional if missing
+                tool_dict = dict(t)
+                if "inputSchema" not in tool_dict:
+                    tool_dict["inputSchema"] = {"type": "object", "properties": {}}
+
+                tool_objects.append(Tool(**tool_dict))
+            except Exception:
+                logger.exception("Error creating Tool object for %s", t.get("name", "unknown"))
+
+        return tool_objects
+
     async def _handle_call_tool(
-        self, message: CallToolRequest, user_id: str | None = None
+        self,
+        message: CallToolRequest,
+        user_id: str | None = None,
+        send: Callable[[Any], Awaitable[None]] | None = None,
     ) -> CallToolResponse:
         """
         Handle a tools/call request to execute a tool.
 
+        If the request carries a progressToken, progress the tool reports through
+        its ToolContext is sent to the client as throttled progress notifications.
+
         Args:
             message: The tools/call request
             user_id: Optional user ID for authentication
+            send: Optional sender for progress notifications to the client
 
         Returns:
             A properly formatted tools/call response
@@ -404,15 +795,13 @@ class MCPServer:
         if not input_params:
             input_params = message.params.get("arguments", {})
 
-        logger.info(f"Handling tool call for {tool_name}")
+        if logger.isEnabledFor(logging.INFO) and self.call_log_sampler.sample():
+            logger.info("Handling tool call for %s", tool_name, extra={"tool_name": tool_name})
+        log_debug = logger.isEnabledFor(logging.DEBUG)
 
         try:
             tool = self.tool_catalog.get_tool_by_name(tool_name, separator="_")
-            tool_context = ToolContext()
-
-            # Set up context with secrets
-            if tool.definition.requirements and tool.definition.requirements.secrets:
-                self._setup_tool_secrets(tool, tool_context)
+            tool_context = self._create_tool_context(tool, message, send)
 
             # Handle authorization if needed
             requirement = self._get_auth_requirement(tool)
@@ -430,24 +819,38 @@ class MCPServer:
                     )
 
             # Execute the tool
-            logger.debug(f"Executing tool {tool_name} with input: {input_params}")
+            if log_debug:
+                logger.debug(
+                    "Executing tool %s with input: %s", tool_name, LogPreview(input_params)
+                )
             result = await ToolExecutor.run(
-                func=tool.tool,
+                func=_run_in_thread(tool.tool),
                 definition=tool.definition,
                 input_model=tool.input_model,
                 output_model=tool.output_model,
                 context=tool_context,
                 **input_params,
             )
-            logger.debug(f"Tool result: {result}")
+            if log_debug:
+                logger.debug("Tool result: %s", LogPreview(result.value or result.error))
             if result.value:
                 return CallToolResponse(
                     id=message.id,
-                    result=CallToolResult(content=convert_to_mcp_content(result.value)),
+                    result=CallToolResult(
+                        content=convert_to_mcp_content(
+                            result.value,
+                            self.result_store,
+                            name=f"{tool_name} result",
+                            owner=send,
+                        )
+                    ),
                 )
             else:
                 error = result.error or "Error calling tool"
-                logger.error(f"Tool {tool_name} returned error: {error}")
+                logger.error("Tool %s returned error: %s", tool_name, LogPreview(error))
+                if requirement and is_unauthorized_error(result.error):
+                    # The provider rejected the token: authorize again on the next call
+                    self.authorization_cache.invalidate(auth_cache_key(requirement, user_id))
                 return CallToolResponse(
                     id=message.id,
                     result=CallToolResult(
@@ -455,7 +858,7 @@ class MCPServer:
                     ),
                 )
         except Exception as e:
-            logger.exception(f"Error calling tool {tool_name}")
+            logger.exception("Error calling tool %s", tool_name)
             error = f"Error calling tool {tool_name}: {e!s}"
             return CallToolResponse(
                 id=message.id,
@@ -464,6 +867,28 @@ class MCPServer:
                 ),
             )
 
+    def _create_tool_context(
+        self,
+        tool: Any,
+        message: CallToolRequest,
+        send: Callable[[Any], Awaitable[None]] | None,
+    ) -> ToolContext:
+        """
+        Create the context for a tool call, with the tool's secrets and, if the
+        client asked for progress, a reporter that sends progress notifications.
+        """
+        tool_context = ToolContext()
+
+        progress_token = (message.params.get("_meta") or {}).get("progressToken")
+        if send is not None and progress_token is not None:
+            tool_context.set_progress_reporter(ThrottledProgressReporter(progress_token, send))
+
+        # Set up context with secrets
+        if tool.definition.requirements and tool.definition.requirements.secrets:
+            self._setup_tool_secrets(tool, tool_context)
+
+        return tool_context
+
     def _setup_tool_secrets(self, tool: Any, tool_context: ToolContext) -> None:
         """
         Set up tool secrets in the tool context.
@@ -489,16 +914,21 @@ class MCPServer:
         """
         return JSONRPCResponse(id=getattr(message, "id", None), result={"ok": True})
 
-    async def _handle_cancel(self, message: CancelRequest) -> JSONRPCResponse:
+    async def _handle_cancel(
+        self, message: CancelRequest, send: Callable[[Any], Awaitable[None]] | None = None
+    ) -> JSONRPCResponse:
         """
-        Handle a cancel request.
+        Handle a cancel request by cancelling the running request it names.
 
         Args:
             message: The cancel request
+            send: The sender of the connection the request arrived on
 
         Returns:
             A response acknowledging the cancellation
         """
+        params = message.params or {}
+        self.cancel_request(params.get("id", params.get("requestId")), send=send)
         return JSONRPCResponse(id=getattr(message, "id", None), result={"ok": True})
 
     async def _handle_shutdown(self, message: ShutdownRequest) -> ShutdownResponse:
@@ -516,17 +946,59 @@ class MCPServer:
         proc.add_done_callback(lambda _: logger.info("MCP server shutdown complete"))
         return ShutdownResponse(id=message.id, result={"ok": True})
 
-    async def _handle_list_resources(self, message: ListResourcesRequest) -> ListResourcesResponse:
+    async def _handle_list_resources(
+        self,
+        message: ListResourcesRequest,
+        send: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> ListResourcesResponse:
         """
         Handle a resources/list request.
 
         Args:
             message: The resources/list request
+            send: The sender of the connection the request arrived on. Only the
+                results stored for this connection are listed.
 
         Returns:
             A properly formatted resources/list response
         """
-        return ListResourcesResponse(id=message.id, result={"resources": []})
+        return ListResourcesResponse(
+            id=message.id, result={"resources": self.result_store.resources(owner=send)}
+        )
+
+    async def _handle_read_resource(
+        self,
+        message: ReadResourceRequest,
+        send: Callable[[Any], Awaitable[None]] | None = None,
+    ) -> ReadResourceResponse | JSONRPCError:
+        """
+        Handle a resources/read request for a chunk of a large tool result.
+
+        Args:
+            message: The resources/read request
+            send: The sender of the connection the request arrived on. Only the
+                results stored for this connection can be read.
+
+        Returns:
+            The chunk's text, or an error if the result is unknown, expired or was
+            stored for another connection
+        """
+        uri = (message.params or {}).get("uri", "")
+        found = self.result_store.read(uri, owner=send)
+        if found is None:
+            return JSONRPCError(
+                id=message.id,
+                error={
+                    "code": RESOURCE_NOT_FOUND,
+                    "message": "Resource not found",
+                    "data": {"uri": uri},
+                },
+            )
+        result, text = found
+        return ReadResourceResponse(
+            id=message.id,
+            result={"contents": [{"uri": uri, "mimeType": result.mime_type, "text": text}]},
+        )
 
     async def _handle_list_prompts(self, message: ListPromptsRequest) -> ListPromptsResponse:
         """
@@ -572,23 +1044,34 @@ class MCPServer:
         """
         Check if a tool is authorized for a user.
 
+        Completed authorizations are cached per user, provider and scopes, so
+        repeat calls don't wait on a round trip to the Engine.
+
         Args:
-            tool: The tool to check authorization for
+            auth_requirement: The tool's authorization requirement
             user_id: The user ID to check authorization for
 
         Returns:
             An authorization response
 
         Raises:
-            RuntimeError: If the tool has no authorization requirement
             Exception: If authorization fails
         """
+        return await self.authorization_cache.get_or_fetch(  # type: ignore[no-any-return]
+            auth_cache_key(auth_requirement, user_id),
+            lambda: self._authorize(auth_requirement, user_id),
+        )
+
+    async def _authorize(
+        self, auth_requirement: AuthRequirement, user_id: str | None = None
+    ) -> AuthorizationResponse:
+        """Ask the Engine to authorize a tool for a user."""
         try:
             response = await self.arcade.auth.authorize(
                 auth_requirement=auth_requirement,
                 user_id=user_id or "anonymous",
             )
-            logger.debug(f"Authorization response: {response}")
+            logger.debug("Authorization response: %s", LogPreview(response))
 
         except ArcadeError:
             logger.exception("Error authorizing tool")
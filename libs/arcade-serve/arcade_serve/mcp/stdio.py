@@ -1,21 +1,27 @@
 import asyncio
+import contextlib
 import logging
+import os
 import queue
 import signal
 import sys
 import threading
-from collections.abc import AsyncGenerator
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import AsyncGenerator, Callable
+from typing import IO, Any, TypeVar
 
-if TYPE_CHECKING:
-    pass
-
-from arcade_serve.mcp.server import MCPServer
+from arcade_serve.mcp.server import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_TOOLS_PAGE_SIZE,
+    MCPServer,
+)
 
 logger = logging.getLogger("arcade.mcp")
 
 T = TypeVar("T")
 
+# Longest message, in bytes, the stdio transport reads; longer lines are dropped
+STDIO_READ_LIMIT = int(os.getenv("ARCADE_MCP_STDIO_READ_LIMIT", str(64 * 1024 * 1024)))
+
 
 def stdio_reader(stdin: object, q: queue.Queue[str | None]) -> None:
     """Read lines from stdin and put them into a queue."""
@@ -28,20 +34,198 @@ def stdio_writer(stdout: object, q: queue.Queue[str | None]) -> None:
     """Write messages from a queue to stdout."""
     try:
         while True:
-            msg = q.get()
-            if msg is None:
+            batch, done = take_batch(q)
+            write_batch(stdout, batch)
+            if done:
                 break
-
-            # Ensure message ends with a newline for proper JSON-RPC-over-stdio
-            if not msg.endswith("\n"):
-                msg += "\n"
-
-            stdout.write(msg)  # type: ignore[attr-defined]
-            stdout.flush()  # type: ignore[attr-defined]
     except Exception:
         logger.exception("Error in stdio writer")
 
 
+def take_batch(q: queue.Queue[str | None]) -> tuple[list[str], bool]:
+    """
+    Wait for a message on `q`, then take every other message already queued.
+
+    Returns:
+        The messages, and whether the None sentinel (end of output) was reached
+    """
+    batch: list[str] = []
+    msg = q.get()
+    while msg is not None:
+        batch.append(msg)
+        try:
+            msg = q.get_nowait()
+        except queue.Empty:
+            return batch, False
+    return batch, True
+
+
+def frame_messages(batch: list[str]) -> bytes:
+    """Encode messages as newline-delimited JSON-RPC, ready for a single write."""
+    chunks: list[bytes] = []
+    for msg in batch:
+        chunks.append(msg.encode())
+        # Ensure each message ends with a newline for proper JSON-RPC-over-stdio
+        if not msg.endswith("\n"):
+            chunks.append(b"\n")
+    return b"".join(chunks)
+
+
+def write_batch(stdout: object, batch: list[str]) -> None:
+    """Write a batch of messages to stdout with one write and one flush."""
+    if not batch:
+        return
+    # Write bytes straight to the binary buffer when there is one
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(frame_messages(batch))
+        buffer.flush()
+    else:
+        stdout.write(frame_messages(batch).decode())  # type: ignore[attr-defined]
+        stdout.flush()  # type: ignore[attr-defined]
+
+
+class _StdioPipeProtocol(asyncio.StreamReaderProtocol):
+    """
+    Protocol of a stdin or stdout pipe connected to the event loop.
+
+    The event loop makes the pipe non-blocking. The duplicated file descriptor shares
+    that flag with the process's own stdin or stdout, so the original mode is
+    restored when the pipe is closed.
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        file: IO[Any],
+        blocking: bool,
+        on_close: Callable[[], None] | None = None,
+    ) -> None:
+        super().__init__(reader)
+        self._file = file
+        self._blocking = blocking
+        self._on_close = on_close
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        # Called before the transport closes the file
+        with contextlib.suppress(OSError, ValueError):
+            os.set_blocking(self._file.fileno(), self._blocking)
+        if self._on_close is not None:
+            self._on_close()
+        super().connection_lost(exc)
+
+
+async def open_stdio_streams(
+    stdin: IO[Any] | None = None,
+    stdout: IO[Any] | None = None,
+    limit: int = STDIO_READ_LIMIT,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Connect stdin and stdout to the running event loop as asyncio streams.
+
+    The file descriptors are duplicated, so closing the streams leaves `sys.stdin`
+    and `sys.stdout` open. Closing the writer also closes the reader, and restores
+    the blocking mode of stdin and stdout.
+
+    Args:
+        stdin: The file to read messages from (defaults to `sys.stdin`)
+        stdout: The file to write messages to (defaults to `sys.stdout`)
+        limit: Longest line, in bytes, the reader accepts
+
+    Returns:
+        A StreamReader over stdin and a StreamWriter over stdout
+
+    Raises:
+        ValueError: stdin or stdout is a terminal or a regular file rather than a pipe.
+            A terminal is left to the threaded transport, since making it non-blocking
+            would also affect the shell it belongs to.
+        NotImplementedError: The event loop doesn't support pipes (e.g. on Windows)
+    """
+    loop = asyncio.get_running_loop()
+    stdin, stdout = stdin or sys.stdin, stdout or sys.stdout
+    if stdin.isatty() or stdout.isatty():
+        raise ValueError("stdin or stdout is a terminal")
+    stdin_blocking = os.get_blocking(stdin.fileno())
+    stdout_blocking = os.get_blocking(stdout.fileno())
+    stdin_file = os.fdopen(os.dup(stdin.fileno()), "rb", buffering=0)
+    stdout_file = os.fdopen(os.dup(stdout.fileno()), "wb", buffering=0)
+
+    read_transport = None
+
+    def close_reader() -> None:
+        if read_transport is not None:
+            read_transport.close()
+
+    try:
+        reader = asyncio.StreamReader(limit=limit)
+        read_transport, _ = await loop.connect_read_pipe(
+            lambda: _StdioPipeProtocol(reader, stdin_file, stdin_blocking), stdin_file
+        )
+        write_transport, write_protocol = await loop.connect_write_pipe(
+            lambda: _StdioPipeProtocol(
+                asyncio.StreamReader(), stdout_file, stdout_blocking, on_close=close_reader
+            ),
+            stdout_file,
+        )
+    except BaseException:
+        if read_transport is not None:
+            read_transport.close()
+        stdin_file.close()
+        stdout_file.close()
+        raise
+
+    writer = asyncio.StreamWriter(write_transport, write_protocol, None, loop)
+    return reader, writer
+
+
+async def stdio_lines(reader: asyncio.StreamReader) -> AsyncGenerator[bytes, None]:
+    """
+    Yield the lines read from `reader` until EOF.
+
+    Lines are yielded as bytes: the message processor decodes them straight into
+    messages. Lines longer than the reader's limit are logged and dropped.
+    """
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            # readline() discards the oversized line (or as much of it as was buffered)
+            logger.warning("Dropped an incoming message longer than the stdio read limit")
+            continue
+        if not line:
+            return
+        yield line
+
+
+class StreamWriteStream:
+    """
+    The write stream for a connection served over an asyncio StreamWriter.
+
+    Messages sent during one pass of the event loop are written together, with a
+    single write to the pipe. Each message waits for the writer to drain, so a
+    client that stops reading pauses the server rather than growing its buffer
+    without limit.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self.writer = writer
+        self._pending: list[str] = []
+
+    async def send(self, message: str) -> None:
+        if self.writer.is_closing():
+            return
+        if not self._pending:
+            asyncio.get_running_loop().call_soon(self.flush)
+        self._pending.append(message)
+        await self.writer.drain()
+
+    def flush(self) -> None:
+        """Write the pending messages to the pipe."""
+        batch, self._pending = self._pending, []
+        if batch and not self.writer.is_closing():
+            self.writer.write(frame_messages(batch))
+
+
 class StdioServer(MCPServer):
     """
     Stdio server that handles signals and cleanup.
@@ -51,6 +235,8 @@ class StdioServer(MCPServer):
         self,
         tool_catalog: Any,
         enable_logging: bool = True,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        tools_page_size: int = DEFAULT_TOOLS_PAGE_SIZE,
         **client_kwargs: dict[str, Any],
     ):
         # Set up stdio-specific middleware configuration
@@ -58,13 +244,20 @@ class StdioServer(MCPServer):
         middleware_config["stdio_mode"] = True
         client_kwargs["middleware_config"] = middleware_config
 
-        super().__init__(tool_catalog, enable_logging, **client_kwargs)
+        super().__init__(
+            tool_catalog,
+            enable_logging,
+            max_concurrent_requests,
+            tools_page_size,
+            **client_kwargs,
+        )
         self.read_q: queue.Queue[str | None] = queue.Queue()
         self.write_q: queue.Queue[str | None] = queue.Queue()
         self.reader_thread: threading.Thread | None = None
         self.writer_thread: threading.Thread | None = None
         self.running = False
         self.shutdown_event = asyncio.Event()
+        self._connection_task: asyncio.Task | None = None
 
     def start_io_threads(self) -> None:
         """Start stdio reader and writer threads."""
@@ -90,14 +283,13 @@ class StdioServer(MCPServer):
             q.put(None)  # Signal EOF
 
     def _stdio_writer(self, stdout: object, q: queue.Queue[str | None]) -> None:
-        """Write messages from a queue to stdout."""
+        """Write messages from a queue to stdout, a batch at a time."""
         try:
             while self.running:
-                msg = q.get()
-                if msg is None:
+                batch, done = take_batch(q)
+                write_batch(stdout, batch)
+                if done:
                     break
-                stdout.write(msg)  # type: ignore[attr-defined]
-                stdout.flush()  # type: ignore[attr-defined]
         except Exception:
             logger.exception("Error in stdio writer")
 
@@ -123,8 +315,9 @@ class StdioServer(MCPServer):
         logger.info("Shutting down stdio server...")
         self.running = False
 
-        # Signal shutdown to MCP server
-        await self.shutdown()
+        # Stop the stream connection, which may be waiting for stdin
+        if self._connection_task is not None:
+            self._connection_task.cancel()
 
         # Clean up IO queues and threads
         try:
@@ -155,20 +348,18 @@ class StdioServer(MCPServer):
                 else:
                     logger.warning(f"Failed to set up signal handler for {sig}")
 
-        # Start IO threads
-        self.start_io_threads()
-
         logger.info("Starting MCP server with stdio transport")
 
-        # Create WriteStream class for MCP server
-        class WriteStream:
-            async def send(self_, message: str) -> None:
-                if self.running:
-                    await asyncio.to_thread(self.write_q.put, message)
-
         try:
-            # Run MCP server connection
-            await self.run_connection(self._read_stream(), WriteStream(), None)
+            try:
+                reader, writer = await open_stdio_streams()
+            except (OSError, ValueError, NotImplementedError):
+                # Regular files can't be watched by the event loop, and Windows
+                # event loops don't support pipes: read and write from threads instead
+                logger.debug("stdio isn't a pipe; using reader and writer threads")
+                await self._run_threaded()
+            else:
+                await self.run_streams(reader, writer)
         except asyncio.CancelledError:
             # Handle cancellation
             logger.info("Server operation cancelled")
@@ -183,3 +374,36 @@ class StdioServer(MCPServer):
             await self.shutdown()
             # Wait for shutdown to complete
             await self.shutdown_event.wait()
+
+    async def run_streams(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one connection over asyncio streams, until the reader reaches EOF.
+
+        Args:
+            reader: Stream of newline-delimited incoming messages
+            writer: Stream the responses and notifications are written to
+        """
+        self.running = True
+        write_stream = StreamWriteStream(writer)
+        self._connection_task = asyncio.create_task(
+            self.run_connection(stdio_lines(reader), write_stream, None)
+        )
+        try:
+            await self._connection_task
+        finally:
+            self._connection_task = None
+            write_stream.flush()
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _run_threaded(self) -> None:
+        """Serve the connection with the stdio reader and writer threads."""
+        self.start_io_threads()
+
+        class WriteStream:
+            async def send(self_, message: str) -> None:
+                if self.running:
+                    await asyncio.to_thread(self.write_q.put, message)
+
+        await self.run_connection(self._read_stream(), WriteStream(), None)
@@ -9,7 +9,7 @@ from typing import (
     Union,
 )
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 ProgressToken = str | int
 Cursor = str
@@ -129,11 +129,28 @@ class JSONRPCError(JSONRPCMessage):
     error: dict[str, Any]
 
 
+class JSONRPCBatchResponse(BaseModel):
+    """The responses to a JSON-RPC batch request, sent to the client as one array."""
+
+    responses: list[Any]
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serialize the responses as a JSON array."""
+        return "[" + ",".join(_dump_response(r) for r in self.responses) + "]"
+
+
+def _dump_response(response: Any) -> str:
+    if hasattr(response, "model_dump_json"):
+        return str(response.model_dump_json()).rstrip("\n")
+    return json.dumps(response, ensure_ascii=False)
+
+
 PARSE_ERROR = -32700
 INVALID_REQUEST = -32600
 METHOD_NOT_FOUND = -32601
 INVALID_PARAMS = -32602
 INTERNAL_ERROR = -32603
+RESOURCE_NOT_FOUND = -32002
 
 
 class ErrorData(BaseModel):
@@ -247,6 +264,13 @@ class ProgressNotification(JSONRPCMessage):
     params: dict[str, Any]
 
 
+class ToolProgressNotification(JSONRPCMessage):
+    """Reports the progress of a running tools/call request to the client."""
+
+    method: str = Field(default="notifications/progress", frozen=True)
+    params: dict[str, Any]
+
+
 class PingResponse(JSONRPCResponse):
     result: dict[str, Any] = Field(default_factory=lambda: {"pong": True})
 
@@ -321,11 +345,40 @@ class Tool(BaseModel):
 
 class ListToolsResult(BaseModel):
     tools: list[Tool]
+    nextCursor: Cursor | None = None
+
+    # Serialized JSON of this result. Set when the result is cached and reused
+    # across requests, so it isn't re-serialized for every response.
+    _json: str | None = PrivateAttr(default=None)
+
+    def cache_json(self) -> str:
+        """Serialize the result once and keep the JSON for later responses."""
+        if self._json is None:
+            self._json = json.dumps(self.model_dump(exclude_none=True), ensure_ascii=False)
+        return self._json
 
 
 class ListToolsResponse(JSONRPCResponse):
     result: ListToolsResult
 
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Convert to JSON string, reusing the result's cached JSON if there is one."""
+        if self.result._json is None or self.error is not None:
+            return super().model_dump_json(**kwargs)
+        envelope = json.dumps({"jsonrpc": self.jsonrpc, "id": self.id}, ensure_ascii=False)
+        return f'{envelope[:-1]}, "result": {self.result._json}}}'
+
+
+class ToolListChangedNotification(JSONRPCMessage):
+    """Tells the client that the list of available tools has changed."""
+
+    method: str = Field(default="notifications/tools/list_changed", frozen=True)
+    params: dict[str, Any] | None = None
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        kwargs.setdefault("exclude_none", True)
+        return super().model_dump_json(**kwargs)
+
 
 class CallToolRequest(JSONRPCRequest):
     method: str = Field(default="tools/call", frozen=True)
@@ -350,6 +403,15 @@ class ListResourcesResponse(JSONRPCResponse):
     result: dict[str, Any]
 
 
+class ReadResourceRequest(JSONRPCRequest):
+    method: str = Field(default="resources/read", frozen=True)
+    params: dict[str, Any]
+
+
+class ReadResourceResponse(JSONRPCResponse):
+    result: dict[str, Any]
+
+
 class ListPromptsRequest(JSONRPCRequest):
     method: str = Field(default="prompts/list", frozen=True)
     params: dict[str, Any] | None = None
@@ -378,6 +440,22 @@ MCPMessage = Union[
     ShutdownResponse,
     ListResourcesRequest,
     ListResourcesResponse,
+    ReadResourceRequest,
+    ReadResourceResponse,
     ListPromptsRequest,
     ListPromptsResponse,
 ]
+
+# The request type for each method, used to decode an incoming request directly into
+# its typed model. Methods not listed here are decoded as a plain JSONRPCRequest.
+REQUEST_TYPES: dict[str, type[JSONRPCRequest]] = {
+    "initialize": InitializeRequest,
+    "ping": PingRequest,
+    "tools/list": ListToolsRequest,
+    "tools/call": CallToolRequest,
+    "$/cancelRequest": CancelRequest,
+    "shutdown": ShutdownRequest,
+    "resources/list": ListResourcesRequest,
+    "resources/read": ReadResourceRequest,
+    "prompts/list": ListPromptsRequest,
+}
@@ -1,8 +1,88 @@
 import asyncio
+import itertools
+import os
+import reprlib
 from typing import Any
 
+# Maximum number of characters of a payload (tool inputs, outputs, responses) included in a log line
+LOG_PREVIEW_MAX_CHARS = int(os.getenv("ARCADE_LOG_PREVIEW_MAX_CHARS", "200"))
+# Fraction of tool calls that get per-call INFO logs (1.0 logs every call, 0 logs none)
+LOG_SAMPLE_RATE = float(os.getenv("ARCADE_LOG_SAMPLE_RATE", "1.0"))
+
 
 def is_async_callable(func: Any) -> bool:
     return asyncio.iscoroutinefunction(func) or (
         callable(func) and asyncio.iscoroutinefunction(func.__call__)
     )
+
+
+class _PreviewRepr(reprlib.Repr):
+    """A reprlib.Repr that stops walking a container after a handful of items."""
+
+    def __init__(self, max_chars: int) -> None:
+        super().__init__()
+        self.maxlevel = 3
+        self.maxdict = self.maxlist = self.maxtuple = self.maxset = self.maxfrozenset = 10
+        self.maxstring = self.maxother = self.maxlong = max_chars
+
+
+class LogPreview:
+    """
+    A size-capped, lazily rendered preview of a value for use as a logging argument.
+
+    The value is only rendered when a handler actually formats the record, so passing
+    a LogPreview to a disabled log level costs nothing. Rendering walks at most a few
+    items of each container, so the cost doesn't grow with the size of the value.
+
+    Example:
+        logger.debug("Tool output: %s", LogPreview(output.value))
+    """
+
+    __slots__ = ("max_chars", "value")
+
+    def __init__(self, value: Any, max_chars: int = LOG_PREVIEW_MAX_CHARS) -> None:
+        self.value = value
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        value = self.value
+        if isinstance(value, (str, bytes)):
+            text = value[: self.max_chars + 1]
+            text = text if isinstance(text, str) else repr(text)
+        else:
+            text = _PreviewRepr(self.max_chars).repr(value)
+        if len(text) > self.max_chars:
+            return f"{text[: self.max_chars]}... ({_size_hint(value)})"
+        return text
+
+    __repr__ = __str__
+
+
+def _size_hint(value: Any) -> str:
+    unit = "chars" if isinstance(value, str) else "bytes" if isinstance(value, bytes) else "items"
+    try:
+        return f"{len(value)} {unit}"
+    except TypeError:
+        return "truncated"
+
+
+class LogSampler:
+    """
+    Decides which of a stream of events get logged, so per-call logs stay cheap under load.
+
+    Sampling is deterministic: with a rate of 0.1, one call in ten is logged.
+
+    Args:
+        rate: Fraction of events to log, between 0 (none) and 1 (all).
+    """
+
+    def __init__(self, rate: float = LOG_SAMPLE_RATE) -> None:
+        self.rate = min(max(rate, 0.0), 1.0)
+        self._every = round(1 / self.rate) if self.rate > 0 else 0
+        self._counter = itertools.count()
+
+    def sample(self) -> bool:
+        """Return True if the current event should be logged."""
+        if self._every <= 1:
+            return self._every == 1
+        return next(self._counter) % self._every == 0
@@ -0,0 +1,6 @@
+"""
+Load and latency benchmarks for the Arcade worker and MCP server.
+
+Run them standalone with ``python -m benchmarks`` from the ``libs`` directory,
+or through pytest-benchmark with ``pytest libs/benchmarks``.
+"""
@@ -0,0 +1,145 @@
+"""
+Standalone benchmark runner.
+
+    cd libs && python -m benchmarks --target mcp --kind sleep --sizes 10,1000
+    cd libs && python -m benchmarks --target mcp --operation mixed --mix call=50,list=25,ping=25
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.loadgen import LoadReport, MixedLoadReport
+from benchmarks.scenarios import (
+    CATALOG_SIZES,
+    DEFAULT_MIX,
+    OPERATIONS,
+    Scenario,
+    parse_mix,
+    run_scenario,
+)
+from benchmarks.targets import TARGETS
+from benchmarks.toolkits import ToolKind
+
+console = Console()
+
+
+def _split(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def display_reports(reports: list[LoadReport]) -> None:
+    table = Table(show_header=True, header_style="bold magenta")
+    for column in ("Scenario", "Req/s", "p50 ms", "p99 ms", "CPU ms/req", "KiB/req", "Errors"):
+        if column == "Scenario":
+            table.add_column(column, no_wrap=True)
+        else:
+            table.add_column(column, justify="right")
+    for report in reports:
+        summary = report.as_dict()
+        alloc = summary["alloc_kb_per_request"]
+        table.add_row(
+            report.name,
+            f"{summary['throughput_rps']:.1f}",
+            f"{summary['p50_ms']:.2f}",
+            f"{summary['p99_ms']:.2f}",
+            f"{summary['cpu_ms_per_request']:.3f}",
+            "-" if alloc is None else f"{alloc:.1f}",
+            str(report.errors),
+        )
+    console.print(table)
+
+    mixed = [report for report in reports if isinstance(report, MixedLoadReport)]
+    if mixed:
+        display_method_latencies(mixed)
+
+
+def display_method_latencies(reports: list[MixedLoadReport]) -> None:
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Scenario", no_wrap=True)
+    table.add_column("Request")
+    for column in ("Count", "p50 ms", "p95 ms", "p99 ms", "Retained KiB"):
+        table.add_column(column, justify="right")
+    for report in reports:
+        growth = report.as_dict()["memory_growth_kb"]
+        for i, (method, stats) in enumerate(report.method_percentiles().items()):
+            table.add_row(
+                report.name if i == 0 else "",
+                method,
+                str(stats["count"]),
+                f"{stats['p50_ms']:.2f}",
+                f"{stats['p95_ms']:.2f}",
+                f"{stats['p99_ms']:.2f}",
+                "-" if growth is None or i > 0 else f"{growth:.1f}",
+            )
+    console.print(table)
+
+
+def main(
+    targets: str = typer.Option(
+        ",".join(TARGETS), "--target", "-t", help="Comma-separated targets to benchmark."
+    ),
+    kinds: str = typer.Option(
+        ",".join(kind.value for kind in ToolKind),
+        "--kind",
+        "-k",
+        help="Comma-separated tool workloads.",
+    ),
+    sizes: str = typer.Option(
+        ",".join(str(size) for size in CATALOG_SIZES),
+        "--sizes",
+        "-s",
+        help="Comma-separated catalog sizes.",
+    ),
+    operations: str = typer.Option(
+        "call", "--operation", "-o", help=f"Comma-separated operations ({', '.join(OPERATIONS)})."
+    ),
+    mix: str = typer.Option(
+        ",".join(f"{name}={weight:g}" for name, weight in DEFAULT_MIX),
+        "--mix",
+        help="Relative weight of each request type in mixed traffic.",
+    ),
+    requests: int = typer.Option(200, "--requests", "-n", help="Requests per scenario."),
+    concurrency: int = typer.Option(10, "--concurrency", "-c", help="Requests in flight."),
+    alloc_samples: int = typer.Option(
+        20, "--alloc-samples", help="Sequential requests traced for allocations (0 to skip)."
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", help="Write the results as JSON to this file."
+    ),
+) -> None:
+    """Benchmark the FastAPI worker and the MCP server with synthetic toolkits."""
+    scenarios = [
+        Scenario(
+            target=target,
+            kind=ToolKind(kind),
+            catalog_size=int(size),
+            operation=operation,
+            requests=requests,
+            concurrency=concurrency,
+            mix=parse_mix(mix),
+        )
+        for target in _split(targets)
+        for operation in _split(operations)
+        for kind in _split(kinds)
+        for size in _split(sizes)
+    ]
+
+    reports = []
+    for scenario in scenarios:
+        console.print(f"Running {scenario.name}...", style="dim")
+        reports.append(asyncio.run(run_scenario(scenario, alloc_samples=alloc_samples)))
+
+    display_reports(reports)
+    if output:
+        output.write_text(json.dumps([report.as_dict() for report in reports], indent=2))
+        console.print(f"Results written to {output}", style="bold")
+
+
+if __name__ == "__main__":
+    typer.run(main)
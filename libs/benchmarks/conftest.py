@@ -0,0 +1,49 @@
+import asyncio
+from collections.abc import Iterator
+from typing import Any, Callable
+
+import pytest
+
+from benchmarks.scenarios import Scenario, cached_catalog, drive
+from benchmarks.targets import TARGETS
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture
+def event_loop_for_benchmark() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def run_benchmark(
+    benchmark: Any, event_loop_for_benchmark: asyncio.AbstractEventLoop
+) -> Callable[[Scenario], None]:
+    """
+    Benchmark one scenario with pytest-benchmark.
+
+    Each round drives the scenario's full request count through a target that is
+    opened (and warmed up) once, so rounds only measure request handling.
+    """
+    loop = event_loop_for_benchmark
+
+    def run(scenario: Scenario) -> None:
+        catalog = cached_catalog(scenario.catalog_size, scenario.kind)
+        target = TARGETS[scenario.target](catalog, scenario.kind, scenario.catalog_size - 1)
+        loop.run_until_complete(target.__aenter__())
+        try:
+            request = target.list_tools if scenario.operation == "list" else target.call_tool
+            loop.run_until_complete(request())
+
+            def one_round() -> Any:
+                return loop.run_until_complete(drive(scenario, target))
+
+            report = benchmark.pedantic(one_round, rounds=3, iterations=1)
+            benchmark.extra_info.update(report.as_dict())
+            assert report.errors == 0
+        finally:
+            loop.run_until_complete(target.__aexit__(None, None, None))
+
+    return run
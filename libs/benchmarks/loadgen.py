@@ -0,0 +1,242 @@
+import asyncio
+import gc
+import math
+import random
+import time
+import tracemalloc
+from collections.abc import Awaitable
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+RequestFactory = Callable[[], Awaitable[Any]]
+"""A zero-argument coroutine function that performs one request and raises on failure."""
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Return the *pct* percentile (0-100) of *values* using the nearest-rank method.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclass
+class LoadReport:
+    """
+    The result of driving a target with the load generator.
+
+    Attributes:
+        name: A label for the scenario (target, workload and catalog size).
+        requests: The number of requests issued.
+        concurrency: The number of requests kept in flight.
+        errors: The number of requests that raised.
+        wall_s: Wall-clock duration of the run in seconds.
+        cpu_s: Process CPU time consumed during the run in seconds.
+        latencies_ms: Per-request latencies in milliseconds.
+        alloc_bytes: Mean peak allocation per request in bytes, if measured.
+    """
+
+    name: str
+    requests: int
+    concurrency: int
+    errors: int = 0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list, repr=False)
+    alloc_bytes: float | None = None
+
+    @property
+    def throughput(self) -> float:
+        """Completed requests per second."""
+        return self.requests / self.wall_s if self.wall_s > 0 else 0.0
+
+    @property
+    def p50_ms(self) -> float:
+        return percentile(self.latencies_ms, 50)
+
+    @property
+    def p99_ms(self) -> float:
+        return percentile(self.latencies_ms, 99)
+
+    @property
+    def cpu_ms_per_request(self) -> float:
+        return self.cpu_s * 1000 / self.requests if self.requests else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """A JSON-serializable summary, without the raw latencies."""
+        return {
+            "name": self.name,
+            "requests": self.requests,
+            "concurrency": self.concurrency,
+            "errors": self.errors,
+            "throughput_rps": round(self.throughput, 2),
+            "p50_ms": round(self.p50_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
+            "cpu_ms_per_request": round(self.cpu_ms_per_request, 3),
+            "alloc_kb_per_request": (
+                round(self.alloc_bytes / 1024, 2) if self.alloc_bytes is not None else None
+            ),
+        }
+
+
+@dataclass
+class MixedLoadReport(LoadReport):
+    """
+    The result of driving a target with a mix of request types.
+
+    Attributes:
+        method_latencies_ms: Per-request latencies in milliseconds, by request type.
+        memory_growth_bytes: Memory still allocated after a traced run, if measured.
+    """
+
+    method_latencies_ms: dict[str, list[float]] = field(default_factory=dict, repr=False)
+    memory_growth_bytes: float | None = None
+
+    def method_percentiles(self) -> dict[str, dict[str, float]]:
+        """The count and p50/p95/p99 latency of each request type."""
+        return {
+            method: {
+                "count": len(latencies),
+                "p50_ms": round(percentile(latencies, 50), 3),
+                "p95_ms": round(percentile(latencies, 95), 3),
+                "p99_ms": round(percentile(latencies, 99), 3),
+            }
+            for method, latencies in sorted(self.method_latencies_ms.items())
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        summary = super().as_dict()
+        summary["methods"] = self.method_percentiles()
+        summary["memory_growth_kb"] = (
+            round(self.memory_growth_bytes / 1024, 2)
+            if self.memory_growth_bytes is not None
+            else None
+        )
+        return summary
+
+
+async def run_load(
+    name: str, request: RequestFactory, requests: int, concurrency: int
+) -> LoadReport:
+    """
+    Issue *requests* calls to *request*, keeping *concurrency* of them in flight.
+
+    This is a closed-loop generator: each of the *concurrency* workers sends its
+    next request as soon as the previous one completes.
+    """
+    report = LoadReport(name=name, requests=requests, concurrency=concurrency)
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            try:
+                await request()
+            except Exception:
+                report.errors += 1
+            report.latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(min(concurrency, requests), 1))))
+    report.wall_s = time.perf_counter() - wall_start
+    report.cpu_s = time.process_time() - cpu_start
+    return report
+
+
+async def run_mixed_load(
+    name: str,
+    requests_by_method: dict[str, RequestFactory],
+    weights: dict[str, float],
+    requests: int,
+    concurrency: int,
+    seed: int = 0,
+) -> MixedLoadReport:
+    """
+    Issue *requests* calls drawn from *requests_by_method*, keeping *concurrency* in flight.
+
+    Each request's type is drawn at random in proportion to *weights*; the draw is
+    seeded, so runs with the same arguments issue the same sequence.
+    """
+    methods = [method for method in weights if method in requests_by_method]
+    sequence = random.Random(seed).choices(  # noqa: S311
+        methods, weights=[weights[method] for method in methods], k=requests
+    )
+    report = MixedLoadReport(
+        name=name,
+        requests=requests,
+        concurrency=concurrency,
+        method_latencies_ms={method: [] for method in methods},
+    )
+    pending = iter(sequence)
+
+    async def worker() -> None:
+        for method in pending:
+            start = time.perf_counter()
+            try:
+                await requests_by_method[method]()
+            except Exception:
+                report.errors += 1
+            latency_ms = (time.perf_counter() - start) * 1000
+            report.latencies_ms.append(latency_ms)
+            report.method_latencies_ms[method].append(latency_ms)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(min(concurrency, requests), 1))))
+    report.wall_s = time.perf_counter() - wall_start
+    report.cpu_s = time.process_time() - cpu_start
+    return report
+
+
+async def measure_memory_growth(run: Callable[[], Awaitable[Any]]) -> float:
+    """
+    Return the number of bytes still allocated after *run* completes.
+
+    Garbage is collected before and after, so growth is memory the run retained
+    (caches, leaked tasks or buffers) rather than short-lived allocations.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        gc.collect()
+        baseline, _ = tracemalloc.get_traced_memory()
+        await run()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        return float(current - baseline)
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+async def measure_allocations(request: RequestFactory, samples: int = 20) -> float:
+    """
+    Return the mean peak number of bytes allocated by a single request.
+
+    Requests are issued one at a time with tracemalloc enabled, so this is
+    measured separately from the (much faster) throughput run.
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        # Warm up caches and lazy imports so they are not attributed to a request.
+        await request()
+        total = 0
+        for _ in range(samples):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await request()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - baseline
+        return total / samples
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
@@ -0,0 +1,118 @@
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from arcade_core.catalog import ToolCatalog
+
+from benchmarks.loadgen import (
+    LoadReport,
+    MixedLoadReport,
+    measure_allocations,
+    measure_memory_growth,
+    run_load,
+    run_mixed_load,
+)
+from benchmarks.targets import TARGETS
+from benchmarks.toolkits import ToolKind, build_catalog
+
+CATALOG_SIZES = (10, 100, 1_000, 5_000)
+OPERATIONS = ("call", "list", "mixed")
+
+# The share of each request type in "mixed" traffic
+DEFAULT_MIX: tuple[tuple[str, float], ...] = (("call", 70), ("list", 10), ("ping", 20))
+
+
+@cache
+def cached_catalog(size: int, kind: ToolKind) -> ToolCatalog:
+    """Build each (size, kind) catalog once per process; large catalogs take seconds."""
+    return build_catalog(size, kind)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    One benchmark configuration.
+
+    Attributes:
+        target: The server to drive ("worker" or "mcp").
+        kind: The workload of every tool in the catalog.
+        catalog_size: The number of tools in the catalog.
+        operation: "call" invokes the last tool in the catalog, "list" lists the catalog,
+            "mixed" interleaves calls, listings and pings in the proportions of `mix`.
+        requests: The number of requests to issue.
+        concurrency: The number of requests kept in flight.
+        mix: The relative weight of each request type ("call", "list", "ping") in
+            mixed traffic.
+    """
+
+    target: str
+    kind: ToolKind
+    catalog_size: int
+    operation: str = "call"
+    requests: int = 200
+    concurrency: int = 10
+    mix: tuple[tuple[str, float], ...] = DEFAULT_MIX
+
+    @property
+    def name(self) -> str:
+        return f"{self.target}/{self.operation}/{self.kind.value}/{self.catalog_size}"
+
+
+def parse_mix(value: str) -> tuple[tuple[str, float], ...]:
+    """Parse a mix such as "call=70,list=10,ping=20"."""
+    mix = []
+    for item in value.split(","):
+        request_type, _, weight = item.partition("=")
+        if request_type.strip() not in ("call", "list", "ping") or not weight:
+            raise ValueError(f"Invalid mix entry '{item}'. Use e.g. call=70,list=10,ping=20")
+        mix.append((request_type.strip(), float(weight)))
+    return tuple(mix)
+
+
+async def drive(scenario: Scenario, target: Any) -> LoadReport:
+    """Issue the scenario's requests to an open (and warmed up) target."""
+    if scenario.operation != "mixed":
+        request = target.call_tool if scenario.operation == "call" else target.list_tools
+        return await run_load(scenario.name, request, scenario.requests, scenario.concurrency)
+
+    requests_by_type = {"call": target.call_tool, "list": target.list_tools, "ping": target.ping}
+    return await run_mixed_load(
+        scenario.name,
+        requests_by_type,
+        dict(scenario.mix),
+        scenario.requests,
+        scenario.concurrency,
+    )
+
+
+async def run_scenario(scenario: Scenario, alloc_samples: int = 0) -> LoadReport:
+    """
+    Drive *scenario* and return its report.
+
+    Args:
+        scenario: The configuration to run.
+        alloc_samples: If positive, also measure per-request allocations
+            over this many sequential requests, and for mixed traffic, the memory
+            retained after the traffic is replayed.
+    """
+    if scenario.target not in TARGETS:
+        raise ValueError(f"Unknown target '{scenario.target}'. Choose from {sorted(TARGETS)}")
+    if scenario.operation not in OPERATIONS:
+        raise ValueError(f"Unknown operation '{scenario.operation}'. Choose from {OPERATIONS}")
+
+    catalog = cached_catalog(scenario.catalog_size, scenario.kind)
+    target_cls = TARGETS[scenario.target]
+    # Call the last tool added, which is the worst case for name lookups.
+    async with target_cls(catalog, scenario.kind, scenario.catalog_size - 1) as target:
+        request = target.list_tools if scenario.operation == "list" else target.call_tool
+        # Warm up so one-off costs (lazy imports, caches) are not part of the run.
+        await request()
+        report = await drive(scenario, target)
+        if alloc_samples > 0:
+            report.alloc_bytes = await measure_allocations(request, alloc_samples)
+            if isinstance(report, MixedLoadReport):
+                # A second, traced pass: what the same traffic leaves behind
+                report.memory_growth_bytes = await measure_memory_growth(
+                    lambda: drive(scenario, target)
+                )
+    return report
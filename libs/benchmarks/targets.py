@@ -0,0 +1,166 @@
+import asyncio
+import itertools
+import json
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import httpx
+from arcade_core.catalog import ToolCatalog
+from arcade_serve.fastapi.worker import FastAPIWorker
+from arcade_serve.mcp.server import MCPServer
+from fastapi import FastAPI
+
+from benchmarks.toolkits import BENCH_TOOLKIT, DEFAULT_INPUTS, ToolKind, tool_name
+
+
+class BenchmarkError(Exception):
+    """Raised when a benchmarked request does not succeed."""
+
+
+class WorkerTarget:
+    """
+    A FastAPIWorker hosted in-process and called through an ASGI transport,
+    so requests exercise routing, validation and execution without sockets.
+    """
+
+    def __init__(self, catalog: ToolCatalog, kind: ToolKind, tool_index: int) -> None:
+        self.app = FastAPI()
+        self.worker = FastAPIWorker(self.app, disable_auth=True)
+        self.worker.catalog = catalog
+        self.invoke_payload = {
+            "execution_id": "bench",
+            "tool": {"name": tool_name(kind, tool_index), "toolkit": BENCH_TOOLKIT},
+            "inputs": DEFAULT_INPUTS[kind],
+        }
+        self.client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> "WorkerTarget":
+        self.client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app), base_url="http://bench"
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self.client is not None:
+            await self.client.aclose()
+
+    async def call_tool(self) -> None:
+        assert self.client is not None
+        response = await self.client.post("/worker/tools/invoke", json=self.invoke_payload)
+        if response.status_code != 200 or not response.json().get("success"):
+            raise BenchmarkError(f"Tool call failed: {response.status_code} {response.text[:200]}")
+
+    async def list_tools(self) -> None:
+        assert self.client is not None
+        response = await self.client.get("/worker/tools")
+        if response.status_code != 200:
+            raise BenchmarkError(f"Listing tools failed: {response.status_code}")
+
+    async def ping(self) -> None:
+        assert self.client is not None
+        response = await self.client.get("/worker/health")
+        if response.status_code != 200:
+            raise BenchmarkError(f"Health check failed: {response.status_code}")
+
+
+class InMemoryMCPClient:
+    """
+    A minimal MCP client connected to ``MCPServer.run_connection`` through in-memory streams.
+
+    The client is the write stream of the connection: responses sent by the
+    server are matched to the pending request with the same JSON-RPC id.
+    """
+
+    def __init__(self, server: MCPServer) -> None:
+        self.server = server
+        self.notifications: list[dict[str, Any]] = []
+        self._inbox: asyncio.Queue[str | None] = asyncio.Queue()
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._ids = itertools.count(1)
+        self._connection: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> "InMemoryMCPClient":
+        self._connection = asyncio.create_task(
+            self.server.run_connection(self._read_stream(), self, {"user_id": "bench"})
+        )
+        await self.request("initialize", {"protocolVersion": "2024-11-05", "capabilities": {}})
+        await self.notify("notifications/initialized")
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._inbox.put(None)
+        if self._connection is not None:
+            await self._connection
+
+    async def _read_stream(self) -> AsyncGenerator[str, None]:
+        while True:
+            message = await self._inbox.get()
+            if message is None:
+                return
+            yield message
+
+    async def send(self, message: str) -> None:
+        """Receive a message written by the server."""
+        parsed = json.loads(message)
+        future = self._pending.pop(parsed.get("id"), None) if isinstance(parsed, dict) else None
+        if future is None:
+            self.notifications.append(parsed)
+        elif not future.done():
+            future.set_result(parsed)
+
+    async def request(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Send a request and wait for the matching response."""
+        request_id = next(self._ids)
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+        await self._inbox.put(json.dumps(message) + "\n")
+        return await future
+
+    async def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Send a notification, which has no response."""
+        message = {"jsonrpc": "2.0", "method": method, "params": params or {}}
+        await self._inbox.put(json.dumps(message) + "\n")
+
+
+class MCPTarget:
+    """
+    An MCPServer driven over a single in-memory connection, the way a stdio
+    client such as Claude Desktop would drive it.
+    """
+
+    def __init__(self, catalog: ToolCatalog, kind: ToolKind, tool_index: int) -> None:
+        self.server = MCPServer(catalog, enable_logging=False, api_key="bench")  # type: ignore[arg-type]
+        self.call_params = {
+            "name": f"{BENCH_TOOLKIT.capitalize()}_{tool_name(kind, tool_index)}",
+            "arguments": DEFAULT_INPUTS[kind],
+        }
+        self.client = InMemoryMCPClient(self.server)
+
+    async def __aenter__(self) -> "MCPTarget":
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.client.__aexit__(*exc_info)
+
+    async def call_tool(self) -> None:
+        response = await self.client.request("tools/call", self.call_params)
+        if "error" in response:
+            raise BenchmarkError(f"Tool call failed: {response['error']}")
+
+    async def list_tools(self) -> None:
+        response = await self.client.request("tools/list")
+        if "error" in response:
+            raise BenchmarkError(f"Listing tools failed: {response['error']}")
+
+    async def ping(self) -> None:
+        response = await self.client.request("ping")
+        if "error" in response:
+            raise BenchmarkError(f"Ping failed: {response['error']}")
+
+
+TARGETS: dict[str, type[WorkerTarget] | type[MCPTarget]] = {
+    "worker": WorkerTarget,
+    "mcp": MCPTarget,
+}
@@ -0,0 +1,9 @@
+import pytest
+
+from benchmarks.toolkits import ToolKind, build_catalog
+
+
+@pytest.mark.parametrize("size", [10, 100, 1_000])
+def test_build_catalog(benchmark, size):
+    catalog = benchmark.pedantic(build_catalog, args=(size, ToolKind.NOOP), rounds=3)
+    assert len(catalog) == size
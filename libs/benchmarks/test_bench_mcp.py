@@ -0,0 +1,28 @@
+import pytest
+
+from benchmarks.scenarios import CATALOG_SIZES, Scenario
+from benchmarks.toolkits import ToolKind
+
+
+@pytest.mark.parametrize("size", CATALOG_SIZES)
+@pytest.mark.parametrize("kind", list(ToolKind))
+def test_mcp_call_tool(run_benchmark, kind, size):
+    run_benchmark(Scenario(target="mcp", kind=kind, catalog_size=size))
+
+
+@pytest.mark.parametrize("size", CATALOG_SIZES)
+def test_mcp_list_tools(run_benchmark, size):
+    run_benchmark(Scenario(target="mcp", kind=ToolKind.NOOP, catalog_size=size, operation="list"))
+
+
+@pytest.mark.parametrize("concurrency", [1, 50])
+def test_mcp_mixed_traffic(run_benchmark, concurrency):
+    run_benchmark(
+        Scenario(
+            target="mcp",
+            kind=ToolKind.SLEEP,
+            catalog_size=100,
+            operation="mixed",
+            concurrency=concurrency,
+        )
+    )
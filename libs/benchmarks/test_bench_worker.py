@@ -0,0 +1,17 @@
+import pytest
+
+from benchmarks.scenarios import CATALOG_SIZES, Scenario
+from benchmarks.toolkits import ToolKind
+
+
+@pytest.mark.parametrize("size", CATALOG_SIZES)
+@pytest.mark.parametrize("kind", list(ToolKind))
+def test_worker_call_tool(run_benchmark, kind, size):
+    run_benchmark(Scenario(target="worker", kind=kind, catalog_size=size))
+
+
+@pytest.mark.parametrize("size", CATALOG_SIZES)
+def test_worker_get_catalog(run_benchmark, size):
+    run_benchmark(
+        Scenario(target="worker", kind=ToolKind.NOOP, catalog_size=size, operation="list")
+    )
@@ -0,0 +1,108 @@
+import asyncio
+import hashlib
+import types
+from enum import Enum
+from typing import Annotated, Callable
+
+from arcade_core.catalog import ToolCatalog
+from arcade_tdk import tool
+
+BENCH_TOOLKIT = "bench"
+"""Toolkit name used for every synthetic tool."""
+
+
+class ToolKind(str, Enum):
+    """The synthetic workloads a benchmark catalog can be made of."""
+
+    NOOP = "noop"
+    SLEEP = "sleep"
+    CPU = "cpu"
+    PAYLOAD = "payload"
+
+
+# The templates below are copied (not wrapped) to produce thousands of distinct tools.
+# They must live at module level so the catalog can read their source with inspect.
+
+
+def _noop_template(value: Annotated[str, "Any string"] = "ping") -> Annotated[str, "The input"]:
+    """Return the input unchanged."""
+    return value
+
+
+async def _sleep_template(
+    delay_ms: Annotated[int, "Milliseconds to sleep"] = 10,
+) -> Annotated[str, "Always 'ok'"]:
+    """Sleep asynchronously to simulate an upstream API call."""
+    await asyncio.sleep(delay_ms / 1000)
+    return "ok"
+
+
+def _cpu_template(
+    rounds: Annotated[int, "Number of hash rounds"] = 2_000,
+) -> Annotated[str, "The final digest"]:
+    """
+    Burn CPU in a sync tool by hashing in a loop. The MCP server runs it in a worker
+    thread; the HTTP worker runs it inline on the event loop.
+    """
+    digest = b"arcade"
+    for _ in range(rounds):
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()
+
+
+def _payload_template(
+    size_kb: Annotated[int, "Approximate payload size in KiB"] = 256,
+) -> Annotated[dict, "A large JSON object"]:
+    """Return a large JSON payload to stress serialization."""
+    row = "x" * 1024
+    return {"rows": [row for _ in range(size_kb)], "size_kb": size_kb}
+
+
+_TEMPLATES: dict[ToolKind, Callable] = {
+    ToolKind.NOOP: _noop_template,
+    ToolKind.SLEEP: _sleep_template,
+    ToolKind.CPU: _cpu_template,
+    ToolKind.PAYLOAD: _payload_template,
+}
+
+DEFAULT_INPUTS: dict[ToolKind, dict[str, int | str]] = {
+    ToolKind.NOOP: {"value": "ping"},
+    ToolKind.SLEEP: {"delay_ms": 10},
+    ToolKind.CPU: {"rounds": 2_000},
+    ToolKind.PAYLOAD: {"size_kb": 256},
+}
+"""Inputs sent with every call, per tool kind."""
+
+
+def tool_name(kind: ToolKind, index: int) -> str:
+    """The (PascalCase) tool name of the *index*-th synthetic tool of *kind*."""
+    return f"{kind.value.capitalize()}{index:05d}"
+
+
+def make_tool(kind: ToolKind, index: int) -> Callable:
+    """Create a new, uniquely-named tool function from the template for *kind*."""
+    template = _TEMPLATES[kind]
+    func = types.FunctionType(
+        template.__code__,
+        template.__globals__,
+        tool_name(kind, index),
+        template.__defaults__,
+        template.__closure__,
+    )
+    func.__annotations__ = dict(template.__annotations__)
+    func.__doc__ = template.__doc__
+    func.__qualname__ = func.__name__
+    return tool(func)
+
+
+def build_catalog(size: int, kind: ToolKind = ToolKind.NOOP) -> ToolCatalog:
+    """
+    Build a catalog of *size* synthetic tools.
+
+    Every tool in the catalog has the same workload (*kind*), so a benchmark that
+    targets the last tool also measures the cost of looking it up in a large catalog.
+    """
+    catalog = ToolCatalog()
+    for index in range(size):
+        catalog.add_tool(make_tool(kind, index), BENCH_TOOLKIT)
+    return catalog
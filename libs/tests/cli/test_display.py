@@ -0,0 +1,37 @@
+import pytest
+from arcade_cli.display import _format_percentiles, display_eval_results
+from arcade_evals.eval import EvaluationResult
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([], "-"),
+        ([None, None], "-"),
+        ([250.0], "250 / 250"),
+        ([float(value) for value in range(1, 101)], "50 / 95"),
+        ([10, None, 30, 20], "20 / 30"),
+    ],
+)
+def test_format_percentiles(values, expected):
+    assert _format_percentiles(values) == expected
+
+
+def test_display_eval_results_shows_request_metrics(capsys):
+    cases = [
+        {
+            "name": f"case {i}",
+            "evaluation": EvaluationResult(score=1.0, passed=True),
+            "metrics": {"wall_time_ms": 100.0 * i, "prompt_tokens": 500, "completion_tokens": 20},
+        }
+        for i in range(1, 5)
+    ]
+    results = [[{"suite": "messages", "model": "gpt-4o", "rubric": None, "cases": cases}]]
+
+    display_eval_results(results)
+
+    output = capsys.readouterr().out
+    assert "Model requests (p50 / p95)" in output
+    assert "messages" in output
+    assert "200 / 400" in output
+    assert "500 / 500" in output
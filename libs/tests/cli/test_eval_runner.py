@@ -0,0 +1,106 @@
+from pathlib import Path
+
+from arcade_cli.eval_runner import merge_shard_results, shard_evaluations
+from arcade_core.config_model import ApiConfig, Config
+from arcade_evals import CacheMode, ResponseCache, ResultsLog
+
+CONFIG = Config(api=ApiConfig(key="test"))
+
+
+def test_shard_evaluations_splits_units_and_limits(tmp_path):
+    eval_files = [Path("eval_a.py"), Path("eval_b.py"), Path("eval_c.py")]
+    shards = shard_evaluations(
+        eval_files,
+        ["gpt-4o", "gpt-4o-mini"],
+        processes=4,
+        max_concurrency=10,
+        requests_per_minute=100,
+        tokens_per_minute=None,
+        response_cache=ResponseCache(tmp_path / "cache", mode=CacheMode.REPLAY),
+        results_log=ResultsLog(tmp_path / "results.jsonl"),
+        config=CONFIG,
+        base_url="http://localhost:9099",
+    )
+
+    assert [shard.units for shard in shards] == [
+        [(Path("eval_a.py"), "gpt-4o"), (Path("eval_c.py"), "gpt-4o")],
+        [(Path("eval_a.py"), "gpt-4o-mini"), (Path("eval_c.py"), "gpt-4o-mini")],
+        [(Path("eval_b.py"), "gpt-4o")],
+        [(Path("eval_b.py"), "gpt-4o-mini")],
+    ]
+    # Two shards run each model, so each gets half of that model's limits
+    assert shards[0].requests_per_minute == {"gpt-4o": 50}
+    assert shards[3].requests_per_minute == {"gpt-4o-mini": 50}
+    assert shards[0].tokens_per_minute == {"gpt-4o": None}
+    # The concurrency of the run is spread over the shards, without exceeding it
+    assert [shard.max_concurrency for shard in shards] == [3, 3, 2, 2]
+    assert {shard.cache_mode for shard in shards} == {"replay"}
+    assert {shard.cache_dir for shard in shards} == {str(tmp_path / "cache")}
+    assert {shard.results_file for shard in shards} == {str(tmp_path / "results.jsonl")}
+    assert [shard.shard_results_file for shard in shards] == [
+        str(tmp_path / f"results.shard{index}.jsonl") for index in range(4)
+    ]
+
+
+def test_shard_evaluations_uses_at_most_one_process_per_concurrent_request():
+    shards = shard_evaluations(
+        [Path("eval_a.py"), Path("eval_b.py")],
+        ["gpt-4o", "gpt-4o-mini"],
+        processes=4,
+        max_concurrency=2,
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        config=CONFIG,
+        base_url="http://localhost:9099",
+    )
+
+    assert len(shards) == 2
+    assert [shard.max_concurrency for shard in shards] == [1, 1]
+    assert sum(len(shard.units) for shard in shards) == 4
+
+
+def test_shard_results_are_merged_into_the_results_file(tmp_path):
+    results_log = ResultsLog(tmp_path / "results.jsonl")
+    results_log.record("suite", "gpt-4o", "earlier", "hash-0", [])
+    shards = shard_evaluations(
+        [Path("eval_a.py"), Path("eval_b.py")],
+        ["gpt-4o"],
+        processes=2,
+        max_concurrency=2,
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        results_log=results_log,
+        config=CONFIG,
+        base_url="http://localhost:9099",
+    )
+    for index, shard in enumerate(shards):
+        # What each worker does: record to its own file, resuming from the run's file
+        assert shard.shard_results_file is not None
+        shard_log = ResultsLog(shard.shard_results_file, resume_from=shard.results_file)
+        assert shard_log.recorded("suite", "gpt-4o", "hash-0") is not None
+        shard_log.record("suite", "gpt-4o", f"case {index}", f"hash-{index + 1}", [])
+
+    merge_shard_results(shards)
+
+    resumed = ResultsLog(tmp_path / "results.jsonl", resume=True)
+    assert all(resumed.recorded("suite", "gpt-4o", f"hash-{i}") for i in range(3))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["results.jsonl"]
+
+
+def test_shard_evaluations_uses_at_most_one_process_per_unit():
+    shards = shard_evaluations(
+        [Path("eval_a.py")],
+        ["gpt-4o"],
+        processes=8,
+        max_concurrency=4,
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        config=CONFIG,
+        base_url="http://localhost:9099",
+    )
+
+    assert len(shards) == 1
+    assert shards[0].max_concurrency == 4
+    assert shards[0].requests_per_minute == {"gpt-4o": None}
+    assert shards[0].cache_mode is None
+    assert shards[0].results_file is None
@@ -0,0 +1,52 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Dependencies that take tens to hundreds of milliseconds to import. Commands that
+# don't need them (e.g. `arcade --help`, or the stdio MCP server) must not load them.
+HEAVY_MODULES = [
+    "arcadepy",
+    "fastapi",
+    "openai",
+    "opentelemetry.exporter",
+    "opentelemetry.instrumentation",
+    "opentelemetry.sdk",
+    "starlette",
+    "tqdm",
+    "uvicorn",
+    "watchfiles",
+]
+
+
+def _loaded_heavy_modules(module: str) -> list[str]:
+    """Import `module` in a fresh interpreter and return the heavy modules it loaded."""
+    code = (
+        "import importlib, json, sys\n"
+        f"importlib.import_module({module!r})\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])  # type: ignore[no-any-return]
+
+
+@pytest.mark.parametrize(
+    "module, allowed",
+    [
+        pytest.param("arcade_cli.main", [], id="cli"),
+        pytest.param("arcade_cli.serve", [], id="serve command"),
+        pytest.param("arcade_core.telemetry", [], id="telemetry"),
+        # The MCP server talks to the Arcade API to authorize tools
+        pytest.param("arcade_serve.mcp.stdio", ["arcadepy"], id="mcp stdio server"),
+    ],
+)
+def test_import_does_not_load_heavy_dependencies(module: str, allowed: list[str]) -> None:
+    loaded = [name for name in _loaded_heavy_modules(module) if name not in allowed]
+
+    assert loaded == [], (
+        f"Importing {module} loads {', '.join(loaded)}. "
+        "Import heavy dependencies inside the function or command that needs them."
+    )
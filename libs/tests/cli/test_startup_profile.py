@@ -0,0 +1,81 @@
+import importlib
+import json
+import sys
+import time
+
+import pytest
+from arcade_cli.startup_profile import StartupProfiler, server_modules
+
+
+@pytest.fixture
+def fake_package(tmp_path, monkeypatch):
+    """A package whose modules sleep on import, so their import time is measurable."""
+    package_dir = tmp_path / "slow_pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(
+        "import time\nimport slow_pkg.child\ntime.sleep(0.02)\n"
+    )
+    (package_dir / "child.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "slow_pkg"
+    for name in ("slow_pkg", "slow_pkg.child"):
+        sys.modules.pop(name, None)
+
+
+def test_records_nested_import_times(fake_package):
+    profiler = StartupProfiler()
+    profiler.start()
+    try:
+        importlib.import_module(fake_package)
+    finally:
+        profiler.stop()
+
+    imports = {span.name: span for span in profiler.spans_by_category("import")}
+    parent, child = imports["slow_pkg"], imports["slow_pkg.child"]
+
+    assert child.self_time >= 0.05
+    assert parent.duration >= child.duration + 0.02
+    # The child's import time is excluded from the parent's self time
+    assert 0.02 <= parent.self_time < child.self_time
+    assert profiler.import_time_by_package()["slow_pkg"] == pytest.approx(
+        parent.self_time + child.self_time
+    )
+
+
+def test_stop_removes_import_hook():
+    profiler = StartupProfiler()
+    profiler.start()
+    profiler.stop()
+    assert all(type(finder).__name__ != "_ImportTimingFinder" for finder in sys.meta_path)
+
+
+def test_chrome_trace_export(tmp_path):
+    profiler = StartupProfiler()
+    with profiler.phase("Discover toolkits"):
+        time.sleep(0.001)
+
+    trace_path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(trace_path)
+
+    trace = json.loads(trace_path.read_text())
+    (event,) = trace["traceEvents"]
+    assert event["name"] == "Discover toolkits"
+    assert event["ph"] == "X"
+    assert event["cat"] == "phase"
+    assert event["dur"] >= 1000  # microseconds
+
+
+@pytest.mark.parametrize(
+    "mcp, transport, expected",
+    [
+        (False, "stdio", "arcade_serve.fastapi.worker"),
+        (True, "stdio", "arcade_serve.mcp.stdio"),
+        (True, "http", "arcade_serve.mcp.http"),
+    ],
+)
+def test_server_modules_include_the_lazily_imported_server(mcp, transport, expected):
+    modules = server_modules(mcp, transport)
+
+    assert expected in modules
+    for module in modules:
+        importlib.import_module(module)
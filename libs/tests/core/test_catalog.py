@@ -31,6 +31,16 @@ def test_add_tool_with_toolkit_name():
     )
 
 
+def test_revision_increases_when_a_tool_is_added():
+    catalog = ToolCatalog()
+    assert catalog.revision == 0
+
+    catalog.add_tool(sample_tool, "sample_toolkit")
+
+    assert catalog.revision == 1
+    assert ToolCatalog().revision == 0
+
+
 def test_add_tool_with_toolkit():
     catalog = ToolCatalog()
     toolkit = Toolkit(
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Annotated
 
 import pytest
@@ -45,6 +46,13 @@ def bad_output_error_tool() -> Annotated[str, "output"]:
     return {"output": "test"}
 
 
+@tool
+async def blocking_tool() -> Annotated[str, "output"]:
+    """Tool that waits until it is cancelled"""
+    await asyncio.Event().wait()
+    return "done"
+
+
 # ---- Test Driver ----
 
 catalog = ToolCatalog()
@@ -54,6 +62,7 @@ catalog.add_tool(retryable_error_tool, "simple_toolkit")
 catalog.add_tool(exec_error_tool, "simple_toolkit")
 catalog.add_tool(unexpected_error_tool, "simple_toolkit")
 catalog.add_tool(bad_output_error_tool, "simple_toolkit")
+catalog.add_tool(blocking_tool, "simple_toolkit")
 
 
 @pytest.mark.asyncio
@@ -183,3 +192,25 @@ def check_output(output: ToolCallOutput, expected_output: ToolCallOutput):
             assert output_log.message == expected_log.message
             assert output_log.level == expected_log.level
             assert output_log.subtype == expected_log.subtype
+
+
+@pytest.mark.asyncio
+async def test_tool_executor_propagates_cancellation():
+    tool_definition = catalog.find_tool_by_func(blocking_tool)
+    full_tool = catalog.get_tool(tool_definition.get_fully_qualified_name())
+    task = asyncio.create_task(
+        ToolExecutor.run(
+            func=blocking_tool,
+            definition=tool_definition,
+            input_model=full_tool.input_model,
+            output_model=full_tool.output_model,
+            context=ToolContext(),
+        )
+    )
+    await asyncio.sleep(0)
+
+    task.cancel()
+
+    # Cancellation stops the tool instead of being reported as a tool error
+    with pytest.raises(asyncio.CancelledError):
+        await task
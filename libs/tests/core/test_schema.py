@@ -116,3 +116,25 @@ def test_get_metadata_with_empty_key():
 
     with pytest.raises(ValueError, match="Metadata key passed to get_metadata cannot be empty."):
         tool_context.get_metadata("")
+
+
+@pytest.mark.asyncio
+async def test_report_progress_without_reporter_does_nothing():
+    tool_context = ToolContext()
+
+    await tool_context.report_progress(1, 2)
+
+
+@pytest.mark.asyncio
+async def test_report_progress_forwards_to_reporter():
+    updates = []
+
+    async def reporter(progress, total, message):
+        updates.append((progress, total, message))
+
+    tool_context = ToolContext()
+    tool_context.set_progress_reporter(reporter)
+    await tool_context.report_progress(3, 10, "Fetched 3 of 10")
+
+    assert updates == [(3, 10, "Fetched 3 of 10")]
+    assert "progress_reporter" not in tool_context.model_dump_json()
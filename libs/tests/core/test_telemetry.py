@@ -16,10 +16,10 @@ def handler_disabled(app):
 
 
 @patch("arcade_core.telemetry.logging")
-@patch("arcade_core.telemetry.FastAPIInstrumentor")
-@patch("arcade_core.telemetry.OTLPLogExporter")
-@patch("arcade_core.telemetry.OTLPMetricExporter")
-@patch("arcade_core.telemetry.OTLPSpanExporter")
+@patch("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor")
+@patch("opentelemetry.exporter.otlp.proto.http._log_exporter.OTLPLogExporter")
+@patch("opentelemetry.exporter.otlp.proto.http.metric_exporter.OTLPMetricExporter")
+@patch("opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter")
 def test_init_with_enable_true(
     mock_span_exporter,
     mock_metric_exporter,
@@ -54,7 +54,7 @@ def test_init_with_enable_true(
 
 
 @patch("arcade_core.telemetry.logging")
-@patch("arcade_core.telemetry.FastAPIInstrumentor")
+@patch("opentelemetry.instrumentation.fastapi.FastAPIInstrumentor")
 def test_init_with_enable_false(mock_instrumentor, mock_logging, app):
     handler = OTELHandler(enable=False)
     handler.instrument_app(app)
@@ -81,9 +81,9 @@ def test_init_tracer_export_exception(app):
     assert "Could not connect to OpenTelemetry Tracer endpoint" in str(exc_info.value)
 
 
-@patch("arcade_core.telemetry.OTLPLogExporter")
-@patch("arcade_core.telemetry.OTLPMetricExporter")
-@patch("arcade_core.telemetry.OTLPSpanExporter")
+@patch("opentelemetry.exporter.otlp.proto.http._log_exporter.OTLPLogExporter")
+@patch("opentelemetry.exporter.otlp.proto.http.metric_exporter.OTLPMetricExporter")
+@patch("opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter")
 def test_shutdown(mock_span_exporter, mock_metric_exporter, mock_log_exporter, app):
     # Mock the shutdown methods
     mock_span_exporter.return_value.shutdown = MagicMock()
@@ -121,9 +121,9 @@ def test_shutdown_logging_not_initialized(handler_disabled):
 
 
 @patch("arcade_core.telemetry.get_meter_provider")
-@patch("arcade_core.telemetry.OTLPLogExporter")
-@patch("arcade_core.telemetry.OTLPMetricExporter")
-@patch("arcade_core.telemetry.OTLPSpanExporter")
+@patch("opentelemetry.exporter.otlp.proto.http._log_exporter.OTLPLogExporter")
+@patch("opentelemetry.exporter.otlp.proto.http.metric_exporter.OTLPMetricExporter")
+@patch("opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter")
 def test_get_meter(
     mock_span_exporter, mock_metric_exporter, mock_log_exporter, mock_get_meter_provider, app
 ):
@@ -0,0 +1,163 @@
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Annotated
+
+import pytest
+from arcade_core.catalog import ToolCatalog
+from arcade_core.schema import ToolCallError, ToolContext
+from arcade_serve.mcp.auth_cache import (
+    AuthorizationCache,
+    auth_cache_key,
+    is_unauthorized_error,
+)
+from arcade_serve.mcp.server import MCPServer
+from arcade_tdk import tool
+from arcade_tdk.auth import GitHub
+from arcade_tdk.errors import ToolExecutionError
+
+pytestmark = pytest.mark.asyncio
+
+KEY = ("user@example.com", "github", ("repo",))
+
+
+def _completed(token="token-1"):  # noqa: S107
+    return SimpleNamespace(status="completed", url=None, context=SimpleNamespace(token=token))
+
+
+class _CountingFetch:
+    def __init__(self, response, delay=0.0):
+        self.response = response
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.response
+
+
+async def test_completed_authorization_is_reused():
+    cache = AuthorizationCache(ttl=60)
+    fetch = _CountingFetch(_completed())
+
+    first = await cache.get_or_fetch(KEY, fetch)
+    second = await cache.get_or_fetch(KEY, fetch)
+
+    assert first is second
+    assert fetch.calls == 1
+
+
+async def test_pending_authorization_is_not_cached():
+    cache = AuthorizationCache(ttl=60)
+    fetch = _CountingFetch(SimpleNamespace(status="pending", url="https://auth", context=None))
+
+    await cache.get_or_fetch(KEY, fetch)
+    await cache.get_or_fetch(KEY, fetch)
+
+    assert fetch.calls == 2
+
+
+async def test_concurrent_lookups_share_one_fetch():
+    cache = AuthorizationCache(ttl=60)
+    fetch = _CountingFetch(_completed(), delay=0.05)
+
+    results = await asyncio.gather(*(cache.get_or_fetch(KEY, fetch) for _ in range(10)))
+
+    assert fetch.calls == 1
+    assert all(result is results[0] for result in results)
+
+
+async def test_expired_entry_is_fetched_again():
+    cache = AuthorizationCache(ttl=0.01)
+    fetch = _CountingFetch(_completed())
+
+    await cache.get_or_fetch(KEY, fetch)
+    await asyncio.sleep(0.02)
+    await cache.get_or_fetch(KEY, fetch)
+
+    assert fetch.calls == 2
+
+
+async def test_invalidated_entry_is_fetched_again():
+    cache = AuthorizationCache(ttl=60)
+    fetch = _CountingFetch(_completed())
+
+    await cache.get_or_fetch(KEY, fetch)
+    cache.invalidate(KEY)
+    await cache.get_or_fetch(KEY, fetch)
+
+    assert fetch.calls == 2
+
+
+async def test_cache_key_ignores_scope_order():
+    requirement = {"provider_id": "github", "oauth2": {"scopes": ["repo", "gist"]}}
+    reordered = {"provider_id": "github", "oauth2": {"scopes": ["gist", "repo"]}}
+
+    assert auth_cache_key(requirement, "u") == auth_cache_key(reordered, "u")
+    assert auth_cache_key(requirement, "u") != auth_cache_key(requirement, "v")
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (ToolCallError(message="Unauthorized: Invalid or expired token"), True),
+        (ToolCallError(message="Error", developer_message="Client error '401 Unauthorized'"), True),
+        (ToolCallError(message="Error", developer_message="404 Not Found"), False),
+        (None, False),
+    ],
+)
+async def test_is_unauthorized_error(error, expected):
+    assert is_unauthorized_error(error) is expected
+
+
+# ---------------------------------------------------------------------------
+# MCPServer integration
+# ---------------------------------------------------------------------------
+
+
+class _FakeAuth:
+    def __init__(self):
+        self.calls = 0
+
+    async def authorize(self, auth_requirement, user_id):
+        self.calls += 1
+        return _completed(token=f"token-{self.calls}")
+
+
+tokens_seen: list[str] = []
+
+
+@tool(requires_auth=GitHub(scopes=["repo"]))
+def list_repos(context: ToolContext, fail: Annotated[bool, "fail"] = False) -> Annotated[str, "x"]:
+    """List the user's repositories."""
+    tokens_seen.append(context.get_auth_token_or_empty())
+    if fail:
+        raise ToolExecutionError("Unauthorized: Invalid or expired token")
+    return "repos"
+
+
+async def test_server_reuses_authorization_until_token_is_rejected():
+    catalog = ToolCatalog()
+    catalog.add_tool(list_repos, "github")
+    server = MCPServer(catalog, enable_logging=False, api_key="test")
+    server.arcade = SimpleNamespace(auth=_FakeAuth())  # type: ignore[assignment]
+    tokens_seen.clear()
+
+    async def call(fail=False):
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "Github_ListRepos", "arguments": {"fail": fail}},
+        }
+        return await server.handle_message(json.dumps(request), user_id="u")
+
+    await call()
+    await call()
+    assert server.arcade.auth.calls == 1
+
+    await call(fail=True)
+    await call()
+    assert server.arcade.auth.calls == 2
+    assert tokens_seen == ["token-1", "token-1", "token-1", "token-2"]
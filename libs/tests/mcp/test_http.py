@@ -0,0 +1,282 @@
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import Annotated
+
+import httpx
+import pytest
+from arcade_core.catalog import ToolCatalog
+from arcade_serve.mcp import http
+from arcade_serve.mcp import server as mcp_server
+from arcade_serve.mcp.http import SESSION_ID_HEADER, USER_ID_HEADER, HTTPServer, HTTPSession
+from arcade_tdk import tool
+from fastapi import FastAPI
+
+pytestmark = pytest.mark.asyncio
+
+SECRET = "test-secret"  # noqa: S105
+
+
+@tool
+def multiply(a: Annotated[int, "a"], b: Annotated[int, "b"]) -> Annotated[int, "result"]:
+    """Return the product of *a* and *b*."""
+
+    return a * b
+
+
+@pytest.fixture
+def catalog():
+    catalog = ToolCatalog()
+    catalog.add_tool(multiply, "test_toolkit")
+    return catalog
+
+
+@asynccontextmanager
+async def _serve(catalog, secret=SECRET, **kwargs):
+    """Yield an HTTPServer mounted on an app, and a client for the app that sends the secret."""
+    server = HTTPServer(catalog, enable_logging=False, api_key="test", secret=secret, **kwargs)
+    app = FastAPI()
+    server.mount(app)
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {secret}"} if secret else {}
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test", headers=headers
+        ) as client:
+            yield server, client
+    finally:
+        await server.shutdown()
+
+
+def _request(request_id, method, params=None):
+    message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        message["params"] = params
+    return message
+
+
+async def _open_session(client, user_id=None):
+    headers = {USER_ID_HEADER: user_id} if user_id else {}
+    response = await client.post("/mcp", json=_request(0, "initialize", {}), headers=headers)
+    assert response.status_code == 200
+    return response.headers[SESSION_ID_HEADER]
+
+
+async def test_initialize_opens_a_session_for_the_user(catalog):
+    async with _serve(catalog) as (server, client):
+        session_id = await _open_session(client, user_id="alice@example.com")
+
+        assert server.sessions[session_id].user_id == "alice@example.com"
+
+
+async def test_session_handles_tool_calls(catalog):
+    async with _serve(catalog) as (_, client):
+        session_id = await _open_session(client)
+        headers = {SESSION_ID_HEADER: session_id}
+
+        initialized = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+        response = await client.post("/mcp", json=initialized, headers=headers)
+        assert response.status_code == 202
+
+        call = _request(
+            1, "tools/call", {"name": "TestToolkit_Multiply", "arguments": {"a": 6, "b": 7}}
+        )
+        response = await client.post("/mcp", json=call, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {"content": [{"type": "text", "text": "42"}]},
+    }
+
+
+async def test_sessions_share_the_tool_list(catalog, monkeypatch):
+    calls = []
+    original = mcp_server.create_mcp_tool
+
+    def counting_create_mcp_tool(tool):
+        calls.append(tool)
+        return original(tool)
+
+    monkeypatch.setattr(mcp_server, "create_mcp_tool", counting_create_mcp_tool)
+
+    async with _serve(catalog) as (server, client):
+        for user_id in ["alice", "bob", "carol"]:
+            session_id = await _open_session(client, user_id=user_id)
+            response = await client.post(
+                "/mcp", json=_request(1, "tools/list"), headers={SESSION_ID_HEADER: session_id}
+            )
+            tools = response.json()["result"]["tools"]
+            assert [t["name"] for t in tools] == ["TestToolkit_Multiply"]
+
+        assert len(server.sessions) == 3
+    assert len(calls) == 1
+
+
+async def test_requests_need_a_known_session(catalog):
+    async with _serve(catalog) as (_, client):
+        missing = await client.post("/mcp", json=_request(1, "ping"))
+        unknown = await client.post(
+            "/mcp", json=_request(1, "ping"), headers={SESSION_ID_HEADER: "unknown"}
+        )
+
+    assert missing.status_code == 400
+    assert unknown.status_code == 404
+
+
+async def test_delete_closes_the_session(catalog):
+    async with _serve(catalog) as (server, client):
+        session_id = await _open_session(client)
+        task = server.sessions[session_id].task
+
+        response = await client.delete("/mcp", headers={SESSION_ID_HEADER: session_id})
+
+        assert response.status_code == 204
+        assert session_id not in server.sessions
+        assert task.done()
+
+
+async def test_secret_is_required(catalog):
+    async with _serve(catalog) as (_, client):
+        denied = await client.post(
+            "/mcp", json=_request(0, "initialize", {}), headers={"Authorization": "Bearer nope"}
+        )
+        allowed = await client.post("/mcp", json=_request(0, "initialize", {}))
+
+    assert denied.status_code == 401
+    assert allowed.status_code == 200
+
+
+async def test_server_needs_a_secret_unless_auth_is_disabled(catalog):
+    with pytest.raises(ValueError, match="ARCADE_WORKER_SECRET"):
+        HTTPServer(catalog, enable_logging=False, api_key="test")
+
+
+async def test_user_id_is_ignored_without_auth(catalog):
+    async with _serve(catalog, secret=None, disable_auth=True) as (server, client):
+        session_id = await _open_session(client, user_id="alice@example.com")
+
+        assert server.sessions[session_id].user_id is None
+
+
+@pytest.mark.parametrize(
+    "origin, status_code",
+    [
+        ("http://localhost:6274", 200),
+        ("http://127.0.0.1", 200),
+        ("https://app.example.com", 200),
+        ("https://evil.example.com", 403),
+        ("null", 403),
+    ],
+)
+async def test_requests_from_other_origins_are_rejected(catalog, origin, status_code):
+    async with _serve(catalog, allowed_origins=["https://app.example.com"]) as (_, client):
+        response = await client.post(
+            "/mcp", json=_request(0, "initialize", {}), headers={"Origin": origin}
+        )
+
+    assert response.status_code == status_code
+
+
+async def test_dropped_notifications_are_warned_about_once(caplog):
+    session = HTTPSession("s1")
+    with caplog.at_level(logging.DEBUG, logger="arcade.mcp"):
+        for _ in range(http.SESSION_EVENT_BUFFER_SIZE + 3):
+            await session.send('{"method": "notifications/progress"}\n')
+
+    dropped = [r for r in caplog.records if "Dropping message" in r.getMessage()]
+    assert len(dropped) == 3
+    assert [r.levelno for r in dropped] == [logging.WARNING, logging.DEBUG, logging.DEBUG]
+
+
+async def test_sse_transport_sends_responses_on_the_event_stream(catalog):
+    async with _serve(catalog) as (server, client):
+        # The event stream itself never ends; drive the session behind it directly
+        session = HTTPSession("legacy")
+        session.task = asyncio.create_task(
+            server.run_connection(session.read_stream(), session, None)
+        )
+        server.sessions[session.id] = session
+
+        response = await client.post("/messages?session_id=legacy", json=_request(1, "ping"))
+        assert response.status_code == 202
+
+        event = await asyncio.wait_for(session.events().__anext__(), 1)
+        assert event.startswith("event: message\ndata: ")
+        assert json.loads(event.split("data: ", 1)[1])["id"] == 1
+
+
+async def test_session_routes_replies_and_notifications():
+    session = HTTPSession("s1")
+
+    reply = asyncio.create_task(session.post("request", request_id=1))
+    assert await session._incoming.get() == "request"
+    await session.send('{"id": 1}\n', request_id=1)
+    await session.send('{"method": "notifications/tools/list_changed"}\n')
+
+    assert await reply == '{"id": 1}'
+    event = await session.events().__anext__()
+    assert event == 'event: message\ndata: {"method": "notifications/tools/list_changed"}\n\n'
+
+
+async def test_batch_post_returns_all_responses_in_one_array(catalog):
+    async with _serve(catalog) as (_, client):
+        session_id = await _open_session(client)
+        batch = [
+            _request(
+                1, "tools/call", {"name": "TestToolkit_Multiply", "arguments": {"a": 2, "b": 3}}
+            ),
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            _request(2, "ping"),
+            42,
+        ]
+        response = await client.post("/mcp", json=batch, headers={SESSION_ID_HEADER: session_id})
+
+    assert response.status_code == 200
+    replies = response.json()
+    assert [reply["id"] for reply in replies] == [1, 2, None]
+    assert replies[0]["result"]["content"][0]["text"] == "6"
+    assert replies[2]["error"]["code"] == -32600
+
+
+async def test_failed_request_gets_an_internal_error_instead_of_hanging(catalog):
+    async with _serve(catalog) as (server, client):
+        session_id = await _open_session(client)
+
+        async def fail(message):
+            raise RuntimeError("boom")
+
+        server._method_handlers["ping"] = fail
+        response = await asyncio.wait_for(
+            client.post("/mcp", json=_request(1, "ping"), headers={SESSION_ID_HEADER: session_id}),
+            timeout=2,
+        )
+
+    assert response.status_code == 200
+    assert response.json()["id"] == 1
+    assert response.json()["error"]["code"] == mcp_server.INTERNAL_ERROR
+
+
+async def test_sessions_cannot_read_each_others_stored_results(catalog, monkeypatch):
+    monkeypatch.setattr("arcade_serve.mcp.convert.LARGE_RESULT_CHARS", 1)
+    async with _serve(catalog) as (_, client):
+        alice = {SESSION_ID_HEADER: await _open_session(client, user_id="alice@example.com")}
+        bob = {SESSION_ID_HEADER: await _open_session(client, user_id="bob@example.com")}
+
+        call = _request(
+            1, "tools/call", {"name": "TestToolkit_Multiply", "arguments": {"a": 6, "b": 7}}
+        )
+        await client.post("/mcp", json=call, headers=alice)
+        listed = await client.post("/mcp", json=_request(2, "resources/list"), headers=alice)
+        (resource,) = listed.json()["result"]["resources"]
+        read = _request(3, "resources/read", {"uri": resource["uri"]})
+
+        bob_listed = await client.post("/mcp", json=_request(2, "resources/list"), headers=bob)
+        bob_read = await client.post("/mcp", json=read, headers=bob)
+        alice_read = await client.post("/mcp", json=read, headers=alice)
+
+    assert bob_listed.json()["result"]["resources"] == []
+    assert bob_read.json()["error"]["code"] == mcp_server.RESOURCE_NOT_FOUND
+    assert alice_read.json()["result"]["contents"][0]["text"] == "42"
@@ -2,7 +2,7 @@ import asyncio
 
 import pytest
 from arcade_serve.mcp.message_processor import MCPMessageProcessor, create_message_processor
-from arcade_serve.mcp.types import InitializeRequest, PingRequest
+from arcade_serve.mcp.types import CallToolRequest, InitializeRequest, PingRequest
 
 
 @pytest.mark.asyncio
@@ -54,3 +54,31 @@ async def test_message_processor_middleware_execution_order(monkeypatch):
     _ = await processor.process_request(ping)
 
     assert order == ["sync", "async"]
+
+
+@pytest.mark.asyncio
+async def test_message_processor_decodes_bytes_into_typed_requests():
+    """Requests are decoded once, straight from bytes, into the model for their method."""
+    message = b'{"jsonrpc":"2.0","id":7,"method":"tools/call","params":{"name":"T_X"}}\n'
+    processor = MCPMessageProcessor()
+
+    result = await processor.process_request(message)
+
+    assert isinstance(result, CallToolRequest)
+    assert result.params == {"name": "T_X"}
+
+
+@pytest.mark.asyncio
+async def test_message_processor_awaits_async_callable_middleware():
+    """Middleware objects with an async __call__ are awaited."""
+
+    class Tagging:
+        async def __call__(self, msg, direction):
+            msg.tagged = True
+            return msg
+
+    processor = create_message_processor(Tagging())
+
+    result = await processor.process_request(PingRequest(id=1))
+
+    assert result.tagged is True
@@ -0,0 +1,54 @@
+import pytest
+from arcade_serve.mcp.progress import ThrottledProgressReporter
+
+pytestmark = pytest.mark.asyncio
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.params: list[dict] = []
+
+    async def send(self, message) -> None:
+        self.params.append(message.params)
+
+
+async def test_reporter_sends_progress_notification():
+    recorder = _Recorder()
+    reporter = ThrottledProgressReporter("token-1", recorder.send, min_interval=0)
+
+    await reporter(1, 10, "Fetched page 1")
+
+    assert recorder.params == [
+        {"progressToken": "token-1", "progress": 1, "total": 10, "message": "Fetched page 1"}
+    ]
+
+
+async def test_reporter_throttles_updates_but_always_sends_completion():
+    recorder = _Recorder()
+    reporter = ThrottledProgressReporter("token-1", recorder.send, min_interval=60)
+
+    for page in range(1, 11):
+        await reporter(page, 10)
+
+    assert [p["progress"] for p in recorder.params] == [1, 10]
+
+
+async def test_reporter_drops_progress_that_does_not_increase():
+    recorder = _Recorder()
+    reporter = ThrottledProgressReporter(7, recorder.send, min_interval=0)
+
+    await reporter(2)
+    await reporter(2)
+    await reporter(1)
+    await reporter(3)
+
+    assert [p["progress"] for p in recorder.params] == [2, 3]
+
+
+async def test_reporter_ignores_send_errors():
+    async def failing_send(message) -> None:
+        raise ConnectionError("client went away")
+
+    reporter = ThrottledProgressReporter("token-1", failing_send, min_interval=0)
+
+    await reporter(1, 2)
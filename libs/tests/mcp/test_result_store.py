@@ -0,0 +1,140 @@
+import json
+from typing import Annotated
+
+import pytest
+from arcade_core.catalog import ToolCatalog
+from arcade_serve.mcp.convert import convert_to_mcp_content
+from arcade_serve.mcp.result_store import ResultStore
+from arcade_serve.mcp.server import MCPServer
+from arcade_tdk import tool
+
+
+def test_small_results_stay_inline():
+    store = ResultStore()
+
+    assert convert_to_mcp_content({"a": 1}, store) == [{"type": "text", "text": '{"a": 1}'}]
+    assert store.resources() == []
+
+
+def test_large_result_is_stored_in_chunks():
+    store = ResultStore(chunk_chars=100)
+    value = {"rows": ["x" * 50] * 10}
+
+    (content,) = convert_to_mcp_content(value, store, max_inline_chars=100)
+
+    resources = store.resources()
+    assert len(resources) == 6
+    assert "Result truncated" in content["text"]
+    assert resources[0]["uri"] in content["text"]
+
+    chunks = [store.read(resource["uri"]) for resource in resources]
+    assert all(found is not None and found[0].mime_type == "application/json" for found in chunks)
+    assert json.loads("".join(found[1] for found in chunks if found)) == value
+
+
+def test_expired_and_unknown_results_cannot_be_read():
+    store = ResultStore(chunk_chars=10, ttl=0)
+    result = store.put("x" * 25)
+
+    assert store.read(result.uri(0)) is None
+    assert store.read("arcade://results/unknown/0") is None
+    assert store.read("file:///etc/passwd") is None
+
+
+def test_oldest_results_are_dropped_over_the_size_limit():
+    store = ResultStore(chunk_chars=10, max_chars=50)
+    first = store.put("a" * 30)
+    second = store.put("b" * 30)
+
+    assert store.read(first.uri(0)) is None
+    assert store.read(second.uri(0)) is not None
+
+
+def test_result_over_the_size_limit_stays_inline_and_keeps_the_others():
+    store = ResultStore(chunk_chars=10, max_chars=50)
+    kept = store.put("a" * 30)
+
+    assert store.put("b" * 60) is None
+    (content,) = convert_to_mcp_content("b" * 60, store, max_inline_chars=10)
+    assert content == {"type": "text", "text": "b" * 60}
+    assert store.read(kept.uri(0)) is not None
+
+
+def test_dropping_an_owner_keeps_other_owners_results():
+    store = ResultStore(chunk_chars=10)
+    mine = store.put("a" * 30, owner="mine")
+    theirs = store.put("b" * 30, owner="theirs")
+
+    store.drop("mine")
+
+    assert store.read(mine.uri(0), owner="mine") is None
+    assert store.read(theirs.uri(0), owner="theirs") is not None
+    assert store.resources(owner="mine") == []
+
+
+@tool
+def export_rows(count: Annotated[int, "rows"]) -> Annotated[list[str], "rows"]:
+    """Return many rows."""
+    return [f"row {i}" for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_server_returns_large_results_as_readable_resources(monkeypatch):
+    monkeypatch.setattr("arcade_serve.mcp.convert.LARGE_RESULT_CHARS", 1)
+    catalog = ToolCatalog()
+    catalog.add_tool(export_rows, "sheets")
+    server = MCPServer(catalog, enable_logging=False, api_key="test")
+    server.result_store = ResultStore(chunk_chars=1000)
+
+    call = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "Sheets_ExportRows", "arguments": {"count": 500}},
+    }
+    await server.handle_message(json.dumps(call))
+    listed = await server.handle_message('{"jsonrpc": "2.0", "id": 2, "method": "resources/list"}')
+
+    parts = []
+    for resource in listed.result["resources"]:
+        read = {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "method": "resources/read",
+            "params": {"uri": resource["uri"]},
+        }
+        response = await server.handle_message(json.dumps(read))
+        parts.append(response.result["contents"][0]["text"])
+
+    assert json.loads("".join(parts)) == [f"row {i}" for i in range(500)]
+
+
+class _MemoryWriteStream:
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    async def send(self, message: str) -> None:
+        self.messages.append(json.loads(message))
+
+
+@pytest.mark.asyncio
+async def test_connection_results_are_dropped_when_it_closes(monkeypatch):
+    monkeypatch.setattr("arcade_serve.mcp.convert.LARGE_RESULT_CHARS", 1)
+    catalog = ToolCatalog()
+    catalog.add_tool(export_rows, "sheets")
+    server = MCPServer(catalog, enable_logging=False, api_key="test")
+
+    async def read_stream():
+        call = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "Sheets_ExportRows", "arguments": {"count": 10}},
+        }
+        yield json.dumps(call)
+
+    write_stream = _MemoryWriteStream()
+    await server.run_connection(read_stream(), write_stream, None)
+
+    assert "Result truncated" in write_stream.messages[0]["result"]["content"][0]["text"]
+    assert server.result_store._results == {}
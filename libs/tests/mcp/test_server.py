@@ -1,9 +1,13 @@
+import asyncio
+import json
 import sys
+import time
 import types
 from typing import Annotated, Any
 
 import pytest
 from arcade_core.catalog import ToolCatalog
+from arcade_core.schema import ToolContext
 from arcade_serve.mcp import server as mcp_server
 from arcade_serve.mcp.types import (
     CallToolRequest,
@@ -75,10 +79,28 @@ def multiply(a: Annotated[int, "a"], b: Annotated[int, "b"]) -> Annotated[int, "
     return a * b
 
 
+@tool
+async def sleep_for(seconds: Annotated[float, "seconds"]) -> Annotated[float, "seconds slept"]:
+    """Sleep for the given number of seconds."""
+
+    await asyncio.sleep(seconds)
+    return seconds
+
+
+@tool
+def block_for(seconds: Annotated[float, "seconds"]) -> Annotated[float, "seconds blocked"]:
+    """Block the calling thread for the given number of seconds."""
+
+    time.sleep(seconds)
+    return seconds
+
+
 @pytest.fixture(scope="module")
 def sample_catalog():
     catalog = ToolCatalog()
     catalog.add_tool(multiply, "test_toolkit")
+    catalog.add_tool(sleep_for, "test_toolkit")
+    catalog.add_tool(block_for, "test_toolkit")
     return catalog
 
 
@@ -150,3 +172,356 @@ async def test_handle_cancel(server):
     req = CancelRequest(id=77, params={"id": "abc"})
     resp = await server._handle_cancel(req)  # pylint: disable=protected-access
     assert resp.result == {"ok": True}
+
+
+# ---------------------------------------------------------------------------
+# Connection handling
+# ---------------------------------------------------------------------------
+
+
+class _MemoryWriteStream:
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+
+    async def send(self, message: str) -> None:
+        self.messages.append(json.loads(message))
+
+
+async def _read_stream(*messages: Any):
+    for message in messages:
+        yield json.dumps(message)
+
+
+def _sleep_request(request_id: int, seconds: float, tool_name: str = "SleepFor") -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": f"TestToolkit_{tool_name}", "arguments": {"seconds": seconds}},
+    }
+
+
+async def test_run_connection_handles_tool_calls_concurrently(server):
+    write_stream = _MemoryWriteStream()
+    requests = [_sleep_request(i, 0.2) for i in range(5)]
+
+    start = time.perf_counter()
+    await server.run_connection(_read_stream(*requests), write_stream, None)
+    elapsed = time.perf_counter() - start
+
+    assert sorted(m["id"] for m in write_stream.messages) == [0, 1, 2, 3, 4]
+    assert elapsed < 0.6  # max(latency) rather than sum(latency) = 1s
+
+
+async def test_run_connection_slow_call_does_not_block_ping(server):
+    write_stream = _MemoryWriteStream()
+    ping = {"jsonrpc": "2.0", "id": "ping", "method": "ping"}
+
+    await server.run_connection(_read_stream(_sleep_request(1, 0.2), ping), write_stream, None)
+
+    assert [m["id"] for m in write_stream.messages] == ["ping", 1]
+
+
+async def test_run_connection_sync_tool_does_not_block_the_event_loop(server):
+    write_stream = _MemoryWriteStream()
+    ping = {"jsonrpc": "2.0", "id": "ping", "method": "ping"}
+    requests = [_sleep_request(i, 0.2, tool_name="BlockFor") for i in range(3)]
+
+    start = time.perf_counter()
+    await server.run_connection(_read_stream(*requests, ping), write_stream, None)
+    elapsed = time.perf_counter() - start
+
+    assert write_stream.messages[0]["id"] == "ping"
+    assert sorted(m["id"] for m in write_stream.messages[1:]) == [0, 1, 2]
+    assert write_stream.messages[1]["result"]["content"] == [{"type": "text", "text": "0.2"}]
+    assert elapsed < 0.5  # the blocking calls ran in threads, side by side
+
+
+async def test_batch_runs_requests_concurrently_and_returns_one_array(server):
+    write_stream = _MemoryWriteStream()
+    batch = [_sleep_request(i, 0.2) for i in range(3)]
+    batch.append({"jsonrpc": "2.0", "method": "notifications/initialized"})
+    batch.append({"jsonrpc": "2.0", "id": "ping", "method": "ping"})
+
+    start = time.perf_counter()
+    await server.run_connection(_read_stream(batch), write_stream, None)
+    elapsed = time.perf_counter() - start
+
+    (replies,) = write_stream.messages
+    assert [reply["id"] for reply in replies] == [0, 1, 2, "ping"]
+    assert elapsed < 0.5
+
+
+async def test_cancelling_a_call_in_a_batch_keeps_the_other_responses(server):
+    write_stream = _MemoryWriteStream()
+    batch = [_sleep_request(1, 5), _sleep_request(2, 0.1), _sleep_request(3, 0.1)]
+
+    async def read_stream():
+        yield json.dumps(batch)
+        await asyncio.sleep(0.05)
+        cancel = {"method": "notifications/cancelled", "params": {"requestId": 1}}
+        yield json.dumps({"jsonrpc": "2.0", **cancel})
+
+    start = time.perf_counter()
+    await server.run_connection(read_stream(), write_stream, None)
+    elapsed = time.perf_counter() - start
+
+    (replies,) = write_stream.messages
+    assert [reply["id"] for reply in replies] == [2, 3]
+    assert elapsed < 1
+    assert server._tool_call_tasks == {}
+
+
+@pytest.mark.parametrize(
+    "batch, expected",
+    [
+        (
+            "[]",
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "Invalid Request"}},
+        ),
+        ("[1", {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}),
+    ],
+)
+async def test_invalid_batch_gets_an_error(server, batch, expected):
+    response = await server.handle_message(batch)
+    assert json.loads(response.model_dump_json()) == expected
+
+
+async def test_unparseable_message_gets_a_parse_error(server):
+    response = await server.handle_message("{not json\n")
+    assert response.error["code"] == -32700
+
+
+async def test_batch_of_notifications_gets_no_response(server):
+    batch = [{"jsonrpc": "2.0", "method": "notifications/initialized"}]
+    assert await server.handle_message(json.dumps(batch)) is None
+
+
+async def test_run_connection_respects_concurrency_limit(sample_catalog):
+    server = mcp_server.MCPServer(sample_catalog, enable_logging=False, max_concurrent_requests=2)
+    write_stream = _MemoryWriteStream()
+    requests = [_sleep_request(i, 0.1) for i in range(4)]
+
+    start = time.perf_counter()
+    await server.run_connection(_read_stream(*requests), write_stream, None)
+    elapsed = time.perf_counter() - start
+
+    assert len(write_stream.messages) == 4
+    assert elapsed >= 0.2  # two batches of two
+
+
+async def test_batch_respects_concurrency_limit(sample_catalog):
+    server = mcp_server.MCPServer(sample_catalog, enable_logging=False, max_concurrent_requests=2)
+    write_stream = _MemoryWriteStream()
+    batch = [_sleep_request(i, 0.1) for i in range(4)]
+
+    start = time.perf_counter()
+    await server.run_connection(_read_stream(batch), write_stream, None)
+    elapsed = time.perf_counter() - start
+
+    (replies,) = write_stream.messages
+    assert [reply["id"] for reply in replies] == [0, 1, 2, 3]
+    assert elapsed >= 0.2  # two rounds of two
+
+
+async def test_max_concurrent_requests_must_be_positive(sample_catalog):
+    with pytest.raises(ValueError):
+        mcp_server.MCPServer(sample_catalog, enable_logging=False, max_concurrent_requests=0)
+
+
+@pytest.mark.parametrize(
+    "cancel",
+    [
+        {"method": "notifications/cancelled", "params": {"requestId": 1, "reason": "timeout"}},
+        {"id": "cancel", "method": "$/cancelRequest", "params": {"id": 1}},
+    ],
+    ids=["notification", "request"],
+)
+async def test_run_connection_cancels_running_tool_call(server, cancel):
+    write_stream = _MemoryWriteStream()
+
+    async def read_stream():
+        yield json.dumps(_sleep_request(1, 5))
+        await asyncio.sleep(0.05)
+        yield json.dumps({"jsonrpc": "2.0", **cancel})
+
+    start = time.perf_counter()
+    await server.run_connection(read_stream(), write_stream, None)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1
+    assert 1 not in [m.get("id") for m in write_stream.messages]
+    assert server._tool_call_tasks == {}
+
+
+async def test_run_connection_cancelled_sync_tool_call_returns_without_response(server):
+    write_stream = _MemoryWriteStream()
+
+    async def read_stream():
+        yield json.dumps(_sleep_request(1, 0.5, tool_name="BlockFor"))
+        await asyncio.sleep(0.05)
+        yield json.dumps({
+            "jsonrpc": "2.0",
+            "id": "cancel",
+            "method": "$/cancelRequest",
+            "params": {"id": 1},
+        })
+
+    start = time.perf_counter()
+    await server.run_connection(read_stream(), write_stream, None)
+    elapsed = time.perf_counter() - start
+
+    # The tool's thread keeps running, but the connection isn't held up by it
+    assert elapsed < 0.3
+    assert [m["id"] for m in write_stream.messages] == ["cancel"]
+    assert server._tool_call_tasks == {}
+
+
+@tool
+async def count_pages(context: ToolContext, pages: Annotated[int, "pages"]) -> Annotated[int, "n"]:
+    """Fetch the given number of pages, reporting progress."""
+
+    for page in range(1, pages + 1):
+        await context.report_progress(page, pages, f"Fetched page {page}")
+    return pages
+
+
+async def test_run_connection_sends_tool_progress_notifications():
+    catalog = ToolCatalog()
+    catalog.add_tool(count_pages, "test_toolkit")
+    server = mcp_server.MCPServer(catalog, enable_logging=False)
+    write_stream = _MemoryWriteStream()
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {
+            "name": "TestToolkit_CountPages",
+            "arguments": {"pages": 50},
+            "_meta": {"progressToken": "tok"},
+        },
+    }
+
+    await server.run_connection(_read_stream(request), write_stream, None)
+
+    progress = [m["params"] for m in write_stream.messages if "method" in m]
+    # Throttled: the first and the final update, not all fifty
+    assert [p["progress"] for p in progress] == [1, 50]
+    assert progress[-1] == {
+        "progressToken": "tok",
+        "progress": 50,
+        "total": 50,
+        "message": "Fetched page 50",
+    }
+    assert write_stream.messages[-1]["id"] == 1
+
+
+async def test_tool_progress_is_ignored_without_progress_token():
+    catalog = ToolCatalog()
+    catalog.add_tool(count_pages, "test_toolkit")
+    server = mcp_server.MCPServer(catalog, enable_logging=False)
+    write_stream = _MemoryWriteStream()
+    request = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "TestToolkit_CountPages", "arguments": {"pages": 3}},
+    }
+
+    await server.run_connection(_read_stream(request), write_stream, None)
+
+    assert [m.get("id") for m in write_stream.messages] == [1]
+
+
+async def test_cancel_request_without_running_call(server):
+    assert server.cancel_request("unknown") is False
+
+
+# ---------------------------------------------------------------------------
+# tools/list caching
+# ---------------------------------------------------------------------------
+
+
+async def test_list_tools_is_built_once(server, monkeypatch):
+    calls = []
+    original = mcp_server.create_mcp_tool
+
+    def counting_create_mcp_tool(tool):
+        calls.append(tool)
+        return original(tool)
+
+    monkeypatch.setattr(mcp_server, "create_mcp_tool", counting_create_mcp_tool)
+
+    first = await server._handle_list_tools(ListToolsRequest(id=1))
+    second = await server._handle_list_tools(ListToolsRequest(id=2))
+
+    assert len(calls) == len(server.tool_catalog)
+    assert second.result is first.result
+    assert json.loads(second.model_dump_json())["id"] == 2
+    assert json.loads(second.model_dump_json())["result"] == first.result.model_dump(
+        exclude_none=True
+    )
+
+
+async def test_catalog_change_rebuilds_tool_list_and_notifies_client():
+    catalog = ToolCatalog()
+    catalog.add_tool(multiply, "test_toolkit")
+    server = mcp_server.MCPServer(catalog, enable_logging=False)
+    write_stream = _MemoryWriteStream()
+
+    async def read_stream():
+        yield json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+        await asyncio.sleep(0.05)
+        catalog.add_tool(sleep_for, "test_toolkit")
+        yield json.dumps({"jsonrpc": "2.0", "id": 2, "method": "ping"})
+        await asyncio.sleep(0.05)
+        yield json.dumps({"jsonrpc": "2.0", "id": 3, "method": "tools/list"})
+
+    await server.run_connection(read_stream(), write_stream, None)
+
+    messages = write_stream.messages
+    assert {"jsonrpc": "2.0", "method": "notifications/tools/list_changed"} in messages
+    tool_lists = {m["id"]: m["result"]["tools"] for m in messages if m.get("id") in (1, 3)}
+    assert len(tool_lists[1]) == 1
+    assert len(tool_lists[3]) == 2
+
+
+async def test_list_tools_paginates_with_cursor(sample_catalog):
+    server = mcp_server.MCPServer(sample_catalog, enable_logging=False, tools_page_size=1)
+
+    names = []
+    params = None
+    for request_id in range(1, len(sample_catalog) + 1):
+        response = await server._handle_list_tools(ListToolsRequest(id=request_id, params=params))
+        page = json.loads(response.model_dump_json())["result"]
+        assert len(page["tools"]) == 1
+        names.extend(t["name"] for t in page["tools"])
+        params = {"cursor": page.get("nextCursor")}
+
+    assert params["cursor"] is None
+    assert sorted(names) == sorted(t.name for t in server._get_tool_list().tools)
+
+
+async def test_list_tools_rejects_invalid_and_expired_cursors():
+    catalog = ToolCatalog()
+    catalog.add_tool(multiply, "test_toolkit")
+    catalog.add_tool(sleep_for, "test_toolkit")
+    server = mcp_server.MCPServer(catalog, enable_logging=False, tools_page_size=1)
+
+    first = await server._handle_list_tools(ListToolsRequest(id=1))
+    cursor = first.result.nextCursor
+    assert cursor is not None
+
+    invalid = await server._handle_list_tools(ListToolsRequest(id=2, params={"cursor": "nope"}))
+    assert invalid.error["code"] == -32602
+    not_a_string = await server._handle_list_tools(ListToolsRequest(id=2, params={"cursor": 5}))
+    assert not_a_string.error["code"] == -32602
+
+    catalog.add_tool(multiply, "other_toolkit")
+    expired = await server._handle_list_tools(ListToolsRequest(id=3, params={"cursor": cursor}))
+    assert expired.error["code"] == -32602
+
+
+async def test_tools_page_size_must_not_be_negative(sample_catalog):
+    with pytest.raises(ValueError):
+        mcp_server.MCPServer(sample_catalog, enable_logging=False, tools_page_size=-1)
@@ -1,7 +1,19 @@
+import asyncio
 import io
+import json
+import os
 import queue
 
-from arcade_serve.mcp.stdio import stdio_reader, stdio_writer
+import pytest
+from arcade_core.catalog import ToolCatalog
+from arcade_serve.mcp.stdio import (
+    StdioServer,
+    StreamWriteStream,
+    open_stdio_streams,
+    stdio_lines,
+    stdio_reader,
+    stdio_writer,
+)
 
 
 def test_stdio_reader_puts_lines_and_none():
@@ -30,3 +42,147 @@ def test_stdio_writer_reads_until_none():
     # Ensure writer appended newlines when missing
     output_stream.seek(0)
     assert output_stream.read() == "msg1\nmsg2\n"
+
+
+class _CountingBuffer(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+    def flush(self):
+        self.flushes += 1
+
+
+def test_stdio_writer_coalesces_queued_messages():
+    q: queue.Queue[str | None] = queue.Queue()
+    for i in range(100):
+        q.put(f'{{"id": {i}}}\n')
+    q.put(None)
+    stdout = io.TextIOWrapper(_CountingBuffer())
+
+    stdio_writer(stdout, q)
+
+    assert stdout.buffer.writes == 1
+    assert stdout.buffer.flushes == 1
+    lines = stdout.buffer.getvalue().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == list(range(100))
+
+
+@pytest.mark.asyncio
+async def test_stream_write_stream_writes_once_per_loop_pass():
+    class _Writer:
+        def __init__(self):
+            self.chunks = []
+
+        def is_closing(self):
+            return False
+
+        def write(self, data):
+            self.chunks.append(data)
+
+        async def drain(self):
+            pass
+
+    writer = _Writer()
+    stream = StreamWriteStream(writer)  # type: ignore[arg-type]
+
+    await asyncio.gather(*(stream.send(f'{{"id": {i}}}') for i in range(10)))
+    await asyncio.sleep(0)
+
+    assert len(writer.chunks) == 1
+    assert writer.chunks[0].count(b"\n") == 10
+
+
+def _pipe_files():
+    """A pair of (read end, write end) binary files over an OS pipe."""
+    read_fd, write_fd = os.pipe()
+    return os.fdopen(read_fd, "rb", buffering=0), os.fdopen(write_fd, "wb", buffering=0)
+
+
+@pytest.mark.asyncio
+async def test_stdio_streams_read_lines_longer_than_the_default_limit():
+    stdin_r, stdin_w = _pipe_files()
+    stdout_r, stdout_w = _pipe_files()
+    with stdin_r, stdin_w, stdout_r, stdout_w:
+        reader, writer = await open_stdio_streams(stdin_r, stdout_w, limit=1024 * 1024)
+        big = json.dumps({"data": "x" * 200_000}) + "\n"
+
+        feeder = asyncio.create_task(asyncio.to_thread(stdin_w.write, big.encode()))
+        lines = stdio_lines(reader)
+        assert await lines.__anext__() == big.encode()
+        await feeder
+
+        writer.write(b"pong\n")
+        await writer.drain()
+        writer.close()
+        assert stdout_r.readline() == b"pong\n"
+
+
+@pytest.mark.asyncio
+async def test_closing_stdio_streams_restores_blocking_mode():
+    stdin_r, stdin_w = _pipe_files()
+    stdout_r, stdout_w = _pipe_files()
+    with stdin_r, stdin_w, stdout_r, stdout_w:
+        reader, writer = await open_stdio_streams(stdin_r, stdout_w)
+        # The duplicated descriptors share the flag with the originals
+        assert not os.get_blocking(stdin_r.fileno())
+        assert not os.get_blocking(stdout_w.fileno())
+
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.sleep(0)
+
+        assert os.get_blocking(stdin_r.fileno())
+        assert os.get_blocking(stdout_w.fileno())
+        assert reader.at_eof()
+
+
+@pytest.mark.asyncio
+async def test_stdio_streams_are_not_opened_on_a_terminal():
+    class Terminal:
+        def __init__(self, file):
+            self.file = file
+
+        def fileno(self):
+            return self.file.fileno()
+
+        def isatty(self):
+            return True
+
+    stdin_r, stdin_w = _pipe_files()
+    stdout_r, stdout_w = _pipe_files()
+    with stdin_r, stdin_w, stdout_r, stdout_w:
+        with pytest.raises(ValueError, match="terminal"):
+            await open_stdio_streams(Terminal(stdin_r), stdout_w)
+        assert os.get_blocking(stdin_r.fileno())
+
+
+@pytest.mark.asyncio
+async def test_stdio_lines_drops_lines_over_the_limit():
+    reader = asyncio.StreamReader(limit=16)
+    reader.feed_data(b"x" * 64 + b"\n" + b"short\n")
+    reader.feed_eof()
+
+    assert [line async for line in stdio_lines(reader)] == [b"short\n"]
+
+
+@pytest.mark.asyncio
+async def test_stdio_server_serves_streams_until_eof():
+    catalog = ToolCatalog()
+    server = StdioServer(catalog, enable_logging=False, api_key="test")
+    stdin_r, stdin_w = _pipe_files()
+    stdout_r, stdout_w = _pipe_files()
+    with stdin_r, stdout_r:
+        reader, writer = await open_stdio_streams(stdin_r, stdout_w)
+        stdout_w.close()
+
+        stdin_w.write(b'{"jsonrpc": "2.0", "id": 1, "method": "ping"}\n')
+        stdin_w.close()
+        await server.run_streams(reader, writer)
+
+        assert json.loads(stdout_r.readline())["id"] == 1
@@ -104,6 +104,37 @@ def test_eval_case_evaluate():
     assert result.passed is True
 
 
+def test_eval_case_evaluates_each_pair_once():
+    """
+    The critic results computed for the assignment's cost matrix are reused when the
+    assigned pairs are scored, so each (expected, actual) pair is evaluated once.
+    """
+    critic = BinaryCritic(critic_field="param", weight=1.0)
+    calls = []
+    original = critic.evaluate
+
+    def counting_evaluate(expected, actual):
+        calls.append((expected, actual))
+        return original(expected, actual)
+
+    critic.evaluate = counting_evaluate  # type: ignore[method-assign]
+    case = EvalCase(
+        name="TestCase",
+        system_message="System message",
+        user_message="User message",
+        expected_tool_calls=[
+            NamedExpectedToolCall(name="ToolA", args={"param": "a"}),
+            NamedExpectedToolCall(name="ToolA", args={"param": "b"}),
+        ],
+        critics=[critic],
+    )
+
+    result = case.evaluate([("ToolA", {"param": "b"}), ("ToolA", {"param": "a"})])
+
+    assert result.score == 1.0
+    assert len(calls) == 4
+
+
 # Test EvalCase with mismatched tool calls
 def test_eval_case_evaluate_mismatched_tools():
     """
@@ -246,6 +277,52 @@ def test_eval_suite_add_case():
     )
 
 
+def test_eval_suite_caches_tool_lookups(monkeypatch):
+    """
+    Test that the suite looks up each tool and reads its signature only once,
+    however many cases and predicted calls use it.
+    """
+    import inspect
+
+    signatures = []
+    original_signature = inspect.signature
+
+    def counting_signature(func, *args, **kwargs):
+        signatures.append(func)
+        return original_signature(func, *args, **kwargs)
+
+    monkeypatch.setattr(inspect, "signature", counting_signature)
+
+    mock_catalog = Mock()
+    mock_catalog.find_tool_by_func.return_value.get_fully_qualified_name.return_value = "MockTool"
+    mock_catalog.get_tool_by_name.return_value.tool = mock_tool_multiple_args
+    suite = EvalSuite(name="TestSuite", system_message="System message", catalog=mock_catalog)
+
+    for i in range(3):
+        suite.add_case(
+            name=f"TestCase{i}",
+            user_message="User message",
+            expected_tool_calls=[(mock_tool_multiple_args, {"param1": "a", "param2": "b"})],
+        )
+    filled = [
+        suite._fill_tool_calls([("MockTool", {"param1": "x", "param2": "y", "param4": "z"})])
+        for _ in range(3)
+    ]
+
+    assert mock_catalog.find_tool_by_func.call_count == 1
+    assert mock_catalog.get_tool_by_name.call_count == 1
+    assert signatures == [mock_tool_multiple_args]
+    assert suite.cases[2].expected_tool_calls[0].args == {
+        "param1": "a",
+        "param2": "b",
+        "param3": "value3",
+        "param4": "value4",
+    }
+    assert filled[2] == [
+        ("MockTool", {"param1": "x", "param2": "y", "param3": "value3", "param4": "z"})
+    ]
+
+
 # Test EvalSuite.extend_case()
 def test_eval_suite_extend_case():
     """
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+from arcade_evals.cache import CacheMode, ResponseCache, ResponseCacheMissError
+from openai.types.chat import ChatCompletion
+
+pytestmark = pytest.mark.asyncio
+
+PARAMS = {
+    "model": "gpt-4o",
+    "messages": [{"role": "user", "content": "Send a message"}],
+    "tools": ["Mail.Send"],
+    "seed": 42,
+}
+
+
+def _completion(text: str) -> ChatCompletion:
+    return ChatCompletion.model_validate({
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "tool_calls",
+                "message": {
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {
+                                "name": "Mail_Send",
+                                "arguments": json.dumps({"text": text}),
+                            },
+                        }
+                    ],
+                },
+            }
+        ],
+    })
+
+
+class _FakeClient:
+    def __init__(self, text: str = "hello"):
+        self.text = text
+        self.calls = 0
+
+    async def create(self, **params):
+        self.calls += 1
+        return _completion(self.text)
+
+
+async def test_record_calls_the_model_once(tmp_path):
+    cache = ResponseCache(tmp_path, CacheMode.RECORD)
+    client = _FakeClient()
+
+    first = await cache.create(client.create, **PARAMS)
+    second = await cache.create(client.create, **PARAMS)
+
+    assert client.calls == 1
+    assert second.choices[0].message.tool_calls[0].function.arguments == json.dumps({
+        "text": "hello"
+    })
+    assert first.model_dump() == second.model_dump()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+async def test_replay_uses_recorded_responses_only(tmp_path):
+    await ResponseCache(tmp_path, "record").create(_FakeClient().create, **PARAMS)
+    cache = ResponseCache(tmp_path, "replay")
+    client = _FakeClient()
+
+    await cache.create(client.create, **PARAMS)
+    with pytest.raises(ResponseCacheMissError):
+        await cache.create(client.create, **{**PARAMS, "seed": 7})
+
+    assert client.calls == 0
+
+
+async def test_refresh_replaces_recorded_responses(tmp_path):
+    await ResponseCache(tmp_path, "record").create(_FakeClient("old").create, **PARAMS)
+    client = _FakeClient("new")
+
+    await ResponseCache(tmp_path, "refresh").create(client.create, **PARAMS)
+    replayed = await ResponseCache(tmp_path, "replay").create(client.create, **PARAMS)
+
+    assert client.calls == 1
+    assert json.loads(replayed.choices[0].message.tool_calls[0].function.arguments) == {
+        "text": "new"
+    }
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"model": "gpt-4o-mini"},
+        {"messages": [{"role": "user", "content": "Send another message"}]},
+        {"tools": ["Mail.Send", "Mail.Read"]},
+        {"seed": 7},
+        {"tool_definitions": ['{"name": "Send", "description": "Send a message"}']},
+    ],
+)
+async def test_key_covers_model_messages_tools_and_seed(change):
+    changed = {**PARAMS, **change}
+
+    assert ResponseCache.key(**PARAMS) != ResponseCache.key(**changed)
@@ -9,6 +9,7 @@ from arcade_evals import (
     NumericCritic,
     SimilarityCritic,
 )
+from arcade_evals.critic import SimilarityIndex
 from arcade_evals.errors import WeightError
 from dateutil import parser
 
@@ -113,6 +114,45 @@ def test_similarity_critic_evaluate(
     assert result["score"] <= weight + 1e-6  # Allow a small epsilon for floating-point comparison
 
 
+def test_similarity_index_scores_pairs_with_one_vectorizer(monkeypatch):
+    """
+    Test that a SimilarityIndex fits a single vectorizer for all of its pairs,
+    and that SimilarityCritic uses it while it is active.
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    fits = []
+    original_fit_transform = TfidfVectorizer.fit_transform
+
+    def counting_fit_transform(self, raw_documents, y=None):
+        fits.append(list(raw_documents))
+        return original_fit_transform(self, raw_documents, y)
+
+    monkeypatch.setattr(TfidfVectorizer, "fit_transform", counting_fit_transform)
+
+    pairs = [
+        ("hello world", "hello world"),
+        ("hello world", "goodbye moon"),
+        ("the quick brown fox", "the quick brown dog"),
+    ]
+    index = SimilarityIndex.from_pairs(pairs)
+    critic = SimilarityCritic(critic_field="text", weight=1.0, similarity_threshold=0.9)
+    with index.active():
+        results = [critic.evaluate(expected, actual) for expected, actual in pairs]
+
+    assert len(fits) == 1
+    assert results[0]["match"] is True
+    assert results[0]["score"] == pytest.approx(1.0)
+    assert results[1]["score"] == pytest.approx(0.0)
+    assert 0.0 < results[2]["score"] < 1.0
+
+    # Strings outside the index, and comparisons after the block, fit their own vectorizer
+    with index.active():
+        critic.evaluate("something else", "hello world")
+    critic.evaluate("hello world", "hello world")
+    assert len(fits) == 3
+
+
 # Test that WeightError is raised for invalid critic weights
 @pytest.mark.parametrize(
     "critic_class, weight",
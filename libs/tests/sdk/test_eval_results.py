@@ -0,0 +1,112 @@
+import json
+from types import SimpleNamespace
+from typing import Annotated
+
+import pytest
+from arcade_core.catalog import ToolCatalog
+from arcade_evals import BinaryCritic, EvalSuite, ExpectedToolCall, ResultsLog
+from arcade_tdk import tool
+
+
+@tool
+def send_message(text: Annotated[str, "The message"]) -> Annotated[str, "The message sent"]:
+    """Send a message."""
+    return text
+
+
+@tool(name="SendMessage")
+def send_message_without_greeting(
+    text: Annotated[str, "The message, without a greeting"],
+) -> Annotated[str, "The message sent"]:
+    """Send a message."""
+    return text
+
+
+class _FakeClient:
+    """Answers every request with a call to send_message."""
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=self)
+
+    async def create(self, **params):
+        self.calls += 1
+        tool_call = SimpleNamespace(
+            function=SimpleNamespace(name="Chat_SendMessage", arguments=json.dumps({"text": "hi"}))
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(tool_calls=[tool_call]))],
+            usage=SimpleNamespace(prompt_tokens=120, completion_tokens=15),
+        )
+
+
+def _suite(send_tool=send_message) -> EvalSuite:
+    catalog = ToolCatalog()
+    catalog.add_tool(send_tool, "chat")
+    suite = EvalSuite(name="messages", system_message="You send messages.", catalog=catalog)
+    for name in ["greet", "wave"]:
+        suite.add_case(
+            name=name,
+            user_message=f"Say hi ({name})",
+            expected_tool_calls=[ExpectedToolCall(func=send_tool, args={"text": "hi"})],
+            critics=[BinaryCritic(critic_field="text", weight=1.0)],
+        )
+    return suite
+
+
+def test_results_log_keeps_recorded_cases_on_resume(tmp_path):
+    path = tmp_path / "results.jsonl"
+    log = ResultsLog(path)
+    log.record("suite", "gpt-4o", "case", "hash-1", [("Chat.SendMessage", {"text": "hi"})])
+    with path.open("a") as f:
+        f.write('{"suite": "suite", "model": "gpt-4o", "case_ha')  # cut short by a crash
+
+    resumed = ResultsLog(path, resume=True)
+    fresh = ResultsLog(path)
+
+    assert resumed.recorded("suite", "gpt-4o", "hash-1") == (
+        [("Chat.SendMessage", {"text": "hi"})],
+        {},
+    )
+    assert resumed.recorded("suite", "gpt-4o-mini", "hash-1") is None
+    assert fresh.recorded("suite", "gpt-4o", "hash-1") is None
+    # Cases recorded by the current run are written out, not kept in memory
+    assert log.recorded("suite", "gpt-4o", "hash-1") is None
+    assert path.read_text() == ""
+
+
+@pytest.mark.asyncio
+async def test_resumed_run_skips_recorded_cases(tmp_path):
+    path = tmp_path / "results.jsonl"
+    client = _FakeClient()
+
+    first = await _suite().run(client, "gpt-4o", results_log=ResultsLog(path))
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert client.calls == 2
+    assert [line["case"] for line in lines] == ["greet", "wave"]
+
+    # Drop the last case, as if the run had been interrupted before it completed
+    path.write_text(path.read_text().splitlines(keepends=True)[0])
+    resumed = await _suite().run(client, "gpt-4o", results_log=ResultsLog(path, resume=True))
+
+    assert client.calls == 3
+    assert resumed["cases"][0]["metrics"] == first["cases"][0]["metrics"]
+    assert resumed["cases"][1]["metrics"]["prompt_tokens"] == 120
+    assert resumed["cases"][1]["metrics"]["wall_time_ms"] >= 0
+    assert [case["evaluation"].score for case in resumed["cases"]] == [
+        case["evaluation"].score for case in first["cases"]
+    ]
+    assert len(path.read_text().splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_resumed_run_asks_again_when_a_tool_definition_changed(tmp_path):
+    path = tmp_path / "results.jsonl"
+    client = _FakeClient()
+
+    await _suite().run(client, "gpt-4o", results_log=ResultsLog(path))
+    await _suite(send_message_without_greeting).run(
+        client, "gpt-4o", results_log=ResultsLog(path, resume=True)
+    )
+
+    assert client.calls == 4
@@ -0,0 +1,155 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from arcade_evals.scheduler import (
+    ModelLimits,
+    RequestScheduler,
+    _Budget,
+    parse_duration,
+    retry_delay,
+)
+from openai import RateLimitError
+
+
+def _rate_limit_error(headers: dict[str, str] | None = None) -> RateLimitError:
+    request = httpx.Request("POST", "http://test/v1/chat/completions")
+    response = httpx.Response(429, headers=headers, request=request)
+    return RateLimitError("Rate limit reached", response=response, body=None)
+
+
+class _FlakyFetch:
+    def __init__(self, failures: int, headers: dict[str, str] | None = None, delay: float = 0.0):
+        self.failures = failures
+        self.headers = headers
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, **params):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.calls <= self.failures:
+                raise _rate_limit_error(self.headers)
+            return SimpleNamespace(usage=SimpleNamespace(total_tokens=10))
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2", 2.0),
+        ("0.5", 0.5),
+        ("250ms", 0.25),
+        ("1m30s", 90.0),
+        ("6m0s", 360.0),
+        ("1h", 3600.0),
+        ("soon", None),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", None),
+    ],
+)
+def test_parse_duration(value, expected):
+    assert parse_duration(value) == expected
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"retry-after-ms": "1500"}, 1.5),
+        ({"retry-after": "3"}, 3.0),
+        ({"x-ratelimit-reset-requests": "1s", "x-ratelimit-reset-tokens": "6m0s"}, 360.0),
+        ({}, None),
+    ],
+)
+def test_retry_delay_reads_rate_limit_headers(headers, expected):
+    assert retry_delay(_rate_limit_error(headers)) == expected
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_request_is_retried_after_the_requested_delay():
+    scheduler = RequestScheduler(max_retries=2)
+    fetch = _FlakyFetch(failures=1, headers={"retry-after-ms": "50"})
+
+    start = time.monotonic()
+    response = await scheduler.create(fetch, model="gpt-4o", messages=[])
+
+    assert response.usage.total_tokens == 10
+    assert fetch.calls == 2
+    assert time.monotonic() - start >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_request_fails_after_max_retries():
+    scheduler = RequestScheduler(max_retries=2, initial_backoff=0.001)
+    fetch = _FlakyFetch(failures=5)
+
+    with pytest.raises(RateLimitError):
+        await scheduler.create(fetch, model="gpt-4o", messages=[])
+    assert fetch.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_retried_request_is_charged_against_the_token_budget_once():
+    scheduler = RequestScheduler(
+        limits=ModelLimits(tokens_per_minute=10_000), max_retries=3, initial_backoff=0.001
+    )
+    fetch = _FlakyFetch(failures=2)
+    messages = [{"role": "user", "content": "x" * 2000}]  # about 500 tokens
+
+    await scheduler.create(fetch, model="gpt-4o", messages=messages)
+
+    tokens = scheduler._model("gpt-4o").tokens
+    assert fetch.calls == 3
+    # Only the 10 tokens the response reported as used are gone
+    assert tokens is not None and tokens.available >= 10_000 - 11
+
+
+def test_max_retries_must_not_be_negative():
+    with pytest.raises(ValueError):
+        RequestScheduler(max_retries=-1)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited_across_models():
+    scheduler = RequestScheduler(max_concurrency=2)
+    fetch = _FlakyFetch(failures=0, delay=0.01)
+
+    await asyncio.gather(
+        *(
+            scheduler.create(fetch, model=model, messages=[])
+            for model in ["gpt-4o", "gpt-4o-mini"] * 5
+        )
+    )
+
+    assert fetch.calls == 10
+    assert fetch.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_budget_waits_for_refill():
+    budget = _Budget(600)  # 10 per second
+
+    await budget.acquire(600)
+    start = time.monotonic()
+    await budget.acquire(1)
+
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_models_have_separate_budgets():
+    scheduler = RequestScheduler(limits={"gpt-4o": ModelLimits(requests_per_minute=1)})
+    fetch = _FlakyFetch(failures=0)
+
+    await scheduler.create(fetch, model="gpt-4o", messages=[])
+    # gpt-4o has used its budget for the next minute; gpt-4o-mini is unlimited
+    await asyncio.wait_for(scheduler.create(fetch, model="gpt-4o-mini", messages=[]), 1)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(scheduler.create(fetch, model="gpt-4o", messages=[]), 0.05)
@@ -1,3 +1,4 @@
+import logging
 import os
 from typing import Annotated
 from unittest.mock import MagicMock
@@ -17,6 +18,7 @@ from arcade_serve.core.components import (
     CatalogComponent,
     HealthCheckComponent,
 )
+from arcade_serve.utils import LogPreview, LogSampler
 from arcade_tdk import tool
 
 
@@ -35,6 +37,12 @@ def error_tool(context: ToolContext) -> int:
     raise ValueError("Something went wrong")
 
 
+@tool()
+def echo_tool(context: ToolContext, text: Annotated[str, "text"]) -> Annotated[str, "output"]:
+    """Echo the input text."""
+    return text
+
+
 @pytest.fixture
 def mock_router():
     router = MagicMock(spec=Router)
@@ -155,6 +163,47 @@ async def test_call_tool_execution_error(base_worker_no_auth):
     assert response.output.error is not None
 
 
+@pytest.mark.asyncio
+async def test_call_tool_info_logs_are_sampled(base_worker_no_auth, caplog):
+    base_worker_no_auth.register_tool(sample_tool, toolkit_name="test_kit")
+    base_worker_no_auth.call_log_sampler = LogSampler(rate=0.5)
+    tool_request = ToolCallRequest(
+        tool=ToolReference(toolkit="TestKit", name="SampleTool"), inputs={"a": 1, "b": 2}
+    )
+
+    with caplog.at_level(logging.INFO, logger="arcade_serve.core.base"):
+        for _ in range(4):
+            await base_worker_no_auth.call_tool(tool_request)
+
+    calling = [r for r in caplog.records if "Calling tool" in r.getMessage()]
+    success = [r for r in caplog.records if "success" in r.getMessage()]
+    assert len(calling) == len(success) == 2
+
+
+@pytest.mark.asyncio
+async def test_call_tool_debug_logs_are_capped(base_worker_no_auth, caplog):
+    base_worker_no_auth.register_tool(echo_tool, toolkit_name="test_kit")
+    text = "x" * 100_000
+    tool_request = ToolCallRequest(
+        tool=ToolReference(toolkit="TestKit", name="EchoTool"), inputs={"text": text}
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="arcade_serve.core.base"):
+        response = await base_worker_no_auth.call_tool(tool_request)
+
+    assert response.output.value == text
+    output_logs = [r.getMessage() for r in caplog.records if "Tool output" in r.getMessage()]
+    assert len(output_logs) == 1
+    assert len(output_logs[0]) < 1000
+    assert "(100000 chars)" in output_logs[0]
+
+
+def test_log_preview_is_bounded():
+    assert str(LogPreview("short")) == "short"
+    assert str(LogPreview("y" * 50, max_chars=10)) == "yyyyyyyyyy... (50 chars)"
+    assert len(str(LogPreview({"items": list(range(1_000_000))}))) < 200
+
+
 @pytest.mark.asyncio
 async def test_call_tool_not_found(base_worker_no_auth):
     # Use ToolReference without version for lookup consistency